@@ -0,0 +1,79 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Single-pass brand / model recognizer
+# ------------------------------
+# One compiled pattern built from the brand-and-alias dictionary below, with
+# word boundaries and longest alias first, so "mini cooper" beats "mini" and
+# "mg" no longer matches inside other words. Hyphens count as spaces, as in
+# the notebook's filter_brand. Brand keys are the canonical lowercase names
+# used throughout Data/olx_cars_data.csv.
+
+BRAND_ALIASES = {
+    'maruti suzuki': ['maruti suzuki', 'maruti', 'suzuki'],
+    'hyundai': ['hyundai'],
+    'honda': ['honda'],
+    'toyota': ['toyota'],
+    'tata': ['tata', 'tata motors'],
+    'mahindra': ['mahindra', 'mahindra renault', 'mahindra ssangyong'],
+    'mercedes benz': ['mercedes benz', 'mercedes', 'benz'],
+    'ford': ['ford'],
+    'volkswagen': ['volkswagen', 'vw'],
+    'audi': ['audi'],
+    'nissan': ['nissan'],
+    'bmw': ['bmw'],
+    'kia': ['kia'],
+    'jeep': ['jeep'],
+    'mg': ['mg', 'mg motor', 'morris garages'],
+    'renault': ['renault'],
+    'skoda': ['skoda'],
+    'mini cooper': ['mini cooper', 'mini'],
+    'jaguar': ['jaguar'],
+    'land rover': ['land rover', 'range rover'],
+    'datsun': ['datsun'],
+    'chevrolet': ['chevrolet', 'chevy'],
+    'force motors': ['force motors', 'force'],
+    'mitsubishi': ['mitsubishi'],
+    'fiat': ['fiat'],
+    'isuzu': ['isuzu'],
+    'volvo': ['volvo'],
+    'porsche': ['porsche'],
+    'lexus': ['lexus'],
+    'citroen': ['citroen'],
+    'byd': ['byd'],
+}
+
+
+class BrandRecognizer:
+    def __init__(self, aliases=BRAND_ALIASES):
+        self.canonical = {alias: brand for brand, names in aliases.items() for alias in names}
+        ordered = sorted(self.canonical, key=len, reverse=True)
+        alternation = "|".join(re.escape(alias).replace(r"\ ", r"\s+") for alias in ordered)
+        self.pattern = re.compile(rf"\b({alternation})\b\s*(.*)$", re.IGNORECASE)
+
+    def normalize(self, titles):
+        return titles.str.replace('-', ' ', regex=False).str.replace(r'\s+', ' ', regex=True).str.strip()
+
+    def recognize(self, titles):
+        """DataFrame with Brand ('Unknown' if no alias matches) and Model for a column of titles."""
+        codes, uniques = pd.factorize(titles)
+        clean = self.normalize(pd.Series(uniques, dtype=object))
+        found = clean.str.extract(self.pattern)
+        alias = found[0].str.lower().str.replace(r'\s+', ' ', regex=True)
+        brand = alias.map(self.canonical).fillna('Unknown')
+        model = found[1].where(found[1].fillna('') != '', clean)
+
+        # Trailing sentinel: factorize codes missing titles as -1
+        brand = np.append(brand.to_numpy(dtype=object), 'Unknown')
+        model = np.append(model.to_numpy(dtype=object), None)
+        return pd.DataFrame({'Brand': brand[codes], 'Model': model[codes]}, index=titles.index)
+
+
+RECOGNIZER = BrandRecognizer()
+
+
+def recognize_brands(titles):
+    return RECOGNIZER.recognize(titles)
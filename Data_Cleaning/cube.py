@@ -0,0 +1,182 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from Data_Cleaning.store import DATA_DIR, meta_path
+
+# ------------------------------
+# Aggregate cube for the Insights Hub
+# ------------------------------
+# One row per (Brand, Model, Year) cell with the listing count, price sum,
+# min, max and a histogram over log-spaced price bins. Every field merges by
+# addition (or min/max), so newly appended listings are folded in without
+# touching the old rows; price quantiles are read off the merged histograms
+# (to within one bin, about 11%). Written next to the dataset at ingest.
+
+CUBE_PATH = os.path.join(DATA_DIR, "olx_cars_data.cube.feather")
+KEYS = ["Brand", "Model", "Year"]
+PRICE_EDGES = np.geomspace(1e4, 1e9, 105)  # ₹10k .. ₹100cr; outliers land in the end bins
+N_BINS = len(PRICE_EDGES) - 1
+BINS = [f"bin_{i:03d}" for i in range(N_BINS)]
+
+
+def price_bin(price):
+    return np.clip(np.searchsorted(PRICE_EDGES, price, side="right") - 1, 0, N_BINS - 1)
+
+
+def bin_centres():
+    return np.sqrt(PRICE_EDGES[:-1] * PRICE_EDGES[1:])
+
+
+def build_cube(df):
+    """Cube cells for the listings in df (rows missing Price/Year/Brand are
+    left out, as the pages do)."""
+    df = df.dropna(subset=["Price", "Year", "Brand"])
+    brand = df["Brand"].astype("category")
+    model = df["Model"].astype("category").cat.add_categories(["(unknown)"]).fillna("(unknown)")
+    year = df["Year"].to_numpy(dtype=np.int64)
+    price = df["Price"].to_numpy(dtype=np.float64)
+
+    # One integer per (brand, model, year) so the grouping is a plain factorize
+    brand_codes, model_codes = brand.cat.codes.to_numpy(np.int64), model.cat.codes.to_numpy(np.int64)
+    span = year.max() - year.min() + 1 if len(year) else 1
+    combined = (brand_codes * len(model.cat.categories) + model_codes) * span + (year - (year.min() if len(year) else 0))
+    codes, uniques = pd.factorize(combined)
+    n_cells = len(uniques)
+    first = np.zeros(n_cells, dtype=np.int64)
+    first[codes[::-1]] = np.arange(len(codes))[::-1]
+    count = np.bincount(codes, minlength=n_cells)
+    hist = np.bincount(codes * N_BINS + price_bin(price), minlength=n_cells * N_BINS).reshape(n_cells, N_BINS)
+    extremes = pd.DataFrame({"code": codes, "price": price}).groupby("code")["price"].agg(["min", "max"])
+
+    cube = pd.DataFrame({
+        "Brand": brand.iloc[first].reset_index(drop=True).cat.remove_unused_categories(),
+        "Model": model.iloc[first].reset_index(drop=True).cat.remove_unused_categories(),
+        "Year": year[first].astype(np.int16),
+    })
+    cube["count"] = count
+    cube["price_sum"] = np.bincount(codes, weights=price, minlength=n_cells)
+    cube["price_min"] = extremes["min"].to_numpy()
+    cube["price_max"] = extremes["max"].to_numpy()
+    return pd.concat([cube, pd.DataFrame(hist.astype(np.int32), columns=BINS)], axis=1)
+
+
+def merge_cubes(*cubes):
+    cubes = [cube for cube in cubes if len(cube)]
+    if len(cubes) == 1:
+        return cubes[0]
+    stacked = pd.concat([cube.astype({"Brand": object, "Model": object}) for cube in cubes], ignore_index=True)
+    # Sums/extremes on the numpy blocks; a per-column groupby over ~100
+    # histogram columns fragments the frame
+    codes = stacked.groupby(KEYS, sort=False).ngroup().to_numpy()
+    n_cells = codes.max() + 1
+    first = np.zeros(n_cells, dtype=np.int64)
+    first[codes[::-1]] = np.arange(len(codes))[::-1]
+    price_min = np.full(n_cells, np.inf)
+    price_max = np.full(n_cells, -np.inf)
+    np.minimum.at(price_min, codes, stacked["price_min"].to_numpy(dtype=np.float64))
+    np.maximum.at(price_max, codes, stacked["price_max"].to_numpy(dtype=np.float64))
+    hist = np.zeros((n_cells, N_BINS), dtype=np.int64)
+    np.add.at(hist, codes, stacked[BINS].to_numpy(dtype=np.int64))
+    merged = stacked[KEYS].iloc[first].reset_index(drop=True).astype({"Brand": "category", "Model": "category"})
+    merged["count"] = np.bincount(codes, weights=stacked["count"].to_numpy(), minlength=n_cells).astype(np.int64)
+    merged["price_sum"] = np.bincount(codes, weights=stacked["price_sum"].to_numpy(), minlength=n_cells)
+    merged["price_min"] = price_min
+    merged["price_max"] = price_max
+    return pd.concat([merged, pd.DataFrame(hist.astype(np.int32), columns=BINS)], axis=1)
+
+
+def write_cube(cube, path=CUBE_PATH, dataset_version=None):
+    tmp = path + ".tmp"
+    feather.write_feather(pa.Table.from_pandas(cube, preserve_index=False), tmp, compression="uncompressed")
+    os.replace(tmp, path)
+    meta = {"dataset_version": dataset_version, "rows": int(cube["count"].sum()), "cells": len(cube)}
+    with open(meta_path(path), "w") as f:
+        json.dump(meta, f, indent=1)
+    return meta
+
+
+def read_cube(path=CUBE_PATH):
+    """(cube, meta) as written by write_cube."""
+    with open(meta_path(path)) as f:
+        meta = json.load(f)
+    return feather.read_table(path).to_pandas(), meta
+
+
+def update_cube(new_rows, path=CUBE_PATH, dataset_version=None):
+    """Fold appended listings into the cube on disk."""
+    cube, _ = read_cube(path)
+    return write_cube(merge_cubes(cube, build_cube(new_rows)), path, dataset_version)
+
+
+# ------------------------------
+# Queries (one per Insights chart)
+# ------------------------------
+
+def display_brand(cube):
+    return cube["Brand"].astype(str).str.strip().str.title()
+
+
+def by_brand(cube):
+    """Count, mean price and histogram per display brand, by count descending."""
+    grouped = cube.assign(**{"Brand Name": display_brand(cube)}).groupby("Brand Name")
+    totals = grouped[["count", "price_sum"]].sum()
+    summary = pd.concat([
+        totals,
+        (totals["price_sum"] / totals["count"]).rename("mean_price"),
+        grouped["price_min"].min(),
+        grouped["price_max"].max(),
+        grouped[BINS].sum(),
+    ], axis=1)
+    return summary.sort_values("count", ascending=False, kind="stable")
+
+
+def quantiles(summary, qs):
+    """Price quantiles per row of a summary with histogram columns, read off
+    the histogram with geometric interpolation inside the bin."""
+    hist = summary[BINS].to_numpy(dtype=np.float64)
+    cum = np.cumsum(hist, axis=1)
+    total = cum[:, -1:]
+    out = {}
+    for q in qs:
+        target = q * total
+        idx = np.minimum((cum < target).sum(axis=1), N_BINS - 1)
+        before = np.take_along_axis(cum, idx[:, None], axis=1)[:, 0] - hist[np.arange(len(hist)), idx]
+        within = np.clip((target[:, 0] - before) / np.maximum(hist[np.arange(len(hist)), idx], 1), 0, 1)
+        value = PRICE_EDGES[idx] * (PRICE_EDGES[idx + 1] / PRICE_EDGES[idx]) ** within
+        out[q] = np.clip(value, summary["price_min"].to_numpy(), summary["price_max"].to_numpy())
+    return pd.DataFrame(out, index=summary.index)
+
+
+def top_models(cube, n=2):
+    """The n most listed models of every brand (ties keep cube order)."""
+    counts = cube.assign(Brand=display_brand(cube), Model=cube["Model"].astype(str))
+    counts = counts.groupby(["Brand", "Model"], sort=False)["count"].sum().reset_index(name="Count")
+    counts = counts.sort_values(["Brand", "Count"], ascending=[True, False], kind="stable")
+    top = counts.groupby("Brand", sort=False).head(n).reset_index(drop=True)
+    top.insert(1, "Title", top["Brand"] + " " + top["Model"])
+    return top.drop(columns="Model")
+
+
+def by_year(cube):
+    return cube.groupby("Year")["count"].sum().sort_index()
+
+
+def by_year_price(cube):
+    """Listing counts per Year (rows) and price bin (BINS columns)."""
+    return cube.groupby("Year")[BINS].sum().sort_index()
+
+
+def by_brand_year(cube):
+    """Count, min/max and histogram per (display brand, Year)."""
+    grouped = cube.assign(**{"Brand Name": display_brand(cube)}).groupby(["Brand Name", "Year"])
+    return pd.concat([
+        grouped["count"].sum(),
+        grouped["price_min"].min(),
+        grouped["price_max"].max(),
+        grouped[BINS].sum(),
+    ], axis=1)
@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from Data_Cleaning.store import DATA_DIR
+
+# ------------------------------
+# Cross-scrape deduplication of cleaned listings
+# ------------------------------
+# Two layers, each a hash pass plus at most one sort, so the cost grows
+# linearly with the rows:
+#   1. listing id: the OLX iid from the link (the link itself when it has
+#      none, a key of the row's own when the link is missing); later copies
+#      of an id go.
+#   2. near duplicates: reposts under a new id. Rows are only compared
+#      within their (Brand, Year) block, and there within the same title and
+#      location. Sorted by price, each row is checked against the next
+#      WINDOW rows; pairs whose price and distance are within PRICE_TOL /
+#      DISTANCE_TOL of each other are linked, and linked rows form a cluster.
+# The first row of a cluster is kept; every merged row is reported with the
+# link of the row it was merged into.
+
+DUPLICATES_PATH = os.path.join(DATA_DIR, "olx_cars_data.duplicates.csv")
+BLOCK = ["Brand", "Year"]
+PRICE_TOL = 0.01
+DISTANCE_TOL = 0.01
+WINDOW = 4
+REPORT_COLUMNS = ["Reason", "Kept", "Link", "Brand", "Year", "Title", "Location", "Price", "Distance Covered"]
+
+
+def listing_keys(links):
+    # A card without a link gets a key of its own, so it is never merged by id
+    links = links.astype("string")
+    own = pd.Series(np.arange(len(links)), index=links.index).astype(str)
+    return links.str.extract(r"iid-(\d+)", expand=False).fillna(links).fillna("row-" + own)
+
+
+def _text_key(col):
+    # Titles and locations repeat a lot: normalise each distinct value once
+    codes, uniques = pd.factorize(col)
+    keys = pd.Series(uniques, dtype="string").str.lower().str.split().str.join(" ")
+    return np.where(codes < 0, -1, pd.factorize(keys)[0][codes])
+
+
+def near_groups(df):
+    """Group code per row: same (Brand, Year) block, title and location."""
+    return df.groupby(
+        [df[col].to_numpy() for col in BLOCK] + [_text_key(df["Title"]), _text_key(df["Location"])],
+        sort=False, dropna=False,
+    ).ngroup().to_numpy()
+
+
+def _close(a, b, tol):
+    return np.abs(a - b) <= tol * np.maximum(np.abs(a), np.abs(b))
+
+
+def _exact_keepers(df):
+    keys = listing_keys(df["Link"])
+    return pd.Series(np.arange(len(df))).groupby(keys.to_numpy(), sort=False).transform("min").to_numpy()
+
+
+def _near_keepers(df, price_tol, distance_tol, window=WINDOW):
+    codes = near_groups(df)
+    price = df["Price"].to_numpy(dtype=np.float64)
+    distance = df["Distance Covered"].to_numpy(dtype=np.float64)
+    order = np.lexsort((distance, price, codes))
+    left, right = [], []
+    for step in range(1, window + 1):
+        a, b = order[:-step], order[step:]
+        linked = (codes[a] == codes[b]) & _close(price[a], price[b], price_tol) & _close(distance[a], distance[b], distance_tol)
+        left.append(a[linked])
+        right.append(b[linked])
+    left, right = np.concatenate(left), np.concatenate(right)
+    graph = coo_matrix((np.ones(len(left), dtype=np.int8), (left, right)), shape=(len(df), len(df)))
+    _, cluster = connected_components(graph, directed=False)
+    return pd.Series(np.arange(len(df))).groupby(cluster).transform("min").to_numpy()
+
+
+def find_duplicates(df, price_tol=PRICE_TOL, distance_tol=DISTANCE_TOL):
+    """Per row, the position of the row it is kept as (itself for rows that
+    stay) and the reason it was merged ("" when it stays)."""
+    exact = _exact_keepers(df)
+    survivors = np.flatnonzero(exact == np.arange(len(df)))
+    near = np.arange(len(df))
+    near[survivors] = survivors[_near_keepers(df.iloc[survivors], price_tol, distance_tol)]
+    keeper = near[exact]
+    reason = np.where(exact != np.arange(len(df)), "listing id", np.where(keeper != np.arange(len(df)), "near duplicate", ""))
+    return keeper, reason
+
+
+def _report(df, keeper, reason, merged):
+    rows = df.iloc[merged]
+    report = pd.concat([
+        pd.DataFrame({"Reason": reason[merged], "Kept": df["Link"].to_numpy()[keeper[merged]]}, index=rows.index),
+        rows[REPORT_COLUMNS[2:]],
+    ], axis=1)
+    return report.reset_index(drop=True)
+
+
+def dedup(df, price_tol=PRICE_TOL, distance_tol=DISTANCE_TOL):
+    """(df without duplicates, report of the merged rows)."""
+    keeper, reason = find_duplicates(df, price_tol, distance_tol)
+    merged = np.flatnonzero(keeper != np.arange(len(df)))
+    return df.iloc[np.flatnonzero(keeper == np.arange(len(df)))], _report(df, keeper, reason, merged)
+
+
+def dedup_new(existing, new, price_tol=PRICE_TOL, distance_tol=DISTANCE_TOL):
+    """(new rows that aren't duplicates of each other or of existing, report).
+    Existing rows are never dropped; only those sharing a listing id or a
+    near-duplicate group with the new rows are compared."""
+    columns = ["Link", "Title", "Location", "Price", "Distance Covered"] + BLOCK
+    groups = near_groups(pd.concat([existing[columns], new[columns]], ignore_index=True))
+    touched = (
+        listing_keys(existing["Link"]).isin(listing_keys(new["Link"])).to_numpy(dtype=bool)
+        | np.isin(groups[:len(existing)], groups[len(existing):])
+    )
+    candidates = pd.concat([existing[touched], new], ignore_index=True)
+    keeper, reason = find_duplicates(candidates, price_tol, distance_tol)
+    offset = int(touched.sum())
+    merged = offset + np.flatnonzero(keeper[offset:] != np.arange(offset, len(candidates)))
+    kept = np.flatnonzero(keeper[offset:] == np.arange(offset, len(candidates)))
+    return new.iloc[kept], _report(candidates, keeper, reason, merged)
+
+
+def summary(report):
+    reasons = report["Reason"].value_counts()
+    return (
+        f"merged {len(report)} rows into {report['Kept'].nunique()} clusters "
+        f"({reasons.get('listing id', 0)} by listing id, {reasons.get('near duplicate', 0)} near duplicates)"
+    )
+
+
+def write_report(report, path=DUPLICATES_PATH):
+    """Rows merged by the last run; each run replaces the previous report."""
+    report.to_csv(path, index=False)
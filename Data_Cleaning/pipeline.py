@@ -0,0 +1,177 @@
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from Data_Cleaning.brands import recognize_brands
+from Data_Cleaning.cube import CUBE_PATH, build_cube, update_cube, write_cube
+from Data_Cleaning.dedup import DUPLICATES_PATH, dedup, dedup_new, summary, write_report
+from Data_Cleaning.raw_store import RAW_STORE, committed_parts, mark_processed, new_parts, read_parts
+from Data_Cleaning.store import DATASET_PATH, load_dataset, write_dataset
+
+# ------------------------------
+# Vectorized version of data_preprocessing.ipynb
+# ------------------------------
+# Same steps as the notebook, but every row-wise .apply is replaced by pandas
+# string/regex ops over the whole column. Brands come from the alias
+# recognizer in brands.py, which also adds a Model column. Listings seen in
+# more than one scrape, or reposted, are merged by Data_Cleaning.dedup.
+#   python -m Data_Cleaning.pipeline      (from the repo root)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "Data")
+RAW_FILES = [
+    os.path.join(DATA_DIR, "olx_car_listings_expanded.csv"),
+    os.path.join(DATA_DIR, "olx_car_listings_expanded1.csv"),
+]
+CLEAN_CSV = os.path.join(DATA_DIR, "olx_cars_data.csv")
+
+companies = ['maruti suzuki', 'hyundai', 'honda', 'toyota', 'tata', 'mahindra', 'mercedes benz','ford','volkswagen','audi','nissan' ,'bmw', 'kia','jeep','mg','renault','skoda','mini cooper','jaguar','land rover','datsun','chevrolet']
+
+date_pattern = r"(Today|Yesterday|\d{1,2} days ago|\d{1,2} [A-Za-z]{3})$"
+
+REQUIRED = ['Title', 'Price', 'Information']
+COLUMNS = ['Title', 'Link', 'Location', 'Price', 'Image', 'Brand', 'Year', 'Distance Covered', 'Model']
+
+
+def load_raw(paths=RAW_FILES):
+    return pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
+
+
+# ------------------------------
+# Steps
+# ------------------------------
+def split_information(info):
+    # "2019 - 150,000 km" -> Year, Distance Covered (first and second " - " parts)
+    year = info.str.replace(r' - .*$', '', regex=True).astype(int)
+    distance = (
+        info.str.replace(r'^.*? - ', '', regex=True)
+        .str.replace(r' - .*$', '', regex=True)
+        .str.replace('km', '', regex=False)
+        .str.strip()
+        .str.replace(',', '', regex=False)
+        .astype(float)
+    )
+    return year, distance
+
+
+def legacy_brand_from_title(titles):
+    # The notebook's rule: first entry of `companies` contained in the title wins.
+    # Titles are "Make Model" strings with few distinct values, so match each
+    # distinct title once and broadcast back through the factorize codes.
+    codes, uniques = pd.factorize(titles)
+    lowered = pd.Series(uniques).str.replace('-', ' ', regex=False).str.lower()
+    matches = [lowered.str.contains(com, regex=False).to_numpy(dtype=bool, na_value=False) for com in companies]
+    brands = np.select(matches, companies, 'Unknown') if len(uniques) else np.array([], dtype=object)
+    return pd.Series(brands[codes], index=titles.index)
+
+
+def parse_price(price):
+    return price.str.replace('₹ ', '', regex=False).str.replace(',', '', regex=False).astype(int)
+
+
+def split_location(location):
+    # "New Hubli3 days ago" -> "New Hubli"
+    return location.str.replace(date_pattern, "", regex=True).str.strip()
+
+
+def posted_text(location):
+    return location.str.extract(date_pattern, expand=False)
+
+
+def parse_posted_date(date_posted, today=None):
+    today = pd.Timestamp(today or datetime.today())
+    days_ago = date_posted.str.extract(r"^(\d+) days ago$", expand=False).astype(float)
+    absolute = pd.to_datetime(date_posted.where(days_ago.isna()), format="%d %b", errors="coerce")
+    offsets = pd.Series(np.nan, index=date_posted.index)
+    offsets = offsets.mask(date_posted == "Today", 0).mask(date_posted == "Yesterday", 1)
+    offsets = offsets.fillna(days_ago)
+    relative = today - pd.to_timedelta(offsets, unit="D")
+    return relative.fillna(absolute)
+
+
+# ------------------------------
+# Pipeline
+# ------------------------------
+def clean(df, keep_date=False, legacy_brands=False):
+    # Cards the tolerant parser could not fully read carry NaN fields
+    df = df.dropna(subset=REQUIRED).copy()
+    df['Year'], df['Distance Covered'] = split_information(df['Information'])
+
+    # Brand/model from the title via the alias recognizer (legacy_brands=True
+    # reproduces the notebook's substring loop); the scraped brand is the fallback.
+    recognized = recognize_brands(df['Title'])
+    df['Model'] = recognized['Model']
+    brand_title = legacy_brand_from_title(df['Title']) if legacy_brands else recognized['Brand']
+    df['Brand'] = brand_title.where(brand_title != 'Unknown', df['Brand'])
+    df['Price'] = parse_price(df['Price'])
+
+    columns = list(COLUMNS)
+    if keep_date:
+        df['Date_Posted'] = parse_posted_date(posted_text(df['Location']))
+        columns.append('Date_Posted')
+    df['Location'] = split_location(df['Location'])
+    return df[columns]
+
+
+def run(raw_paths=RAW_FILES, out_path=CLEAN_CSV, dataset_path=DATASET_PATH, cube_path=CUBE_PATH, store=RAW_STORE,
+        duplicates_path=DUPLICATES_PATH):
+    """Clean the raw scrape files and every committed partition of the raw
+    listing store, drop duplicate listings, and write the dataset the
+    Streamlit pages read."""
+    parts = committed_parts(store)
+    raw = load_raw(raw_paths)
+    if parts:
+        raw = pd.concat([raw, read_parts(parts, store)], ignore_index=True)
+    df, merged = dedup(clean(raw))
+    write_report(merged, duplicates_path)
+    print(summary(merged))
+    df.to_csv(out_path)
+    meta = write_dataset(df, dataset_path, source=[os.path.basename(path) for path in raw_paths])
+    write_cube(build_cube(df), cube_path, dataset_version=meta["version"])
+    mark_processed(parts, store, replace=True)
+    return df
+
+
+def _append_clean(new, source, out_path, dataset_path, cube_path, duplicates_path):
+    # Rows already in the dataset (same listing id or a repost) are dropped
+    existing = load_dataset(path=dataset_path)
+    new, merged = dedup_new(existing, new)
+    write_report(merged, duplicates_path)
+    print(summary(merged))
+    new.to_csv(out_path, mode="a", header=False)
+    df = pd.concat([existing, new], ignore_index=True)
+    meta = write_dataset(df, dataset_path, source=source)
+    update_cube(new, cube_path, dataset_version=meta["version"])
+    return new
+
+
+def append(raw_paths, out_path=CLEAN_CSV, dataset_path=DATASET_PATH, cube_path=CUBE_PATH,
+           duplicates_path=DUPLICATES_PATH):
+    """Clean newly scraped files and append the listings not yet in the
+    dataset; the Insights cube folds in just those rows."""
+    new = clean(load_raw(raw_paths))
+    return _append_clean(
+        new, [os.path.basename(path) for path in raw_paths], out_path, dataset_path, cube_path, duplicates_path
+    )
+
+
+def ingest(store=RAW_STORE, out_path=CLEAN_CSV, dataset_path=DATASET_PATH, cube_path=CUBE_PATH,
+           duplicates_path=DUPLICATES_PATH):
+    """Clean only the raw store partitions committed since the last run or
+    ingest, and append their listings not yet in the dataset."""
+    parts = new_parts(store)
+    if not parts:
+        return pd.DataFrame(columns=COLUMNS)
+    new = clean(read_parts(parts, store))
+    new = _append_clean(
+        new, [f"{os.path.basename(store)}: {len(parts)} parts"], out_path, dataset_path, cube_path, duplicates_path
+    )
+    mark_processed(parts, store)
+    return new
+
+
+if __name__ == "__main__":
+    cleaned = run()
+    print(f"Wrote {len(cleaned)} rows to {CLEAN_CSV}")
@@ -0,0 +1,155 @@
+import json
+import os
+import re
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from glob import glob
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from Data_Cleaning.store import DATA_DIR
+
+# ------------------------------
+# Append-only store of raw scraped listings
+# ------------------------------
+# The scrapers stream parsed rows into Data/raw_listings/ instead of holding
+# a whole crawl in memory:
+#   date=2025-06-01/brand=maruti-suzuki/part-<run>-00000.feather
+#   date=2025-06-01/brand=maruti-suzuki/_manifest-<time>-<run>-00000.json
+# Rows are buffered per brand and written BATCH_ROWS at a time. A part file
+# is only visible once commit() has listed it in a manifest entry of its
+# partition. Each commit creates an entry file of its own (written to a
+# temporary name, then renamed) and readers merge them in commit order, so
+# scrapers committing the same partition at once never overwrite each
+# other, readers never see half a crawl, and parts left behind by a run that
+# died are ignored. A partition's single _manifest.json from older stores is
+# read first. Consumers keep their own
+# ledger of the parts they have processed (see Data_Cleaning.pipeline).
+
+RAW_STORE = os.path.join(DATA_DIR, "raw_listings")
+LEDGER = "_ingested.json"  # the cleaning pipeline's processed parts, in the store root
+BATCH_ROWS = 5000
+RAW_COLUMNS = ['Title', 'Link', 'Location', 'Price', 'Information', 'Image', 'Brand']
+SCHEMA = pa.schema([(col, pa.string()) for col in RAW_COLUMNS])
+MANIFEST = "_manifest.json"  # one per partition, in stores written before manifest entries
+
+
+def partition_dir(root, scrape_date, brand):
+    slug = re.sub(r"[^a-z0-9]+", "-", str(brand).lower()).strip("-") or "unknown"
+    return os.path.join(root, f"date={scrape_date}", f"brand={slug}")
+
+
+def _write_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+
+
+def _read_json(path, default):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+class ListingSink:
+    """Streams parsed listing rows into the raw store. Memory is bounded by
+    batch_rows per brand being written, whatever the size of the crawl."""
+
+    def __init__(self, root=RAW_STORE, batch_rows=BATCH_ROWS, scrape_date=None):
+        self.root = root
+        self.batch_rows = batch_rows
+        self.scrape_date = scrape_date or date.today().isoformat()
+        self.run_id = uuid.uuid4().hex[:8]
+        self.buffers = defaultdict(list)
+        self.written = defaultdict(list)  # brand -> part files not yet committed
+        self.stats = {"rows": 0, "parts": 0, "committed_rows": 0, "partitions": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # A crawl that fails leaves its uncommitted parts invisible
+        if exc_type is None:
+            self.close()
+
+    def write(self, brand, rows):
+        buffer = self.buffers[brand]
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= self.batch_rows:
+                self._flush(brand)
+                buffer = self.buffers[brand]
+
+    def _flush(self, brand):
+        rows = self.buffers.pop(brand, None)
+        if not rows:
+            return
+        directory = partition_dir(self.root, self.scrape_date, brand)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{self.run_id}-{self.stats['parts']:05d}.feather")
+        tmp = path + ".tmp"
+        feather.write_feather(pa.Table.from_pylist(rows, schema=SCHEMA), tmp)
+        os.replace(tmp, path)
+        self.written[brand].append({"file": os.path.basename(path), "rows": len(rows)})
+        self.stats["rows"] += len(rows)
+        self.stats["parts"] += 1
+
+    def commit(self, brand):
+        """Make everything written for brand visible to readers."""
+        self._flush(brand)
+        parts = self.written.pop(brand, [])
+        if not parts:
+            return
+        name = f"_manifest-{time.time_ns():020d}-{self.run_id}-{self.stats['partitions']:05d}.json"
+        committed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        _write_json(os.path.join(partition_dir(self.root, self.scrape_date, brand), name), {
+            "brand": brand, "date": self.scrape_date,
+            "parts": [dict(part, committed_at=committed_at) for part in parts],
+        })
+        self.stats["committed_rows"] += sum(part["rows"] for part in parts)
+        self.stats["partitions"] += 1
+
+    def close(self):
+        for brand in list(self.buffers) + list(self.written):
+            self.commit(brand)
+
+
+def committed_parts(root=RAW_STORE):
+    """Paths (relative to root) of every committed part, oldest date first."""
+    parts = []
+    for directory in sorted(glob(os.path.join(root, "date=*", "brand=*"))):
+        # The old single manifest first, then the entries by commit time
+        manifests = sorted(glob(os.path.join(directory, "_manifest*.json")),
+                           key=lambda path: (os.path.basename(path) != MANIFEST, path))
+        relative = os.path.relpath(directory, root)
+        for path in manifests:
+            parts += [os.path.join(relative, part["file"]) for part in _read_json(path, {"parts": []})["parts"]]
+    return parts
+
+
+def read_parts(parts, root=RAW_STORE):
+    if not parts:
+        return pd.DataFrame(columns=RAW_COLUMNS)
+    tables = [feather.read_table(os.path.join(root, part)) for part in parts]
+    return pa.concat_tables(tables).to_pandas()
+
+
+def new_parts(root=RAW_STORE, ledger=LEDGER):
+    """Committed parts not yet recorded in the ledger."""
+    done = set(_read_json(os.path.join(root, ledger), []))
+    return [part for part in committed_parts(root) if part not in done]
+
+
+def mark_processed(parts, root=RAW_STORE, ledger=LEDGER, replace=False):
+    path = os.path.join(root, ledger)
+    done = [] if replace else _read_json(path, [])
+    seen = set(done)
+    os.makedirs(root, exist_ok=True)
+    _write_json(path, done + [part for part in parts if part not in seen])
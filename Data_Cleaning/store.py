@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from Data_Cleaning.summary import summarise, summary_path, write_summary
+
+# ------------------------------
+# Typed columnar dataset store
+# ------------------------------
+# The cleaning step writes Data/olx_cars_data.feather (uncompressed Arrow IPC,
+# so readers can memory-map it) next to a small metadata sidecar. Pages read
+# only the columns they need instead of re-parsing the CSV as text. The
+# landing page's headline numbers go to a second sidecar (Data_Cleaning.summary).
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "Data")
+DATASET_PATH = os.path.join(DATA_DIR, "olx_cars_data.feather")
+CSV_PATH = os.path.join(DATA_DIR, "olx_cars_data.csv")
+
+CATEGORICAL = ['Title', 'Brand', 'Location', 'Model']
+DTYPES = {'Year': 'int16', 'Price': 'int32', 'Distance Covered': 'float32'}
+ARROW_STRINGS = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+
+
+def meta_path(path):
+    return os.path.splitext(path)[0] + ".meta.json"
+
+
+def typed(df):
+    """Compact dtypes: categorical text columns, small ints, float32 distance."""
+    df = df.drop(columns=[c for c in df.columns if str(c).startswith('Unnamed')])
+    for col in CATEGORICAL:
+        if col in df:
+            df[col] = df[col].astype('category')
+    for col, dtype in DTYPES.items():
+        if col in df:
+            df[col] = df[col].astype(dtype)
+    for col in ('Link', 'Image'):
+        if col in df:
+            df[col] = df[col].astype('string')
+    return df.reset_index(drop=True)
+
+
+def write_dataset(df, path=DATASET_PATH, source=None):
+    df = typed(df)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp = path + ".tmp"
+    feather.write_feather(table, tmp, compression='uncompressed')
+    with open(tmp, "rb") as f:
+        version = hashlib.sha256(f.read()).hexdigest()[:16]
+    os.replace(tmp, path)
+
+    meta = {
+        'version': version,
+        'rows': len(df),
+        'columns': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'written_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'source': source,
+    }
+    with open(meta_path(path), "w") as f:
+        json.dump(meta, f, indent=1)
+    write_summary(summarise(df, version), summary_path(path))
+    return meta
+
+
+def read_meta(path=DATASET_PATH):
+    with open(meta_path(path)) as f:
+        return json.load(f)
+
+
+def refresh_summary(path=DATASET_PATH):
+    """Rewrite the summary sidecar from the dataset on disk and return it."""
+    df = load_dataset(columns=['Brand', 'Price'], path=path)
+    summary = summarise(df, read_meta(path)['version'])
+    write_summary(summary, summary_path(path))
+    return summary
+
+
+def load_dataset(columns=None, path=DATASET_PATH):
+    """Memory-mapped load of just `columns` (all when None) as a typed DataFrame."""
+    if not os.path.exists(path):
+        # First run on a checkout without the columnar file: build it from the CSV
+        write_dataset(pd.read_csv(CSV_PATH), path, source=os.path.basename(CSV_PATH))
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    # Keep Link/Image as Arrow-backed strings over the mapped buffers rather
+    # than materialising a Python str object per row
+    return table.to_pandas(types_mapper=ARROW_STRINGS.get)
@@ -0,0 +1,47 @@
+import json
+import os
+
+# ------------------------------
+# Dataset summary sidecar for the landing page
+# ------------------------------
+# write_dataset() saves the headline numbers (rows, brands, price range and
+# data version) next to the dataset as <name>.summary.json. Your Garage reads
+# only this file, so a cold start of the landing page never imports pandas or
+# maps the dataset; this module sticks to the standard library for that.
+
+SUFFIX = ".summary.json"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "Data")
+SUMMARY_PATH = os.path.join(DATA_DIR, "olx_cars_data" + SUFFIX)
+
+
+def summary_path(dataset_path):
+    return os.path.splitext(dataset_path)[0] + SUFFIX
+
+
+def summarise(df, version):
+    price = df["Price"].dropna()
+    return {
+        "version": version,
+        "rows": len(df),
+        "brands": int(df["Brand"].nunique()),
+        "price_min": int(price.min()) if len(price) else None,
+        "price_max": int(price.max()) if len(price) else None,
+    }
+
+
+def write_summary(summary, path=SUMMARY_PATH):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(summary, f, indent=1)
+    os.replace(tmp, path)
+
+
+def read_summary(path=SUMMARY_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        # Dataset written before summaries were: build it once from the columns
+        from Data_Cleaning.store import refresh_summary
+        return refresh_summary(path[:-len(SUFFIX)] + ".feather")
@@ -0,0 +1,292 @@
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from Data_Cleaning.store import DATA_DIR, ROOT, load_dataset
+
+# ------------------------------
+# Local thumbnail cache for listing images
+# ------------------------------
+# Thumbnails are downloaded once (a thread pool, run after a scrape) and
+# stored content-addressed under static/thumbs/, which Streamlit serves as
+# app/static/thumbs/<file>. A SQLite index keeps each listing's status
+# (pending, cached, missing once OLX returns 404/410, failed, evicted) and
+# the stored files with their last access, so the least recently shown ones
+# are evicted when the directory grows past max_bytes.
+#   python -m Data_Cleaning.thumbnails      (prefetch for the whole dataset)
+
+THUMBS_DIR = os.path.join(ROOT, "static", "thumbs")
+INDEX_PATH = os.path.join(DATA_DIR, "thumbnails.sqlite")
+MAX_BYTES = 256 * 1024 * 1024
+WORKERS = 8
+TIMEOUT = 10
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+GONE = {404, 410}
+IID_PATTERN = re.compile(r"iid-(\d+)")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    listing_id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    digest TEXT,
+    updated REAL NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS listings_digest ON listings (digest);
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    file TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_accessed ON blobs (accessed);
+"""
+
+
+def listing_key(link, url):
+    """The OLX listing id from the link, else a hash of the image URL."""
+    match = IID_PATTERN.search(str(link))
+    return match.group(1) if match else "url-" + hashlib.sha256(str(url).encode()).hexdigest()[:16]
+
+
+def image_type(content):
+    if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        return "webp"
+    if content[:3] == b"\xff\xd8\xff":
+        return "jpg"
+    if content[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if content[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    return None
+
+
+class ThumbnailCache:
+    def __init__(self, path=INDEX_PATH, directory=THUMBS_DIR, max_bytes=MAX_BYTES):
+        self.path = path
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # One connection per thread: prefetch workers and Streamlit sessions
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _rows(self, listing_ids):
+        ids = [str(i) for i in listing_ids]
+        placeholders = ",".join("?" * len(ids))
+        return self._connect().execute(
+            "SELECT l.listing_id, l.status, b.file FROM listings l LEFT JOIN blobs b ON b.digest = l.digest "
+            f"WHERE l.listing_id IN ({placeholders})", ids,
+        ).fetchall() if ids else []
+
+    def status(self, listing_ids):
+        """{listing_id: status}; listings never registered are "pending"."""
+        found = {listing_id: status for listing_id, status, _ in self._rows(listing_ids)}
+        return {str(i): found.get(str(i), "pending") for i in listing_ids}
+
+    def lookup(self, listing_ids):
+        """({listing_id: stored file name} for the cached ones, statuses).
+        Counts hits/misses and marks the files as just used."""
+        rows = self._rows(listing_ids)
+        files = {listing_id: file for listing_id, status, file in rows if status == "cached" and file}
+        statuses = {str(i): "pending" for i in listing_ids}
+        statuses.update({listing_id: status for listing_id, status, _ in rows})
+        wanted = sum(status != "missing" for status in statuses.values())
+        with self._lock:
+            self.hits += len(files)
+            self.misses += wanted - len(files)
+        if files:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "UPDATE blobs SET accessed = ? WHERE file = ?", [(time.time(), f) for f in set(files.values())]
+                )
+        return files, statuses
+
+    def wanted(self, pairs):
+        """The (listing_id, url) pairs that still need downloading: anything
+        not cached or known missing at that URL, each listing once."""
+        pairs = list({str(listing_id): url for listing_id, url in pairs if url}.items())
+        known = {}
+        conn = self._connect()
+        for start in range(0, len(pairs), 500):
+            chunk = [listing_id for listing_id, _ in pairs[start:start + 500]]
+            known.update((row[0], row[1:]) for row in conn.execute(
+                f"SELECT listing_id, url, status FROM listings WHERE listing_id IN ({','.join('?' * len(chunk))})", chunk,
+            ))
+        return [
+            (listing_id, url) for listing_id, url in pairs
+            if known.get(listing_id) not in ((url, "cached"), (url, "missing"))
+        ]
+
+    def mark(self, listing_id, url, status, error=None):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO listings (listing_id, url, status, digest, updated, error) "
+                "VALUES (?, ?, ?, NULL, ?, ?)",
+                (str(listing_id), url, status, time.time(), error),
+            )
+
+    def store(self, listing_id, url, content):
+        """Save image bytes for a listing; returns the stored file name."""
+        kind = image_type(content)
+        if kind is None:
+            self.mark(listing_id, url, "failed", "not an image")
+            return None
+        digest = hashlib.sha256(content).hexdigest()[:32]
+        name = f"{digest}.{kind}"
+        path = os.path.join(self.directory, name)
+        if not os.path.exists(path):
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO blobs (digest, file, size, accessed) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET accessed = excluded.accessed",
+                (digest, name, len(content), now),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO listings (listing_id, url, status, digest, updated, error) "
+                "VALUES (?, ?, 'cached', ?, ?, NULL)",
+                (str(listing_id), url, digest, now),
+            )
+        self.evict()
+        return name
+
+    def evict(self):
+        """Drop least recently used files until the total is within max_bytes."""
+        conn = self._connect()
+        with self._lock, conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for digest, name, size in conn.execute("SELECT digest, file, size FROM blobs ORDER BY accessed"):
+                if total <= self.max_bytes:
+                    break
+                victims.append((digest, name))
+                total -= size
+            conn.executemany("DELETE FROM blobs WHERE digest = ?", [(digest,) for digest, _ in victims])
+            conn.executemany(
+                "UPDATE listings SET status = 'evicted', digest = NULL WHERE digest = ?",
+                [(digest,) for digest, _ in victims],
+            )
+            self.evictions += len(victims)
+        for _, name in victims:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def counts(self):
+        return dict(self._connect().execute("SELECT status, COUNT(*) FROM listings GROUP BY status").fetchall())
+
+    def size(self):
+        return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "bytes": self.size(),
+            "listings": self.counts(),
+        }
+
+
+# ------------------------------
+# Prefetch
+# ------------------------------
+_session = threading.local()
+
+
+def fetch(url, timeout=TIMEOUT):
+    """(status code, content); (None, error text) when the request fails."""
+    session = getattr(_session, "session", None)
+    if session is None:
+        session = _session.session = requests.Session()
+        session.headers.update(HEADERS)
+    try:
+        response = session.get(url, timeout=timeout)
+    except requests.RequestException as exc:
+        return None, str(exc)
+    return response.status_code, response.content
+
+
+def _download(cache, listing_id, url, timeout):
+    status, content = fetch(url, timeout)
+    if status == 200:
+        return "cached" if cache.store(listing_id, url, content) else "failed"
+    if status in GONE:
+        cache.mark(listing_id, url, "missing", f"HTTP {status}")
+        return "missing"
+    cache.mark(listing_id, url, "failed", content if status is None else f"HTTP {status}")
+    return "failed"
+
+
+def prefetch(cache, pairs, workers=WORKERS, timeout=TIMEOUT):
+    """Download the thumbnails of (listing_id, url) pairs that aren't cached
+    yet on a thread pool; returns how many ended up in each status."""
+    pairs = list(pairs)
+    todo = cache.wanted(pairs)
+    counts = {"skipped": len(pairs) - len(todo), "cached": 0, "missing": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(lambda pair: _download(cache, *pair, timeout), todo):
+            counts[result] += 1
+    return counts
+
+
+def listing_images(df):
+    """(listing_id, image url) for every row with an image."""
+    images = df["Image"].astype("string").str.strip()
+    return [
+        (listing_key(link, url), url)
+        for link, url in zip(df["Link"].astype(str), images.fillna(""))
+        if url
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download listing thumbnails into the local cache.")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--max-mb", type=int, default=MAX_BYTES // (1024 * 1024))
+    args = parser.parse_args()
+
+    cache = ThumbnailCache(max_bytes=args.max_mb * 1024 * 1024)
+    start = time.perf_counter()
+    counts = prefetch(cache, listing_images(load_dataset(columns=["Link", "Image"])), workers=args.workers)
+    print(f"{counts} in {time.perf_counter() - start:.1f}s; {cache.size() / 1e6:.1f} MB cached")
+
+
+if __name__ == "__main__":
+    main()
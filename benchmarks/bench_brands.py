@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.brands import BrandRecognizer  # noqa: E402
+from Data_Cleaning.pipeline import companies, load_raw  # noqa: E402
+from synthetic import resample_raw  # noqa: E402
+
+# ------------------------------
+# filter_brand (per-row loop) vs. BrandRecognizer, plus the titles they disagree on
+# ------------------------------
+
+SIZES = [3_080, 100_000, 1_000_000]
+# Title spellings seen on OLX that the scraped files happen not to contain
+ALIAS_TITLES = ['Maruti Alto K10', 'VW Polo', 'Mini Countryman', 'Range Rover Velar', 'Mercedes GLA',
+                'Suzuki Jimny', 'Chevy Beat', 'Mahindra Scorpio-N']
+
+
+def filter_brand(curr):
+    for com in companies:
+        curr = curr.replace('-', ' ')
+        if com in curr.lower():
+            return com
+    return 'Unknown'
+
+
+def main():
+    recognizer = BrandRecognizer()
+    print(f"{'rows':>10} {'filter_brand':>13} {'recognizer':>11} {'speedup':>8}")
+    for n in SIZES:
+        titles = resample_raw(n)['Title']
+        start = time.perf_counter()
+        titles.apply(filter_brand)
+        old_time = time.perf_counter() - start
+        start = time.perf_counter()
+        recognizer.recognize(titles)
+        new_time = time.perf_counter() - start
+        print(f"{n:>10,} {old_time:>12.3f}s {new_time:>10.3f}s {old_time / new_time:>7.1f}x")
+
+    titles = pd.Series(list(load_raw()['Title'].unique()) + ALIAS_TITLES)
+    table = pd.DataFrame({'Title': titles, 'filter_brand': titles.apply(filter_brand)})
+    table = table.join(recognizer.recognize(titles))
+    diff = table[table['filter_brand'] != table['Brand']]
+    print(f"\n{len(diff)} of {len(titles)} distinct titles change brand:")
+    print(diff.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
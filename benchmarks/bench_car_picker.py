@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from utils.car_picker import CarPicker, build_labels  # noqa: E402
+from utils.search_index import SearchIndex  # noqa: E402
+
+# ------------------------------
+# Compare Cars picker: row-wise labels + label-equality lookup vs. CarPicker
+# ------------------------------
+
+SIZES = [3_080, 100_000, 1_000_000]
+TERMS = ["", "creta", "swift", "fortuner", "zzz"]
+REPEAT = 20
+
+
+def format_label(row):
+    # The original page's label builder
+    return f"{row['Title']} | ₹{round(row['Price']/100000,2)}L | {row['Distance Covered']} KM | {row['Location']}"
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    print(f"{'rows':>10} {'step':>28} {'before':>11} {'after':>11}")
+    for n in SIZES:
+        df = typed(resample_clean(n))
+        index = SearchIndex(df)
+
+        old_time, labels = timed(lambda: df.apply(format_label, axis=1))
+        new_time, picker = timed(lambda: CarPicker(df, index))
+        assert list(labels) == build_labels(df).to_pylist()
+        print(f"{n:>10,} {'labels (once per version)':>28} {old_time * 1000:>9.1f}ms {new_time * 1000:>9.1f}ms")
+
+        # Lookup of the selected car: label equality scan vs. id hash lookup
+        target = labels.iloc[n // 2]
+        old_time, old_row = timed(lambda: df[labels == target].iloc[0], 3)
+        listing_id = picker.ids[n // 2]
+        picker.row(listing_id)  # the hash table is built on first lookup
+        new_time, new_row = timed(lambda: picker.row(listing_id), REPEAT)
+        assert new_row["Link"] == df["Link"].iloc[n // 2]
+        print(f"{n:>10,} {'row lookup':>28} {old_time * 1000:>9.2f}ms {new_time * 1000:>9.3f}ms")
+
+        # Options sent to the widget per keystroke: every label vs. top matches
+        for term in TERMS:
+            new_time, options = timed(lambda: picker.matches(term), REPEAT)
+            assert len(options) <= 50 and len(set(options)) == len(options)
+            assert all(term.lower() in picker.label(i).split(" | ")[0].lower() for i in options)
+            print(f"{n:>10,} {f'matches {term!r} ({len(options)})':>28} {f'{n:,} opts':>11} {new_time * 1000:>9.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import gc
+import io
+import os
+import sys
+import time
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from memtools import rss_mb  # noqa: E402
+from utils import charts  # noqa: E402
+from utils.data_loader import Dataset, get_cube, get_dataset  # noqa: E402
+
+# ------------------------------
+# Insights Hub charts: render every view vs. the rendered-bytes cache
+# ------------------------------
+# Both sides draw the same five charts from the cube, so the difference is
+# the rendering path only. "Before" is what st.pyplot did for the page:
+# pyplot figures that were never closed, saved at 200 dpi and scaled down to
+# the content width by st.image on every view. It is run for fewer views and
+# its memory growth per view reported alongside.
+
+VIEWS = 1000
+BEFORE_VIEWS = 10
+NEW_SCRAPE_AT = 500  # the dataset version changes half way through
+CHARTS = [
+    charts.brand_counts_chart, charts.average_price_chart, charts.top_models_chart,
+    charts.year_counts_chart, charts.price_year_chart,
+]
+
+
+def pyplot_view(dataset, leaked):
+    for draw in CHARTS:
+        fig = draw(dataset)
+        leaked.append(fig)  # what pyplot's figure manager did with figures never closed
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+        image = Image.open(io.BytesIO(buffer.getvalue()))
+        if image.width > charts.MAX_WIDTH:
+            image = image.resize((charts.MAX_WIDTH, int(image.height * charts.MAX_WIDTH / image.width)), Image.BILINEAR)
+            image.save(io.BytesIO(), format="PNG")
+
+
+def cached_view(dataset):
+    sizes = []
+    for draw in CHARTS:
+        image = charts.chart_image(dataset, draw)
+        sizes.append(len(image))
+    return sizes
+
+
+def main():
+    base = get_dataset()
+    get_cube(base)  # loaded before timing, as the page has it by the time it draws
+    gc.collect()
+
+    start_rss = rss_mb()
+    times = []
+    for view in range(VIEWS):
+        dataset = Dataset(df=base.df, version=f"{base.version}-{view >= NEW_SCRAPE_AT}", fingerprint=base.fingerprint)
+        start = time.perf_counter()
+        cached_view(dataset)
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    cached_rss = rss_mb() - start_rss
+    for draw in CHARTS:
+        width = Image.open(io.BytesIO(charts.chart_image(dataset, draw))).width
+        assert width <= charts.MAX_WIDTH, (draw.__name__, width)
+    warm = sorted(times[1:NEW_SCRAPE_AT] + times[NEW_SCRAPE_AT + 1:])
+
+    start_rss = rss_mb()
+    leaked = []
+    start = time.perf_counter()
+    for _ in range(BEFORE_VIEWS):
+        pyplot_view(base, leaked)
+    before = (time.perf_counter() - start) / BEFORE_VIEWS
+    gc.collect()
+    before_rss = rss_mb() - start_rss
+    per_view = before_rss / BEFORE_VIEWS
+
+    print(f"{'':>22} {'per view':>10} {'RSS growth':>22}")
+    print(f"{'render every view':>22} {before * 1000:>8.0f}ms {before_rss:>8.0f}MB after {BEFORE_VIEWS} views "
+          f"(+{per_view:.0f}MB per view, unbounded)")
+    print(f"{'cached, cold view':>22} {times[0] * 1000:>8.0f}ms")
+    print(f"{'cached, warm median':>22} {warm[len(warm) // 2] * 1e6:>8.0f}µs {cached_rss:>8.0f}MB after {VIEWS} views "
+          f"(2 dataset versions)")
+    assert warm[-1] < before / 100
+    assert cached_rss < per_view * 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import os
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.pipeline import clean, companies, date_pattern  # noqa: E402
+from synthetic import resample_raw  # noqa: E402
+
+# ------------------------------
+# Notebook (row-wise .apply) cleaning vs. Data_Cleaning.pipeline
+# ------------------------------
+# The notebook version is only timed up to NOTEBOOK_MAX rows; the outputs are
+# compared row for row wherever both run (pipeline in legacy_brands mode).
+
+SIZES = [3_080, 100_000, 1_000_000]
+NOTEBOOK_MAX = 100_000
+
+
+def notebook_clean(df):
+    df = df.copy()
+    df['Information'] = df['Information'].str.split(" - ")
+    df['Year'] = df['Information'].apply(lambda data: data[0]).astype(int)
+    df['Distance Covered'] = df['Information'].apply(lambda data: data[1])
+    df['Distance Covered'] = df['Distance Covered'].apply(lambda data: data.replace('km', ""))
+    df['Distance Covered'] = df['Distance Covered'].str.strip()
+    df['Distance Covered'] = df['Distance Covered'].str.replace(',', '').astype(float)
+
+    def filter_brand(curr):
+        for com in companies:
+            curr = curr.replace('-', ' ')
+            if com in curr.lower():
+                return com
+        return 'Unknown'
+
+    df['Brand_Title'] = df['Title'].apply(filter_brand)
+    df['Brand'] = df.apply(lambda row: row['Brand_Title'] if row['Brand_Title'] != 'Unknown' else row['Brand'], axis=1)
+    df.drop(['Brand_Title', 'Information'], axis=1, inplace=True)
+    df['Price'] = df['Price'].apply(lambda data: int(data.replace('₹ ', '').replace(',', '')))
+
+    def parse_date(date_str):
+        if pd.isna(date_str):
+            return pd.NaT
+        if date_str == "Today":
+            return datetime.today()
+        if date_str == "Yesterday":
+            return datetime.today() - timedelta(days=1)
+        if "days ago" in date_str:
+            return datetime.today() - timedelta(days=int(re.search(r"(\d+)", date_str).group(1)))
+        try:
+            return datetime.strptime(date_str, "%d %b")
+        except ValueError:
+            return pd.NaT
+
+    df["Date_Posted"] = df["Location"].str.extract(date_pattern)
+    df["Clean_Location"] = df["Location"].str.replace(date_pattern, "", regex=True).str.strip()
+    df["Date_Posted"] = df["Date_Posted"].apply(parse_date)
+    df['Location'] = df['Clean_Location']
+    df.drop(['Clean_Location', 'Date_Posted'], axis=1, inplace=True)
+    return df
+
+
+def main():
+    print(f"{'rows':>10} {'notebook':>10} {'pipeline':>10} {'speedup':>8}")
+    for n in SIZES:
+        raw = resample_raw(n)
+        start = time.perf_counter()
+        new = clean(raw, legacy_brands=True).drop(columns='Model')
+        new_time = time.perf_counter() - start
+
+        if n <= NOTEBOOK_MAX:
+            start = time.perf_counter()
+            old = notebook_clean(raw)
+            old_time = time.perf_counter() - start
+            pd.testing.assert_frame_equal(new.reset_index(drop=True), old.reset_index(drop=True), check_dtype=False)
+            print(f"{n:>10,} {old_time:>9.2f}s {new_time:>9.2f}s {old_time / new_time:>7.1f}x")
+        else:
+            print(f"{n:>10,} {'-':>10} {new_time:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
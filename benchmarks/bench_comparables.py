@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from utils.comparables import K, ComparablesIndex  # noqa: E402
+from utils.value_score import KM_PER_YEAR, LEVELS, MIN_COMPS, YEAR_BAND  # noqa: E402
+
+# ------------------------------
+# Comparable listings: filter the frame per query vs. per-group KD-trees
+# ------------------------------
+
+SIZES = [3_080, 100_000, 1_000_000]
+QUERIES = 1000
+NEW_SHARE = 0.01
+
+
+def filter_comps(df, position, k=K):
+    # What a page would do without the index: mask the model and the year
+    # band (then the brand, then the band alone), rank by distance
+    row = df.iloc[position]
+    years = df["Year"].to_numpy(dtype=np.float64)
+    band = years // YEAR_BAND == row["Year"] // YEAR_BAND
+    for i, level in enumerate(LEVELS):
+        mask = band & (df[level] == row[level]).to_numpy() if level else band
+        same = np.flatnonzero(mask)
+        same = same[same != position]
+        if len(same) >= MIN_COMPS or i == len(LEVELS) - 1:
+            break
+    km = np.nan_to_num(df["Distance Covered"].to_numpy(dtype=np.float64)[same]) / KM_PER_YEAR
+    dist = np.hypot(years[same] - row["Year"], km - np.nan_to_num(float(row["Distance Covered"])) / KM_PER_YEAR)
+    order = np.argsort(dist, kind="stable")[:k]
+    return same[order], dist[order], i
+
+
+def main():
+    print(f"{'rows':>10} {'build':>9} {'+1% rows':>9} {'filter query':>13} {'first query':>12} "
+          f"{'index query':>12} {'slowest':>9} {'speed-up':>9}")
+    rng = np.random.default_rng(0)
+    for n in SIZES:
+        df = typed(resample_clean(n + int(n * NEW_SHARE), seed=2))
+        old = df.iloc[:n]
+
+        start = time.perf_counter()
+        index = ComparablesIndex(old)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        extended = index.extend(df)
+        extend = time.perf_counter() - start
+        assert len(index) == n and len(extended) == len(df)
+
+        positions = rng.integers(0, n, QUERIES)
+        base_queries = positions[:20] if n > 100_000 else positions[:200]
+        start = time.perf_counter()
+        expected = [filter_comps(old, p) for p in base_queries]
+        base = (time.perf_counter() - start) / len(base_queries)
+
+        # First pass builds the trees it touches; the second finds them built
+        start = time.perf_counter()
+        found = [index.similar_to(p) for p in positions]
+        first = (time.perf_counter() - start) / QUERIES
+        times = []
+        for p in positions:
+            start = time.perf_counter()
+            index.similar_to(p)
+            times.append(time.perf_counter() - start)
+        fast = float(np.mean(times))
+
+        for (rows, dist, level), (want_rows, want_dist, want_level) in zip(found, expected):
+            # Equal distances may come back in any order; the distances must match
+            assert level == want_level and np.allclose(dist, want_dist), (dist, want_dist)
+        # The extended index answers as one built from scratch does
+        fresh = ComparablesIndex(df)
+        for p in positions[:50]:
+            got, want = extended.similar_to(p), fresh.similar_to(p)
+            assert got[2] == want[2] and np.allclose(got[1], want[1]), (got, want)
+        # A query is one tree lookup whatever its band holds: no widening
+        assert max(times) < 0.01, max(times)
+        print(f"{n:>10,} {build * 1000:>7.0f}ms {extend * 1000:>7.0f}ms {base * 1000:>11.2f}ms "
+              f"{first * 1e6:>10.1f}µs {fast * 1e6:>10.1f}µs {max(times) * 1e6:>7.0f}µs {base / fast:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
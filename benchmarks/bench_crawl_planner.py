@@ -0,0 +1,67 @@
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraping"))
+from crawl_planner import CrawlPlanner, crawl_planned  # noqa: E402
+from fetch_engine import fetch_pages  # noqa: E402
+from olx_pages import PAGE_SIZE, StubOLXServer, build_pages, load_saved_records  # noqa: E402
+from olx_parser import parse_listings  # noqa: E402
+
+# ------------------------------
+# Coverage per request: fixed range(2,7) loop vs. the adaptive planner
+# ------------------------------
+# Brands get uneven result depths (a deep maruti suzuki, shallow kia ...) and
+# both strategies spend the same 65-request budget.
+
+DEPTHS = {'maruti suzuki': 14, 'hyundai': 9, 'honda': 4, 'toyota': 6, 'tata': 7, 'mahindra': 8,
+          'mercedes benz': 2, 'ford': 1.5, 'volkswagen': 3, 'audi': 2, 'nissan': 1, 'bmw': 2, 'kia': 3.5}
+BUDGET = 65
+
+
+def uneven_records(records):
+    out = {}
+    for brand, rows in records.items():
+        wanted = int(DEPTHS[brand] * PAGE_SIZE)
+        out[brand] = []
+        for k in range(wanted):
+            row = dict(rows[k % len(rows)])
+            row["Link"] = row["Link"].rsplit("iid-", 1)[0] + f"iid-{len(out):02d}{k:06d}"
+            out[brand].append(row)
+    return out
+
+
+def main():
+    records = uneven_records(load_saved_records())
+    brands = list(records)
+    with StubOLXServer(build_pages(records), latency=0.02) as stub, contextlib.redirect_stdout(io.StringIO()):
+        url_for = lambda brand, i: stub.base_url + f"/cars_c84?filter=make_eq_{brand}&page={i}"  # noqa: E731
+        engine = dict(concurrency=8, rate=100, burst=8)
+
+        start = time.perf_counter()
+        jobs = [(brand, url_for(brand, i)) for brand in brands for i in range(2, 7)]
+        fixed_rows = []
+        for (brand, _), html in zip(jobs, fetch_pages([url for _, url in jobs], **engine)):
+            fixed_rows.extend(parse_listings(html, brand))
+        fixed_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        planner = CrawlPlanner(brands, budget=BUDGET)
+        planned_rows = crawl_planned(brands, url_for, planner, **engine)
+        planned_time = time.perf_counter() - start
+        report = planner.report()
+
+    total = sum(len(rows) for rows in records.values())
+    print(f"{total} listings available across {len(brands)} brands, budget {BUDGET} requests")
+    print(f"range(2,7): {len(jobs):3d} requests  {len(fixed_rows):5d} listings  "
+          f"{len(jobs) / len(fixed_rows):.3f} req/listing  {fixed_time:.2f}s")
+    print(f"planner   : {report['requests']:3d} requests  {len(planned_rows):5d} listings  "
+          f"{report['requests_per_new_listing']:.3f} req/listing  {planned_time:.2f}s")
+    for brand, row in report["brands"].items():
+        print(f"  {brand:14s} requests={row['requests']:2d} depth={row['depth']:2d} listings={row['new']}")
+
+
+if __name__ == "__main__":
+    main()
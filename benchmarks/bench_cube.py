@@ -0,0 +1,88 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.cube import (  # noqa: E402
+    build_cube, by_brand, by_brand_year, by_year, by_year_price, merge_cubes, quantiles, read_cube, top_models,
+    update_cube, write_cube,
+)
+from Data_Cleaning.store import typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from utils.data_loader import normalise  # noqa: E402
+
+# ------------------------------
+# Insights Hub: per-rerun pandas aggregations vs. queries on the ingest cube
+# ------------------------------
+
+SIZES = [3_080, 100_000, 1_000_000]
+NEW_SHARE = 0.01
+REPEAT = 5
+
+
+def page_aggregations(df):
+    # What the page computed on every rerun before the cube (plotting left out)
+    brand_counts = df["Brand Name"].value_counts()
+    avg_price = df.groupby("Brand Name", observed=True)["Price"].mean()
+    models = df.groupby(["Brand Name", "Title"], observed=True).size().reset_index(name="Count")
+    top2 = models.groupby("Brand Name").apply(lambda x: x.nlargest(2, "Count")).reset_index(drop=True)
+    year_counts = df["Year"].value_counts().sort_index()
+    subsets = [df[df["Brand Name"] == brand] for brand in df["Brand Name"].unique()]
+    return brand_counts, avg_price, top2, year_counts, subsets
+
+
+def cube_queries(cube):
+    brands = by_brand(cube)
+    spread = quantiles(brands, [0.25, 0.75])
+    return brands, spread, top_models(cube), by_year(cube), by_year_price(cube), by_brand_year(cube)
+
+
+def timed(fn, *args, repeat=REPEAT):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main():
+    print(f"{'rows':>10} {'pandas':>9} {'cube':>8} {'speed-up':>9} {'build':>8} {'+1% update':>11} {'cells':>6}")
+    tmp = tempfile.mkdtemp()
+    for n in SIZES:
+        df = normalise(typed(resample_clean(n + int(n * NEW_SHARE), seed=3)))
+        old, new = df.iloc[:n], df.iloc[n:]
+
+        base, (brand_counts, avg_price, _, year_counts, _) = timed(page_aggregations, old, repeat=1 if n > 100_000 else 3)
+
+        build, cube = timed(build_cube, old, repeat=1)
+        path = os.path.join(tmp, f"cube_{n}.feather")
+        write_cube(cube, path, dataset_version="old")
+        start = time.perf_counter()
+        update_cube(new, path, dataset_version="new")
+        update = time.perf_counter() - start
+
+        fast, (brands, _, top2, years, _, _) = timed(cube_queries, cube)
+        assert (brands["count"] == brand_counts.reindex(brands.index)).all()
+        assert np.allclose(brands["mean_price"], avg_price.reindex(brands.index).astype(np.float64))
+        assert (years == year_counts.reindex(years.index)).all()
+        model_counts = old.groupby(["Brand Name", "Model"], observed=True).size()
+        assert (top2.groupby("Brand")["Count"].max() == model_counts.groupby(level=0).max().reindex(
+            top2["Brand"].unique())).all()
+
+        # The incrementally updated cube matches one built over all the rows
+        updated, meta = read_cube(path)
+        full = by_brand(build_cube(df))
+        assert meta["rows"] == len(df) and meta["dataset_version"] == "new"
+        assert (by_brand(updated)["count"] == full["count"].reindex(by_brand(updated).index)).all()
+        assert len(merge_cubes(cube, build_cube(new))) == len(updated)
+
+        print(f"{n:>10,} {base * 1000:>7.0f}ms {fast * 1000:>6.1f}ms {base / fast:>8.0f}x "
+              f"{build * 1000:>6.0f}ms {update * 1000:>9.0f}ms {len(cube):>6}")
+
+
+if __name__ == "__main__":
+    main()
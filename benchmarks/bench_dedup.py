@@ -0,0 +1,98 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.dedup import dedup, dedup_new  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+
+# ------------------------------
+# Dedup: time and recall at scale
+# ------------------------------
+# Distinct listings are resampled rows with a fresh iid, jittered price and
+# distance, and a numbered locality so a (title, location, year) group holds
+# about as many listings as in the real data whatever the size (the
+# (Brand, Year) blocks still grow with it). On top go known duplicates: copies of a listing id (the
+# overlap between scrape files) and reposts under a new id with the price
+# and distance nudged by under half a percent.
+
+SIZES = [3_080, 100_000, 1_000_000]
+COPIES = 0.10
+REPOSTS = 0.02
+BATCH = 2_000
+
+
+def listings(n, seed=0, first_id=0):
+    rng = np.random.default_rng(seed)
+    df = resample_clean(n, seed=seed)
+    df["Link"] = "https://www.olx.in/item/cars-c84-synthetic-iid-" + pd.Series(np.arange(first_id, first_id + n)).astype(str)
+    df["Price"] = (df["Price"] * rng.lognormal(0, 0.3, n)).round().astype(np.int64)
+    df["Distance Covered"] = (df["Distance Covered"] * rng.lognormal(0, 0.3, n)).round()
+    df["Location"] = df["Location"] + " " + pd.Series(rng.integers(0, max(1, n // 3_000), n)).astype(str)
+    return df
+
+
+def with_duplicates(df, seed=0):
+    """df plus injected duplicates, shuffled; also the injected rows' links."""
+    rng = np.random.default_rng(seed + 1)
+    copies = df.sample(frac=COPIES, random_state=seed)
+    reposts = df.sample(frac=REPOSTS, random_state=seed + 1).copy()
+    fresh = 10 ** 9 + np.arange(len(reposts))
+    reposts["Link"] = "https://www.olx.in/item/cars-c84-synthetic-iid-" + pd.Series(fresh, index=reposts.index).astype(str)
+    reposts["Price"] = (reposts["Price"] * rng.uniform(0.996, 1.004, len(reposts))).round().astype(np.int64)
+    reposts["Distance Covered"] = (reposts["Distance Covered"] * rng.uniform(0.996, 1.004, len(reposts))).round()
+    # The original row comes first so it is the one kept
+    base = df.assign(_order=0)
+    extra = pd.concat([copies, reposts]).assign(_order=1)
+    merged = pd.concat([base, extra.sample(frac=1, random_state=seed)], ignore_index=True)
+    return merged.drop(columns="_order"), set(reposts["Link"]), len(copies)
+
+
+def main():
+    print(f"{'rows':>10} {'time':>8} {'per 1M rows':>12} {'id dups':>8} {'reposts found':>14} {'extra merges':>13}")
+    per_row = {}
+    for n in SIZES:
+        df, reposts, copies = with_duplicates(listings(n, seed=n % 97))
+        start = time.perf_counter()
+        kept, report = dedup(df)
+        elapsed = time.perf_counter() - start
+        per_row[n] = elapsed / len(df)
+
+        by_id = (report["Reason"] == "listing id").sum()
+        near = report[report["Reason"] == "near duplicate"]
+        found = near["Link"].isin(reposts).sum()
+        assert by_id == copies
+        assert found >= 0.99 * len(reposts)
+        assert len(kept) + len(report) == len(df)
+        print(f"{len(df):>10,} {elapsed:>7.2f}s {per_row[n] * 1e6:>11.2f}s {by_id:>8,} "
+              f"{found / len(reposts):>13.1%} {len(near) - found:>13,}")
+
+    # Linear: the per-row cost stays flat from 100k to 1M rows
+    assert per_row[SIZES[-1]] < 2 * per_row[SIZES[1]], per_row
+
+    # Incremental: a follow-up scrape against the million-row dataset
+    batch, reposts, copies = with_duplicates(listings(BATCH, seed=7, first_id=10 ** 8))
+    batch = pd.concat([batch, kept.sample(200, random_state=0)], ignore_index=True)
+    start = time.perf_counter()
+    new, report = dedup_new(kept, batch)
+    elapsed = time.perf_counter() - start
+    assert (report["Reason"] == "listing id").sum() == copies + 200
+    print(f"follow-up of {len(batch):,} rows against {len(kept):,}: {len(new):,} new, {len(report):,} merged "
+          f"in {elapsed:.2f}s")
+
+    # Cards without a link (damaged in the page) each keep a key of their own:
+    # never merged by id, whether alone, among themselves or against the dataset
+    linkless = listings(20, seed=11, first_id=2 * 10 ** 8)
+    linkless.loc[:9, "Link"] = None
+    kept_linkless, report = dedup(linkless)
+    assert len(kept_linkless) == len(linkless) and report.empty, report
+    new, report = dedup_new(kept, linkless)
+    assert (report["Reason"] != "listing id").all(), report
+    assert len(new) + len(report) == len(linkless)
+
+
+if __name__ == "__main__":
+    main()
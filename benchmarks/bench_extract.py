@@ -0,0 +1,84 @@
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraping"))
+from memtools import peak_rss_mb  # noqa: E402
+from olx_parser import parse_listings  # noqa: E402
+
+# ------------------------------
+# Cards/second and peak memory: BeautifulSoup path vs. lxml fast path
+# ------------------------------
+# Runs over the saved-page corpus in benchmarks/corpus/ (see make_corpus.py).
+# Each backend is measured in a fresh process so peak RSS is comparable.
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+REPEAT = 5
+
+
+def load_corpus():
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.html"))):
+        with open(path) as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+def measure(backend, queue):
+    pages = [html for name, html in load_corpus().items() if name != "damaged_cards.html"]
+    # A "large result page": every saved card on one page
+    large = pages[0].replace("</ul>", "".join(p.split("<ul", 1)[1].split(">", 1)[1].rsplit("</ul>", 1)[0]
+                                               for p in pages[1:]) + "</ul>")
+    base_rss = peak_rss_mb()
+    cards = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(REPEAT):
+            for html in pages + [large]:
+                cards += len(parse_listings(html, "bench", backend=backend))
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_mb() - base_rss
+    queue.put((cards, elapsed, peak))
+
+
+def run_isolated(backend):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=measure, args=(backend, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    corpus = load_corpus()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, html in corpus.items():
+            if name != "damaged_cards.html":
+                assert parse_listings(html, "x", backend="lxml") == parse_listings(html, "x", backend="bs4"), name
+
+    print(f"corpus: {len(corpus)} pages, rows identical between backends on clean pages")
+    for backend in ("bs4", "lxml"):
+        cards, elapsed, peak = run_isolated(backend)
+        print(f"{backend:5s}: {cards / elapsed:9.0f} cards/s  peak RSS +{peak:.1f} MB")
+
+    damaged = corpus["damaged_cards.html"]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_listings(damaged, "x", backend="bs4")
+        print("bs4  : damaged page parsed")
+    except (AttributeError, TypeError) as e:
+        print(f"bs4  : damaged page crashes ({type(e).__name__})")
+    errors = Counter()
+    rows = parse_listings(damaged, "x", backend="lxml", errors=errors)
+    print(f"lxml : damaged page -> {len(rows)} rows, missing fields {dict(errors)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import load_dataset, typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from Valuation.fair_price import FEATURES, evaluate, fit, predict_dataset, split, train  # noqa: E402
+
+# ------------------------------
+# Fair-price model: holdout error, artifact load, single and batch latency
+# ------------------------------
+
+SIZES = [3_080, 100_000, 1_000_000]
+REPEAT = 50
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def model_median_error(train_rows, test_rows):
+    # Reference point: predict the median asking price of the same model
+    medians = train_rows.groupby("Model", observed=True)["Price"].median()
+    guess = test_rows["Model"].astype(object).map(medians).fillna(train_rows["Price"].median()).to_numpy(dtype=np.float64)
+    actual = test_rows["Price"].to_numpy(dtype=np.float64)
+    return float(np.median(np.abs(guess - actual) / actual))
+
+
+def main():
+    df = load_dataset()
+    train_time, (model, metrics) = timed(lambda: train(df))
+    holdout = metrics["holdout"]
+    train_rows, test_rows = split(df)
+    assert evaluate(fit(train_rows), test_rows) == holdout
+    print(f"train on {len(df):,} rows: {train_time:.2f}s (split fit + refit)")
+    print(f"holdout {holdout['rows']} rows: median error {holdout['median_ape']:.1%}, "
+          f"within 20% {holdout['within_20pct']:.1%}, MAE ₹{holdout['mae']:,.0f}")
+    print(f"  (same-model median price: median error {model_median_error(train_rows, test_rows):.1%})")
+
+    blob = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+    load_time, loaded = timed(lambda: pickle.loads(blob), 20)
+    print(f"artifact {len(blob) / 1024:.0f} KB, load {load_time * 1000:.1f}ms")
+
+    row = df.iloc[0]
+    single_time, price = timed(lambda: loaded.predict_one(row), REPEAT)
+    assert np.isclose(price, model.predict(df.iloc[:1])[0])
+    print(f"single prediction: {single_time * 1000:.2f}ms")
+
+    print(f"{'rows':>10} {'batch':>10} {'per row':>10} {'saved reload':>13}")
+    for n in SIZES:
+        batch = typed(resample_clean(n))[FEATURES + ["Price"]]
+        batch_time, prices = timed(lambda: loaded.predict(batch))
+        assert prices.shape == (n,) and np.isfinite(prices).all()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fair_price.npz")
+            predict_dataset(loaded, "m1", batch, "d1", path)
+            reload_time, saved = timed(lambda: predict_dataset(loaded, "m1", batch, "d1", path))
+        assert np.allclose(saved, prices, rtol=1e-6)
+        print(f"{n:>10,} {batch_time * 1000:>8.1f}ms {batch_time / n * 1e6:>8.2f}µs {reload_time * 1000:>11.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
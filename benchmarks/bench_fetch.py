@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+
+import requests
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraping"))
+from fetch_engine import HEADERS, FetchEngine, fetch_pages  # noqa: E402
+from olx_parser import extract_car_info, parse_listings  # noqa: E402
+from olx_pages import StubOLXServer, load_saved_pages  # noqa: E402
+
+# ------------------------------
+# Pages/second: old blocking loop vs. the async fetch engine
+# ------------------------------
+# Both paths run against a local stub server serving saved OLX pages and must
+# produce identical rows. A second run has the stub answer some pages with
+# 429/5xx (and one 404) first, and checks the engine's retries, its backoff
+# between attempts and the per-host spacing of all its requests.
+
+RETRY_RATE = 20.0
+RETRY_BURST = 2
+BACKOFF = 0.05
+
+
+def legacy_loop(base_url, brands, pages, sleep):
+    # Same shape as the original OLX_data_Scraping2.py loop
+    car_data = []
+    for brand in brands:
+        for i in pages:
+            response = requests.get(base_url.format(brand, i), headers=HEADERS)
+            soup = BeautifulSoup(response.text, 'html.parser')
+            for card in soup.find_all('li', {'class': '_3V_Ww'}):
+                info = extract_car_info(card)
+                info['Brand'] = brand
+                car_data.append(info)
+        time.sleep(sleep)
+    return car_data
+
+
+def engine_run(base_url, brands, pages, **engine_kwargs):
+    jobs = [(brand, base_url.format(brand, i)) for brand in brands for i in pages]
+    html_pages = fetch_pages([url for _, url in jobs], **engine_kwargs)
+    car_data = []
+    for (brand, _), html in zip(jobs, html_pages):
+        car_data.extend(parse_listings(html, brand))
+    return car_data
+
+
+async def _engine_fetch(urls, **kwargs):
+    async with FetchEngine(**kwargs) as engine:
+        return await engine.fetch_all(urls), engine.stats
+
+
+def check_retries(saved):
+    keys = list(saved)[:12]
+    errors = {
+        keys[0]: [429],
+        keys[1]: [503, 500],
+        keys[2]: [502, 503, 504],  # succeeds on the last retry
+        keys[3]: [503] * 4,  # runs out of retries
+        keys[4]: [404],  # not retried
+    }
+    with StubOLXServer(saved, latency=0.01, errors=errors) as stub, contextlib.redirect_stdout(io.StringIO()):
+        urls = [stub.base_url + f"/cars_c84?filter=make_eq_{brand}&page={page}" for brand, page in keys]
+        pages, stats = asyncio.run(_engine_fetch(urls, concurrency=8, rate=RETRY_RATE, burst=RETRY_BURST,
+                                                 retries=3, backoff=BACKOFF))
+    requests_made = stub.requests
+
+    assert pages[3] is None and pages[4] is None
+    assert all(html == saved[key] for key, html in zip(keys, pages) if key not in (keys[3], keys[4]))
+    assert stats == {"requests": 21, "retries": 9, "failures": 2}, stats
+    assert len(requests_made) == stats["requests"]
+
+    # Attempt n waits at least half of BACKOFF * 2**n (the jitter's low end)
+    times = [t for t, brand, page in requests_made if (brand, page) == keys[2]]
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert len(gaps) == 3 and all(gap >= BACKOFF * 2 ** n * 0.5 for n, gap in enumerate(gaps)), gaps
+
+    # Token bucket: past the burst, request i can't start before (i + 1 - burst) / rate
+    times = sorted(t for t, _, _ in requests_made)
+    early = [(i + 1 - RETRY_BURST) / RETRY_RATE - (t - times[0]) for i, t in enumerate(times)]
+    assert max(early) < 0.01, max(early)
+    print(f"retries  : {stats['retries']} retries, {stats['failures']} failures over {len(keys)} pages, "
+          f"{len(times) / (times[-1] - times[0]):.1f} req/s at a {RETRY_RATE:.0f} req/s limit")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.3, help="stub server latency per page (s)")
+    parser.add_argument("--sleep", type=float, default=2.0, help="per-brand sleep of the old loop (s)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=4.0, help="engine requests/second per host")
+    args = parser.parse_args()
+
+    saved = load_saved_pages()
+    brands = list(dict.fromkeys(brand for brand, _ in saved))
+    pages = range(2, 7)
+    n_pages = len(brands) * len(pages)
+
+    with StubOLXServer(saved, latency=args.latency) as stub:
+        base_url = stub.base_url + "/cars_c84?filter=make_eq_{}&page={}"
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            old_rows = legacy_loop(base_url, brands, pages, args.sleep)
+            old_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            new_rows = engine_run(base_url, brands, pages, concurrency=args.concurrency,
+                                  rate=args.rate, burst=args.concurrency)
+            new_time = time.perf_counter() - start
+
+    assert new_rows == old_rows, "fetch engine rows differ from the old loop"
+    print(f"{n_pages} pages, {len(new_rows)} rows, identical output")
+    print(f"old loop : {old_time:7.2f}s  {n_pages / old_time:6.2f} pages/s")
+    print(f"engine   : {new_time:7.2f}s  {n_pages / new_time:6.2f} pages/s  ({old_time / new_time:.1f}x)")
+
+    check_retries(saved)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraping"))
+from incremental import Checkpoint, run_incremental  # noqa: E402
+from olx_pages import StubOLXServer, build_pages, load_saved_records  # noqa: E402
+
+# ------------------------------
+# Requests and wall time: full crawl vs. small incremental refresh vs. resume
+# ------------------------------
+
+NEW_PER_BRAND = 5
+
+
+def fresh_listings(records, brand, n):
+    rows = []
+    for k, row in enumerate(records[:n]):
+        row = dict(row)
+        row["Link"] = row["Link"].rsplit("iid-", 1)[0] + f"iid-9{k:03d}{abs(hash(brand)) % 100000:05d}"
+        rows.append(row)
+    return rows
+
+
+def timed_run(brands, url_for, out_csv):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats = run_incremental(brands, range(2, 7), url_for, out_csv, concurrency=8, rate=50, burst=8, backoff=0.01)
+    return stats, time.perf_counter() - start
+
+
+def main():
+    records = load_saved_records()
+    brands = list(records)
+    with StubOLXServer(build_pages(records), latency=0.1) as stub, tempfile.TemporaryDirectory() as tmp:
+        out_csv = os.path.join(tmp, "listings.csv")
+        url_for = lambda brand, i: stub.base_url + f"/cars_c84?filter=make_eq_{brand}&page={i}"  # noqa: E731
+
+        full, full_time = timed_run(brands, url_for, out_csv)
+        print(f"full crawl   : {full['requests']:3d} requests {full_time:6.2f}s  {full['new_rows']} rows")
+
+        # A small refresh: a handful of new listings at the top of every brand
+        for brand in brands:
+            records[brand] = fresh_listings(records[brand], brand, NEW_PER_BRAND) + records[brand]
+        stub.pages = build_pages(records)
+        refresh, refresh_time = timed_run(brands, url_for, out_csv)
+        print(f"refresh      : {refresh['requests']:3d} requests {refresh_time:6.2f}s  {refresh['new_rows']} new rows")
+        assert refresh["new_rows"] == NEW_PER_BRAND * len(brands)
+
+        # Interrupted run: pretend every brand already finished pages 2-4
+        resume_csv = os.path.join(tmp, "resume.csv")
+        checkpoint = Checkpoint(resume_csv + ".checkpoint.json")
+        for brand in brands:
+            checkpoint.mark(brand, 4)
+        resumed, resume_time = timed_run(brands, url_for, resume_csv)
+        print(f"resumed run  : {resumed['requests']:3d} requests {resume_time:6.2f}s  skipped {resumed['resumed_pages']} done pages")
+
+
+if __name__ == "__main__":
+    main()
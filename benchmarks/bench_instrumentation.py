@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import instrumentation  # noqa: E402
+from utils.instrumentation import ROLLING, PageRun, export, span  # noqa: E402
+
+# ------------------------------
+# Instrumentation: what a span costs with recording off and on
+# ------------------------------
+# Off is the default for every visitor, so a span must cost next to nothing
+# there. On, each span also reads resident memory and updates the rolling
+# window. A page run has about ten spans, so even the enabled cost should be
+# a small fraction of a millisecond per run.
+
+CALLS = 1_000_000
+ENABLED_CALLS = 100_000
+SPANS_PER_RUN = 10
+
+
+def per_call(calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        with span("filter"):
+            pass
+    return (time.perf_counter() - start) / calls
+
+
+def baseline(calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        pass
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    empty = baseline(CALLS)
+    instrumentation._local.run = None
+    off = per_call(CALLS) - empty
+    instrumentation._local.run = PageRun("bench", 1)
+    on = per_call(ENABLED_CALLS) - empty
+    instrumentation._local.run = None
+    print(f"span, recording off: {off * 1e9:>8.0f} ns")
+    print(f"span, recording on:  {on * 1e9:>8.0f} ns ({on * SPANS_PER_RUN * 1000:.3f} ms per run of {SPANS_PER_RUN})")
+    assert off < 2e-6
+    assert on * SPANS_PER_RUN < 1e-3
+
+    # Export over a full window for 30 span names
+    for i in range(30):
+        for _ in range(instrumentation.WINDOW):
+            ROLLING.add(f"span.{i}", 0.01)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ["metrics.json", "metrics.prom"]:
+            path = os.path.join(tmp, name)
+            start = time.perf_counter()
+            export(path)
+            elapsed = time.perf_counter() - start
+            print(f"export {name}: {elapsed * 1000:.1f} ms, {os.path.getsize(path):,} bytes")
+            assert elapsed < 0.5
+
+
+if __name__ == "__main__":
+    main()
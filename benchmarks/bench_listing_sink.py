@@ -0,0 +1,174 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.cube import build_cube, read_cube, write_cube  # noqa: E402
+from Data_Cleaning.pipeline import ingest  # noqa: E402
+from Data_Cleaning.raw_store import ListingSink, committed_parts, read_parts  # noqa: E402
+from Data_Cleaning.store import load_dataset, write_dataset  # noqa: E402
+from memtools import peak_rss_mb  # noqa: E402
+from synthetic import resample_clean, resample_raw  # noqa: E402
+
+# ------------------------------
+# Scraper output: one list + DataFrame at the end vs. the streaming sink
+# ------------------------------
+# Synthetic crawls of 100k and 1M raw rows arrive a result page (40 rows) at
+# a time, brand after brand. Each run is a fresh process so the peak RSS
+# growth is its own. Then the cleaning step: ingesting a follow-up scrape
+# only touches the partitions it committed.
+
+SIZES = [100_000, 1_000_000]
+PAGE_SIZE = 40
+BRANDS = 13
+INGEST_ROWS = 50_000
+FOLLOW_UP_ROWS = 2_000
+COMMIT_ROWS = 10
+
+
+def crawl(n, seed=0):
+    """(brand, page rows) as a planned crawl yields them; rows are fresh dicts."""
+    records = resample_raw(3_000, seed=seed).to_dict("records")
+    per_brand = -(-n // BRANDS)
+    made = 0
+    for b in range(BRANDS):
+        brand = records[b]["Brand"]
+        for start in range(0, min(per_brand, n - made), PAGE_SIZE):
+            count = min(PAGE_SIZE, per_brand - start, n - made)
+            page = []
+            for k in range(count):
+                row = dict(records[(made + k) % len(records)], Brand=brand)
+                row["Link"] = f"https://www.olx.in/item/cars-c84-synthetic-iid-{seed}{made + k:09d}"
+                page.append(row)
+            made += count
+            yield brand, page
+
+
+def to_list(n, out_dir):
+    car_data = []
+    for _, rows in crawl(n):
+        car_data.extend(rows)
+    pd.DataFrame(car_data).to_csv(os.path.join(out_dir, "listings.csv"), index=False)
+
+
+def to_sink(n, out_dir):
+    with ListingSink(root=out_dir, scrape_date="2025-01-01") as sink:
+        current = None
+        for brand, rows in crawl(n):
+            if brand != current and current is not None:
+                sink.commit(current)
+            current = brand
+            sink.write(brand, rows)
+
+
+def measure(writer, n, out_dir, queue):
+    base = peak_rss_mb()
+    start = time.perf_counter()
+    writer(n, out_dir)
+    queue.put((time.perf_counter() - start, peak_rss_mb() - base))
+
+
+def run_isolated(writer, n, out_dir):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=measure, args=(writer, n, out_dir, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def committed_rows(root):
+    return sum(len(read_parts([part], root)) for part in committed_parts(root))
+
+
+def check_interrupted_run(root):
+    before = committed_parts(root)
+    try:
+        with ListingSink(root=root, batch_rows=100, scrape_date="2025-01-02") as sink:
+            for i, (brand, rows) in enumerate(crawl(1_000, seed=1)):
+                sink.write(brand, rows)
+                if i == 20:
+                    raise KeyboardInterrupt
+    except KeyboardInterrupt:
+        pass
+    # Parts were written, none became visible
+    assert committed_parts(root) == before
+
+
+def commit_often(root, seed, commits):
+    # One scraper: one part of COMMIT_ROWS committed to the same partition again and again
+    rows = resample_raw(commits * COMMIT_ROWS, seed=seed).to_dict("records")
+    with ListingSink(root=root, batch_rows=COMMIT_ROWS, scrape_date="2025-01-03") as sink:
+        for start in range(0, len(rows), COMMIT_ROWS):
+            sink.write("maruti suzuki", rows[start:start + COMMIT_ROWS])
+            sink.commit("maruti suzuki")
+
+
+def check_concurrent_commits(root, scrapers=4, commits=25):
+    # Scrapers committing the same brand and date at once keep every part
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=commit_often, args=(root, seed, commits)) for seed in range(scrapers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+        assert proc.exitcode == 0
+    parts = [part for part in committed_parts(root) if part.startswith("date=2025-01-03")]
+    files = [f for f in os.listdir(os.path.join(root, os.path.dirname(parts[0]))) if f.endswith(".feather")]
+    assert len(parts) == len(set(parts)) == len(files) == scrapers * commits, (len(parts), len(files))
+    assert len(read_parts(parts, root)) == scrapers * commits * COMMIT_ROWS
+
+
+def ingest_follow_up(tmp):
+    store = os.path.join(tmp, "store")
+    dataset_path = os.path.join(tmp, "olx_cars_data.feather")
+    cube_path = os.path.join(tmp, "olx_cars_data.cube.feather")
+    csv_path = os.path.join(tmp, "olx_cars_data.csv")
+    duplicates_path = os.path.join(tmp, "olx_cars_data.duplicates.csv")
+    base = resample_clean(3_080)
+    base.to_csv(csv_path)
+    write_cube(build_cube(base), cube_path, write_dataset(base, dataset_path)["version"])
+
+    timings = []
+    for day, rows in (("2025-01-01", INGEST_ROWS), ("2025-01-02", FOLLOW_UP_ROWS)):
+        with ListingSink(root=store, scrape_date=day) as sink:
+            for brand, page in crawl(rows, seed=int(day[-1])):
+                sink.write(brand, page)
+        start = time.perf_counter()
+        new = ingest(store, csv_path, dataset_path, cube_path, duplicates_path)
+        timings.append((rows, len(new), time.perf_counter() - start))
+    assert ingest(store, csv_path, dataset_path, cube_path, duplicates_path).empty
+    cube, meta = read_cube(cube_path)
+    assert meta["rows"] == len(load_dataset(["Price"], path=dataset_path))
+    return timings
+
+
+def main():
+    print(f"{'rows':>10} {'writer':>8} {'time':>8} {'peak RSS growth':>16}")
+    peaks = {}
+    for n in SIZES:
+        for writer in (to_list, to_sink):
+            with tempfile.TemporaryDirectory() as tmp:
+                elapsed, peak = run_isolated(writer, n, tmp)
+                if writer is to_sink:
+                    assert committed_rows(tmp) == n
+                    check_interrupted_run(tmp)
+                    check_concurrent_commits(tmp)
+            peaks[writer.__name__, n] = peak
+            print(f"{n:>10,} {writer.__name__:>8} {elapsed:>7.1f}s {peak:>13.0f} MB")
+    # Constant: ten times the rows, about the same memory
+    assert peaks["to_sink", SIZES[-1]] < peaks["to_sink", SIZES[0]] + 50
+    assert peaks["to_sink", SIZES[-1]] < peaks["to_list", SIZES[-1]] / 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for raw, cleaned, elapsed in ingest_follow_up(tmp):
+            print(f"ingest after a {raw:,}-row scrape: {cleaned:,} rows cleaned and appended in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
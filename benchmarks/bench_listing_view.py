@@ -0,0 +1,87 @@
+import logging
+import os
+import sys
+import time
+
+import pandas as pd
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from utils.listing_view import cards_html, sort_rows  # noqa: E402
+from utils.search_index import SearchIndex  # noqa: E402
+
+# ------------------------------
+# Time to first render of a 2,000-result Explore query
+# ------------------------------
+# "before" is the original iterrows loop with one st.markdown per card,
+# "after" is one sorted page built column-wise and sent as a single block.
+# Run outside `streamlit run`, so st.markdown only builds the element.
+
+RESULTS = 2_000
+PAGE_SIZE = 24
+REPEAT = 5
+
+
+def old_render(filtered_df):
+    payload = 0
+    for _, row in filtered_df.iterrows():
+        has_image = pd.notna(row["Image"]) and str(row["Image"]).strip() != ""
+        content_block = f"""
+        <h3 style='color:#d3d0d0ff; margin-bottom:8px; font-family:Georgia, serif;'>{row['Title']}</h3>
+        <p style='color:#aba6a6ff; font-size:15px; margin:0; font-family:Georgia, serif;'>
+            📍 <strong>Location:</strong> {row['Location']} &nbsp; 📅 <strong>Year:</strong> {row['Year']}<br>
+            🚗 <strong>Distance Covered:</strong> {row['Distance Covered']} <br>💰 <strong>Price:</strong> ₹{round(row['Price']/100000,2)}L
+        </p>
+        <a href="{row['Link']}" target="_blank">
+            <button style="margin-top:12px; background-color:#767474ff; color:#000000; padding:8px 14px;
+                border:none; border-radius:6px; font-weight:bold; cursor:pointer; font-family:Georgia, serif;">
+                🔗 Visit Site
+            </button>
+        </a>
+        """
+        if has_image:
+            img_tag = f"<img src='{row['Image']}' style='width:180px; height:auto; border-radius:8px; border:1px solid #444;' />"
+            inner_layout = f"<div style='display:flex; gap:20px; align-items:center;'>{img_tag}<div style='flex:1;'>{content_block}</div></div>"
+        else:
+            inner_layout = f"<div>{content_block}</div>"
+        block = f"<div style='background-color:#1A1A1A; padding:20px; margin-bottom:20px;'>{inner_layout}</div>"
+        payload += len(block.encode())
+        st.markdown(block, unsafe_allow_html=True)
+    return payload, len(filtered_df)
+
+
+def new_render(df, rows):
+    ordered = sort_rows(df, rows, "Price: low to high")
+    html = cards_html(df.take(ordered[:PAGE_SIZE]))
+    st.markdown(html, unsafe_allow_html=True)
+    return len(html.encode()), min(PAGE_SIZE, len(rows))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = fn()
+    return (time.perf_counter() - start) / REPEAT, result
+
+
+def main():
+    for name in list(logging.Logger.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    df = typed(resample_clean(30_000))
+    index = SearchIndex(df)
+    rows = index.query("hyundai")[:RESULTS]
+    filtered_df = df.take(rows)
+
+    old_time, (old_bytes, old_images) = timed(lambda: old_render(filtered_df))
+    new_time, (new_bytes, new_images) = timed(lambda: new_render(df, rows))
+    print(f"{RESULTS} results")
+    print(f"before: {old_time * 1000:8.1f}ms  {RESULTS} markdown calls  {old_bytes / 1024:7.0f} KB HTML  {old_images} images requested")
+    print(f"after : {new_time * 1000:8.1f}ms  1 markdown call     {new_bytes / 1024:7.0f} KB HTML  "
+          f"{new_images} lazy images  ({old_time / new_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+
+from matplotlib.figure import Figure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from utils.charts import POINT_BUDGET, price_year_chart, render  # noqa: E402
+from utils.data_loader import Dataset, get_cube, normalise  # noqa: E402
+
+# ------------------------------
+# Price vs. Year: one scatter per brand vs. the point-budget chart
+# ------------------------------
+# Both are rendered to PNG the way the page does (utils.charts.render).
+# Times exclude the cube, which is built at ingest.
+
+SIZES = [3_080, 100_000, 1_000_000]
+
+
+def per_brand_scatter(df):
+    # The chart before: a mask and a scatter call per brand, every point drawn
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    for brand in df["Brand Name"].unique():
+        subset = df[df["Brand Name"] == brand]
+        ax.scatter(subset["Year"], subset["Price"], label=brand, alpha=0.6, s=60)
+    ax.legend(loc="upper right", fontsize="small", frameon=False)
+    return fig
+
+
+def main():
+    print(f"{'rows':>10} {'per-brand scatter':>18} {'budgeted':>9} {'mode':>8}")
+    times = {}
+    for n in SIZES:
+        df = normalise(typed(resample_clean(n, seed=5)))
+        dataset = Dataset(df=df, version=f"synthetic-{n}", fingerprint=(0, 0))
+        get_cube(dataset)
+
+        start = time.perf_counter()
+        render(per_brand_scatter(df))
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        image = render(price_year_chart(dataset))
+        times[n] = time.perf_counter() - start
+        assert image.startswith(b"\x89PNG")
+        mode = "points" if len(dataset) <= POINT_BUDGET else "density"
+        print(f"{n:>10,} {before * 1000:>16.0f}ms {times[n] * 1000:>7.0f}ms {mode:>8}")
+
+    # Flat: a million listings draw about as fast as the smallest set
+    assert times[SIZES[-1]] < 2 * times[SIZES[0]], times
+
+
+if __name__ == "__main__":
+    main()
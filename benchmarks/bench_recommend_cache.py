@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import load_dataset  # noqa: E402
+from utils.response_cache import ResponseCache  # noqa: E402
+from utils.recommender import recommend_stream  # noqa: E402
+
+# ------------------------------
+# Compare Cars recommendation: LLM round trip per click vs. the shared cache
+# ------------------------------
+# FakeLLM stands in for ChatGroq: same stream() -> chunks with .content
+# surface, fixed latency before the answer, counts calls. Runs fully offline.
+
+LATENCY = 0.8
+PAIRS = 20
+FALLBACK = "local verdict"
+
+
+class Reply:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeLLM:
+    def __init__(self, latency=LATENCY, fail=False):
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+
+    def stream(self, prompt):
+        self.calls += 1
+        time.sleep(self.latency)
+        if self.fail:
+            raise TimeoutError("provider unavailable")
+        yield Reply("Pick the first car.")
+        yield Reply(f" ({len(prompt)} chars)")
+
+
+def recommend(cars, llm, cache):
+    """(final text shown, whether it came from the cache)."""
+    shown = []
+    record = recommend_stream(cars, llm, cache, shown.append, FALLBACK)
+    return shown[-1], record["source"] == "cache"
+
+
+def pairs(df, count):
+    ids = df["Link"].str.extract(r"iid-(\d+)", expand=False)
+    return [
+        ((ids.iloc[i], df.iloc[i]), (ids.iloc[i + 1], df.iloc[i + 1]))
+        for i in range(0, count * 2, 2)
+    ]
+
+
+def clicks(path, reverse, queue):
+    # Another server process: same file, fresh cache object and client
+    df = load_dataset()
+    cache, llm = ResponseCache(path), FakeLLM()
+    start = time.perf_counter()
+    for car1, car2 in pairs(df, PAIRS):
+        recommend([car2, car1] if reverse else [car1, car2], llm, cache)
+    queue.put((time.perf_counter() - start, llm.calls, cache.stats()))
+
+
+def main():
+    df = load_dataset()
+    workload = pairs(df, PAIRS)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "recommendations.sqlite")
+        cache, llm = ResponseCache(path), FakeLLM()
+
+        start = time.perf_counter()
+        first = [recommend([a, b], llm, cache) for a, b in workload]
+        cold = time.perf_counter() - start
+        cold_stats = cache.stats()
+        assert llm.calls == PAIRS and not any(cached for _, cached in first)
+
+        start = time.perf_counter()
+        again = [recommend([b, a], llm, cache) for a, b in workload]
+        warm = time.perf_counter() - start
+        assert llm.calls == PAIRS, "swapped pair missed the cache"
+        assert [text for text, _ in again] == [text for text, _ in first]
+        print(f"{PAIRS} pairs, cold (LLM {LATENCY}s each): {cold * 1000:9.1f}ms  {cold_stats}")
+        print(f"{PAIRS} pairs, same process, swapped order: {warm * 1000:9.2f}ms  ({warm / PAIRS * 1000:.3f}ms/click)")
+
+        ctx = multiprocessing.get_context("spawn")
+        queue = ctx.Queue()
+        proc = ctx.Process(target=clicks, args=(path, True, queue))
+        proc.start()
+        elapsed, calls, stats = queue.get()
+        proc.join()
+        assert calls == 0, "second process missed the shared cache"
+        print(f"{PAIRS} pairs, second process:          {elapsed * 1000:9.2f}ms  {stats}")
+
+        # Failures fall back locally and are not cached
+        failing = FakeLLM(latency=0, fail=True)
+        pair = [workload[0][0], ("x", workload[0][1][1])]
+        text, cached = recommend(pair, failing, cache)
+        assert text == FALLBACK and not cached and failing.calls == 1
+        assert recommend(pair, failing, cache) == (FALLBACK, False) and failing.calls == 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "recommendations.sqlite")
+        small = ResponseCache(path, ttl=3600, max_entries=5)
+        for i in range(5):
+            small.put(f"k{i}", str(i))
+            time.sleep(0.002)
+        small.get("k0")  # most recently used now
+        small.put("k5", "5")
+        assert small.get("k1") is None and small.get("k0") == "0" and len(small) == 5
+        expiring = ResponseCache(path, ttl=0.05)
+        time.sleep(0.1)
+        assert expiring.get("k0") is None
+        print(f"LRU bound and TTL expiry ok: {small.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import load_dataset  # noqa: E402
+from utils.recommender import LATENCIES, recommend_stream  # noqa: E402
+from utils.response_cache import ResponseCache  # noqa: E402
+
+# ------------------------------
+# Compare Cars recommendation: blocking invoke() vs. streamed with a budget
+# ------------------------------
+# FakeStreamingLLM mimics ChatGroq's invoke()/stream() with a configurable
+# delay before the first token and between tokens. "Visible" is when the
+# page first has text to show the user.
+
+ANSWER = "Car 1 is the better buy: it is newer, has covered fewer kilometres and costs less. Choose Car 1."
+FIRST_TOKEN_BUDGET = 0.5
+TOTAL_BUDGET = 5.0
+
+
+class Chunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeStreamingLLM:
+    def __init__(self, first_delay, token_delay=0.02, fail_after=None, hang=False):
+        self.first_delay = first_delay
+        self.token_delay = token_delay
+        self.fail_after = fail_after
+        self.hang = hang
+
+    def stream(self, prompt):
+        time.sleep(self.first_delay)
+        for i, word in enumerate(ANSWER.split(" ")):
+            if self.fail_after is not None and i == self.fail_after:
+                raise ConnectionError("stream dropped")
+            if self.hang and i == 3:
+                time.sleep(TOTAL_BUDGET * 2)
+            yield Chunk(word if i == 0 else " " + word)
+            time.sleep(self.token_delay)
+
+    def invoke(self, prompt):
+        return Chunk("".join(chunk.content for chunk in self.stream(prompt)))
+
+
+SCENARIOS = [
+    # name, llm, expected source, whether the fallback is the first thing shown
+    ("fast provider", FakeStreamingLLM(0.2), "llm", False),
+    ("slow first token", FakeStreamingLLM(1.5), "llm", True),
+    ("drops mid-stream", FakeStreamingLLM(0.2, fail_after=5), "fallback", False),
+    ("hangs mid-stream", FakeStreamingLLM(0.2, hang=True), "fallback", False),
+]
+
+
+def main():
+    df = load_dataset()
+    car1, car2 = ("1", df.iloc[0]), ("2", df.iloc[1])
+    fallback = "local verdict"
+    print(f"{'scenario':>18} {'blocking visible':>17} {'stream visible':>15} {'ttft':>7} {'total':>7} {'source':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, llm, source, fallback_first in SCENARIOS:
+            cache = ResponseCache(os.path.join(tmp, f"{name}.sqlite"))
+
+            # The old page showed nothing until invoke() returned or raised
+            blocking = "never"
+            if not llm.hang:
+                start = time.perf_counter()
+                try:
+                    llm.invoke("prompt")
+                except ConnectionError:
+                    pass
+                blocking = f"{time.perf_counter() - start:.2f}s"
+
+            shown = []
+            start = time.perf_counter()
+            timing = recommend_stream(
+                [car1, car2], llm, cache, lambda text: shown.append((time.perf_counter() - start, text)), fallback,
+                first_token_budget=FIRST_TOKEN_BUDGET, total_budget=TOTAL_BUDGET,
+            )
+            assert timing["source"] == source, (name, timing)
+            assert shown[0][0] < FIRST_TOKEN_BUDGET + 0.1, name
+            assert (shown[0][1] == fallback) == fallback_first, name
+            assert shown[-1][1] == (ANSWER if source == "llm" else fallback), name
+            ttft = f"{timing['ttft']:.2f}s" if timing["ttft"] is not None else "-"
+            print(f"{name:>18} {blocking:>17} {shown[0][0]:>14.2f}s {ttft:>7} {timing['total']:>6.2f}s {timing['source']:>9}")
+
+            if source == "llm":
+                again = recommend_stream([car2, car1], llm, cache, lambda text: None, fallback)
+                assert again["source"] == "cache", name
+
+    print(f"recorded {len(LATENCIES)} timings; cache hits answer in {min(t['total'] for t in LATENCIES if t['source'] == 'cache') * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from utils.search_index import SearchIndex  # noqa: E402
+
+# ------------------------------
+# Explore Cars filtering: per-click boolean masks vs. the prebuilt SearchIndex
+# ------------------------------
+
+SIZES = [3_080, 100_000, 1_000_000]
+QUERIES = [
+    ("maruti suzuki", (1989, 2025), ""),
+    ("hyundai", (2015, 2020), ""),
+    ("hyundai", (2015, 2020), "creta"),
+    ("toyota", (2010, 2025), "inn"),
+    ("bmw", (2018, 2022), "3 series"),
+]
+REPEAT = 20
+
+
+def mask_filter(df, brand, years, search_term):
+    # The original submit handler
+    title_filter = df["Title"].str.lower().str.contains(search_term.lower()) if search_term.strip() else pd.Series([True] * len(df))
+    return df[
+        (df["Brand"].str.lower() == brand) &
+        (df["Year"] >= years[0]) &
+        (df["Year"] <= years[1]) &
+        title_filter
+    ]
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    print(f"{'rows':>10} {'query':>36} {'hits':>7} {'masks':>10} {'index':>10}")
+    for n in SIZES:
+        df = typed(resample_clean(n))
+        start = time.perf_counter()
+        index = SearchIndex(df)
+        print(f"{n:>10,} {'(index build)':>36} {'':>7} {'':>10} {(time.perf_counter() - start) * 1000:>8.1f}ms")
+        for brand, years, term in QUERIES:
+            old_time, old = timed(lambda: mask_filter(df, brand, years, term), 3 if n > 100_000 else REPEAT)
+            new_time, ids = timed(lambda: index.query(brand, years, term), REPEAT)
+            assert np.array_equal(np.sort(ids), old.index.to_numpy()), (brand, years, term)
+            label = f"{brand} {years[0]}-{years[1]} '{term}'"
+            print(f"{n:>10,} {label:>36} {len(ids):>7} {old_time * 1000:>8.2f}ms {new_time * 1000:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# ------------------------------
+# Startup: time to first paint per page on a fresh server process
+# ------------------------------
+# Each page runs in its own Python process, as the first visitor after a
+# server start sees it: streamlit is imported, nothing else is, and every
+# st.cache_resource is empty. The page runs twice through AppTest:
+#   first paint - script start to the first element sent to the browser
+#   done        - script start to the end of the run
+# Each run also records which heavy modules had been imported by its first paint.
+# Warm is the second run in the same process.
+
+PAGES = [
+    "🪞 Your Garage.py",
+    "pages/🚘Explore Cars.py",
+    "pages/⚖️ Compare Cars.py",
+    "pages/🎯 Insights Hub.py",
+]
+HEAVY = ["pandas", "pyarrow", "matplotlib", "seaborn", "sklearn", "scipy", "langchain_groq"]
+TIMEOUT = 300
+
+
+def measure(page):
+    """Runs in the child process: cold and warm timings for one page."""
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    from streamlit.testing.v1 import AppTest
+
+    marks = {}
+    enqueue = ScriptRunContext.enqueue
+
+    def timed_enqueue(self, msg):
+        if "paint" not in marks and msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            marks["paint"] = time.perf_counter()
+            marks["loaded"] = [name for name in HEAVY if name in sys.modules]
+        enqueue(self, msg)
+
+    ScriptRunContext.enqueue = timed_enqueue
+    at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=TIMEOUT)
+    at.secrets["GROQ_API_KEY"] = "benchmark"
+    runs = []
+    for _ in range(2):
+        marks.clear()
+        start = time.perf_counter()
+        at.run()
+        assert not at.exception, [e.value for e in at.exception]
+        runs.append({
+            "first_paint": marks["paint"] - start,
+            "done": time.perf_counter() - start,
+            "loaded_at_paint": marks["loaded"],
+        })
+    return {"cold": runs[0], "warm": runs[1]}
+
+
+def run_page(page):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), page], cwd=ROOT, capture_output=True, text=True, timeout=TIMEOUT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    if out.returncode:
+        raise RuntimeError(f"{page} failed:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    print(f"{'page':>24} {'cold paint':>11} {'cold done':>10} {'warm paint':>11} {'warm done':>10}  imported by first paint")
+    results = {}
+    for page in PAGES:
+        result = results[page] = run_page(page)
+        cold, warm = result["cold"], result["warm"]
+        name = os.path.splitext(os.path.basename(page))[0]
+        print(f"{name:>24} {cold['first_paint'] * 1000:>9.0f}ms {cold['done'] * 1000:>8.0f}ms "
+              f"{warm['first_paint'] * 1000:>9.0f}ms {warm['done'] * 1000:>8.0f}ms  {', '.join(cold['loaded_at_paint']) or '-'}")
+
+    # The landing page paints from the summary sidecar alone
+    garage = results[PAGES[0]]["cold"]
+    assert "pandas" not in garage["loaded_at_paint"], garage
+    # Chart libraries, the LLM client and the models' libraries load on first
+    # use, after the page has painted
+    for page in PAGES[1:]:
+        loaded = results[page]["cold"]["loaded_at_paint"]
+        assert not {"matplotlib", "seaborn", "sklearn", "scipy", "langchain_groq"} & set(loaded), (page, loaded)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(json.dumps(measure(sys.argv[1])))
+    else:
+        main()
@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import load_dataset, write_dataset  # noqa: E402
+from memtools import peak_rss_mb, private_rss_mb  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+
+# ------------------------------
+# Page load: pd.read_csv of the whole file vs. memory-mapped Feather columns
+# ------------------------------
+# Each load runs in a fresh process. "peak" is the RSS high-water growth during
+# the load (mapped file pages included); "private" is the anonymous memory the
+# loaded frame keeps resident.
+
+SIZES = [3_080, 100_000, 1_000_000]
+# What the Explore page needs (everything but the model column)
+EXPLORE_COLUMNS = ['Title', 'Brand', 'Year', 'Price', 'Distance Covered', 'Location', 'Link', 'Image']
+
+
+def load_csv(csv_path, feather_path):
+    return pd.read_csv(csv_path)
+
+
+def load_feather_explore(csv_path, feather_path):
+    return load_dataset(EXPLORE_COLUMNS, path=feather_path)
+
+
+def load_feather_price(csv_path, feather_path):
+    return load_dataset(['Price'], path=feather_path)
+
+
+def measure(loader, csv_path, feather_path, queue):
+    base, base_private = peak_rss_mb(), private_rss_mb()
+    start = time.perf_counter()
+    df = loader(csv_path, feather_path)
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, peak_rss_mb() - base, private_rss_mb() - base_private, len(df)))
+
+
+def run_isolated(loader, csv_path, feather_path):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=measure, args=(loader, csv_path, feather_path, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    print(f"{'rows':>10} {'loader':>22} {'time':>9} {'peak RSS':>10} {'private':>10}")
+    for n in SIZES:
+        df = resample_clean(n)
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "olx_cars_data.csv")
+            feather_path = os.path.join(tmp, "olx_cars_data.feather")
+            df.to_csv(csv_path)
+            write_dataset(df, feather_path)
+            for loader in (load_csv, load_feather_explore, load_feather_price):
+                elapsed, peak, private, rows = run_isolated(loader, csv_path, feather_path)
+                assert rows == n
+                print(f"{n:>10,} {loader.__name__:>22} {elapsed * 1000:>7.1f}ms {peak:>7.1f} MB {private:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import numpy as np
+import requests
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import load_dataset  # noqa: E402
+from Data_Cleaning.thumbnails import ThumbnailCache, listing_images, prefetch  # noqa: E402
+from utils.listing_view import THUMB_URL, image_sources  # noqa: E402
+
+# ------------------------------
+# Listing thumbnails: OLX hotlinks vs. the local prefetched cache
+# ------------------------------
+# A stub image server stands in for OLX's CDN (fake latency, some listings
+# expired with 404, some reposts sharing the same picture). The app's cache
+# is filled by the prefetcher; "page load" is a browser fetching one page of
+# card images over 6 connections, from the stub vs. from the cache directory
+# served locally the way Streamlit's static route serves it.
+
+LATENCY = 0.1
+EXPIRED = 0.04
+REPOSTS = 0.03
+WORKERS = 16
+SEQUENTIAL_SAMPLE = 100
+PAGE_SIZE = 24
+PAGES = 20
+BROWSER_CONNECTIONS = 6
+LRU_SHARE = 0.3
+VISITS = 600
+
+
+class StubImageServer:
+    """Serves a small WebP per image id, 404 for expired ones, after `latency`."""
+
+    def __init__(self, expired=(), same_as=None, latency=LATENCY):
+        self.expired = set(expired)
+        self.same_as = same_as or {}
+        self.latency = latency
+        self.hits = 0
+        self.images = {}
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stub.hits += 1
+                time.sleep(stub.latency)
+                image_id = urlsplit(self.path).path.split("/")[3]
+                if image_id in stub.expired:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = stub.image(stub.same_as.get(image_id, image_id))
+                self.send_response(200)
+                self.send_header("Content-Type", "image/webp")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def image(self, image_id):
+        if image_id not in self.images:
+            seed = int.from_bytes(image_id.encode()[:8].ljust(8, b"\0"), "little")
+            pixels = np.random.default_rng(seed).integers(0, 255, (112, 150, 3), dtype=np.uint8)
+            buffer = io.BytesIO()
+            Image.fromarray(pixels).save(buffer, "WEBP", quality=50)
+            self.images[image_id] = buffer.getvalue()
+        return self.images[image_id]
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StaticServer:
+    """The cache directory over HTTP, standing in for Streamlit's app/static route."""
+
+    def __init__(self, directory):
+        class Handler(SimpleHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), partial(Handler, directory=directory))
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}/"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def listings(base_url):
+    """The dataset's Link/Image columns with the image URLs pointed at the stub."""
+    df = load_dataset(columns=["Link", "Image"])
+    df["Image"] = base_url + df["Image"].str.replace(r"^https?://[^/]+", "", regex=True)
+    ids = df["Image"].str.split("/").str[5].unique()
+    rng = np.random.default_rng(0)
+    expired = set(rng.choice(ids, int(len(ids) * EXPIRED), replace=False))
+    same_as = dict(zip(rng.choice(ids, int(len(ids) * REPOSTS), replace=False), rng.choice(ids, int(len(ids) * REPOSTS))))
+    return df, expired, same_as
+
+
+def load_page(urls):
+    """Wall time for a browser to fetch every image on a page."""
+    urls = [url for url in urls if url]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(BROWSER_CONNECTIONS) as pool:
+        sizes = list(pool.map(lambda url: len(requests.get(url, timeout=10).content), urls))
+    assert all(sizes)
+    return time.perf_counter() - start
+
+
+def main():
+    with StubImageServer() as stub, tempfile.TemporaryDirectory() as tmp:
+        df, stub.expired, stub.same_as = listings(stub.base_url)
+        pairs = listing_images(df)
+        cache = ThumbnailCache(path=os.path.join(tmp, "index.sqlite"), directory=os.path.join(tmp, "thumbs"))
+
+        # Prefetch: one connection vs. the thread pool
+        start = time.perf_counter()
+        prefetch(cache, pairs[:SEQUENTIAL_SAMPLE], workers=1)
+        sequential = (time.perf_counter() - start) / len(dict(pairs[:SEQUENTIAL_SAMPLE])) * len(dict(pairs))
+        start = time.perf_counter()
+        counts = prefetch(cache, pairs, workers=WORKERS)
+        pooled = time.perf_counter() - start
+        print(f"prefetch {len(pairs):,} thumbnails ({LATENCY * 1000:.0f}ms latency): "
+              f"~{sequential:.0f}s one at a time, {pooled:.1f}s on {WORKERS} threads -> {counts}")
+        statuses = cache.counts()
+        assert statuses["missing"] == len(stub.expired)
+        assert statuses["cached"] == len(dict(pairs)) - len(stub.expired)
+        # Content-addressed: reposts of the same picture share one file
+        files = os.listdir(cache.directory)
+        assert len(files) < statuses["cached"]
+        print(f"{statuses['cached']:,} listings cached in {len(files):,} files, {cache.size() / 1e6:.1f} MB")
+
+        # A re-run downloads nothing
+        hits = stub.hits
+        assert prefetch(cache, pairs)["skipped"] == len(pairs) and stub.hits == hits
+
+        # Page image load time, OLX vs. the local cache
+        with StaticServer(cache.directory) as static:
+            remote, local = [], []
+            for p in range(PAGES):
+                page = df.iloc[p * PAGE_SIZE:(p + 1) * PAGE_SIZE]
+                sources = image_sources(page, cache)
+                assert (sources.str.startswith(THUMB_URL) | (sources == "")).all()
+                remote.append(load_page([url for url, src in zip(page["Image"], sources) if src]))
+                local.append(load_page([src.replace(THUMB_URL, static.base_url) for src in sources if src]))
+        print(f"page of {PAGE_SIZE} images, median of {PAGES}: {statistics.median(remote) * 1000:.0f}ms from OLX, "
+              f"{statistics.median(local) * 1000:.0f}ms from the local cache")
+        assert statistics.median(local) < statistics.median(remote) / 5
+        print(f"hit rate browsing a fully prefetched cache: {cache.stats()['hit_rate']:.1%}")
+
+        # Size bound: LRU keeps the most viewed pages when only part fits
+        bound = int(cache.size() * LRU_SHARE)
+        small = ThumbnailCache(path=os.path.join(tmp, "small.sqlite"), directory=os.path.join(tmp, "small"),
+                               max_bytes=bound)
+        n_pages = len(df) // PAGE_SIZE
+        # Earlier pages of the listing order are viewed far more often
+        visits = np.minimum(np.random.default_rng(1).zipf(1.5, VISITS) - 1, n_pages - 1)
+        for p in visits:
+            page = df.iloc[p * PAGE_SIZE:(p + 1) * PAGE_SIZE]
+            image_sources(page, small)
+            prefetch(small, listing_images(page), workers=BROWSER_CONNECTIONS)
+            assert small.size() <= bound
+        stats = small.stats()
+        print(f"cache bounded to {LRU_SHARE:.0%} of the images: hit rate {stats['hit_rate']:.1%} over {VISITS} "
+              f"page views, {stats['evictions']:,} evictions, {stats['bytes'] / 1e6:.1f} MB kept")
+        assert stats["evictions"] > 0 and stats["hit_rate"] > 0.5
+
+
+if __name__ == "__main__":
+    main()
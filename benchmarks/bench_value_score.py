@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Data_Cleaning.store import typed  # noqa: E402
+from synthetic import resample_clean  # noqa: E402
+from utils.listing_view import sort_rows  # noqa: E402
+from utils.value_score import ValueScorer  # noqa: E402
+
+# ------------------------------
+# Value scores: full pass, incremental fold-in of a new scrape, and the
+# Explore "Best value first" sort
+# ------------------------------
+# "+1% new rows" are drawn like the rest, so they land in nearly every
+# comparable group; "+1% one model" are all one model (a brand-only
+# scrape), so only that model's groups and the year bands are rescored.
+
+SIZES = [3_080, 100_000, 1_000_000]
+NEW_SHARE = 0.01
+BUDGET = 1.0  # seconds to score 1M listings
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{'rows':>10} {'full score':>11} {'+1% new rows':>13} {'+1% one model':>14} {'rebuild':>9} "
+          f"{'best-value sort':>16}")
+    for n in SIZES:
+        df = typed(resample_clean(n + int(n * NEW_SHARE), seed=1))
+        old = df.iloc[:n]
+
+        full_time, scorer = timed(lambda: ValueScorer(old))
+        assert len(scorer) == n and 0 < scorer.scores.min() and scorer.scores.max() == 100
+        assert scorer.is_prefix_of(df) and not scorer.is_prefix_of(df.iloc[::-1].reset_index(drop=True))
+
+        extend_time, extended = timed(lambda: scorer.extend(df))
+        rebuild_time, rebuilt = timed(lambda: ValueScorer(df))
+        assert np.allclose(extended.scores, rebuilt.scores, atol=1e-3)
+        assert len(scorer) == n, "extend() must leave the old scorer untouched"
+
+        model = old["Model"].value_counts().index[5]
+        same_model = old[old["Model"] == model]
+        narrow = pd.concat([old, same_model.sample(int(n * NEW_SHARE), replace=True, random_state=0)], ignore_index=True)
+        narrow_time, narrowed = timed(lambda: scorer.extend(narrow))
+        assert np.allclose(narrowed.scores, ValueScorer(narrow).scores, atol=1e-3)
+
+        rows = np.arange(len(df))
+        sort_time, ordered = timed(lambda: sort_rows(df, rows, "Best value first", {"Value Score": rebuilt.scores}))
+        assert np.all(np.diff(rebuilt.scores[ordered]) <= 0)
+        print(f"{n:>10,} {full_time * 1000:>9.1f}ms {extend_time * 1000:>11.1f}ms {narrow_time * 1000:>12.1f}ms "
+              f"{rebuild_time * 1000:>7.1f}ms {sort_time * 1000:>14.1f}ms")
+    assert full_time < BUDGET, f"1M listings took {full_time:.2f}s"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import os
+import re
+
+from olx_pages import build_pages, load_saved_records
+
+# ------------------------------
+# Writes the checked-in corpus of saved OLX result pages (benchmarks/corpus/)
+# ------------------------------
+# One page per brand rebuilt from the raw scrape, plus a page of damaged cards
+# (missing price / image / subtitle / location) for the tolerant parser.
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+DAMAGE = [
+    r'<span class="_1zgtX"[^>]*>[^<]*</span>',
+    r'<figure>.*?</figure>',
+    r'<div class="_21gnE"[^>]*>[^<]*</div>',
+    r'<div class="_3VRSm">.*?</div>',
+]
+
+
+def main():
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    records = load_saved_records()
+    pages = build_pages(records)
+    for (brand, page), html in pages.items():
+        if page == 2:
+            with open(os.path.join(CORPUS_DIR, f"{brand.replace(' ', '_')}_p{page}.html"), "w") as f:
+                f.write(html)
+
+    damaged = pages[("hyundai", 3)]
+    cards = damaged.split('<li class="_3V_Ww"')
+    for k in range(1, len(cards)):
+        if k % 2 == 0:
+            cards[k] = re.sub(DAMAGE[(k // 2) % len(DAMAGE)], "", cards[k], count=1)
+    with open(os.path.join(CORPUS_DIR, "damaged_cards.html"), "w") as f:
+        f.write('<li class="_3V_Ww"'.join(cards))
+
+
+if __name__ == "__main__":
+    main()
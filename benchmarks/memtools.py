@@ -0,0 +1,34 @@
+import resource
+
+# ------------------------------
+# Process memory readings for the benchmarks
+# ------------------------------
+# /proc/self/status is per address space, unlike ru_maxrss which survives the
+# exec of a spawned child and so reports the parent's high-water mark.
+
+
+def _status_kb(field):
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def rss_mb():
+    kb = _status_kb("VmRSS")
+    return (kb if kb is not None else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) / 1024
+
+
+def peak_rss_mb():
+    kb = _status_kb("VmHWM")
+    return (kb if kb is not None else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) / 1024
+
+
+def private_rss_mb():
+    """Anonymous (non file-backed) resident memory; memory-mapped file pages excluded."""
+    kb = _status_kb("RssAnon")
+    return kb / 1024 if kb is not None else rss_mb()
@@ -0,0 +1,110 @@
+import html
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+# ------------------------------
+# Saved OLX result pages + a local stub server for scraper benchmarks
+# ------------------------------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAW_CSV = os.path.join(ROOT, "Data", "olx_car_listings_expanded1.csv")
+PAGE_SIZE = 40
+
+
+def render_card(row):
+    return (
+        '<li class="_3V_Ww" data-aut-id="itemBox">'
+        f'<a href="{html.escape(row["Link"].replace("https://www.olx.in", ""))}">'
+        f'<figure><img src="{html.escape(row["Image"])}" alt="{html.escape(row["Title"])}"/></figure>'
+        f'<span class="_1zgtX" data-aut-id="itemPrice">{html.escape(row["Price"])}</span>'
+        f'<div class="_21gnE" data-aut-id="itemSubTitle">{html.escape(row["Information"])}</div>'
+        f'<div class="_2Gr10" data-aut-id="itemTitle">{html.escape(row["Title"])}</div>'
+        f'<div class="_3VRSm"><span>{html.escape(row["Location"])}</span></div>'
+        '</a></li>'
+    )
+
+
+def render_page(rows):
+    cards = "".join(render_card(row) for row in rows)
+    return (
+        "<!DOCTYPE html><html><head><title>Used Cars in India | OLX</title></head><body>"
+        '<div id="container"><header><nav>OLX</nav></header>'
+        f'<ul class="_266Ly _10aCo" data-aut-id="itemsList">{cards}</ul>'
+        "<footer>OLX India</footer></div></body></html>"
+    )
+
+
+def load_saved_records(csv_path=RAW_CSV):
+    """{brand: [raw row dicts]} in scrape order."""
+    raw = pd.read_csv(csv_path, dtype=str)
+    return {brand: group.to_dict("records") for brand, group in raw.groupby("Brand", sort=False)}
+
+
+def build_pages(records_by_brand, first_page=2):
+    pages = {}
+    for brand, records in records_by_brand.items():
+        for n, start in enumerate(range(0, len(records), PAGE_SIZE)):
+            pages[(brand, first_page + n)] = render_page(records[start:start + PAGE_SIZE])
+    return pages
+
+
+def load_saved_pages(csv_path=RAW_CSV, first_page=2):
+    """{(brand, page): html} rebuilt from a raw scrape, PAGE_SIZE cards per page."""
+    return build_pages(load_saved_records(csv_path), first_page)
+
+
+class StubOLXServer:
+    """Serves saved pages at /cars_c84?filter=make_eq_<brand>&page=<n> with fake latency.
+    `errors` maps (brand, page) to the statuses to answer with, one per
+    request, before the page is served; `requests` logs (time, brand, page)."""
+
+    def __init__(self, pages, latency=0.1, errors=None):
+        self.pages = pages
+        self.latency = latency
+        self.errors = {key: list(statuses) for key, statuses in (errors or {}).items()}
+        self.hits = 0
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stub.hits += 1
+                query = parse_qs(urlsplit(self.path).query)
+                brand = query.get("filter", [""])[0].replace("make_eq_", "")
+                page = int(query.get("page", ["2"])[0])
+                stub.requests.append((time.monotonic(), brand, page))
+                time.sleep(stub.latency)
+                pending = stub.errors.get((brand, page))
+                if pending:
+                    self.send_response(pending.pop(0))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = stub.pages.get((brand, page), render_page([])).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
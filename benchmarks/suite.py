@@ -0,0 +1,279 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "scraping"))
+from Data_Cleaning.cube import (  # noqa: E402
+    build_cube, by_brand, by_brand_year, by_year, by_year_price, quantiles, top_models,
+)
+from Data_Cleaning.pipeline import clean  # noqa: E402
+from Data_Cleaning.store import load_dataset, typed, write_dataset  # noqa: E402
+from olx_pages import PAGE_SIZE, render_page  # noqa: E402
+from olx_parser import parse_listings  # noqa: E402
+from synthetic import generate_clean, generate_raw  # noqa: E402
+from utils.car_picker import CarPicker  # noqa: E402
+from utils.charts import (  # noqa: E402
+    average_price_chart, brand_counts_chart, price_year_chart, render, top_models_chart, year_counts_chart,
+)
+from utils.data_loader import Dataset, get_cube, normalise  # noqa: E402
+from utils.search_index import SearchIndex  # noqa: E402
+
+# ------------------------------
+# Benchmark suite: every page's data path at 3k, 100k and 1M listings
+# ------------------------------
+# Data comes from synthetic.generate_raw / generate_clean (fresh listings
+# with the real schema and distributions). Each case is timed on its own,
+# best of REPEAT below 1M rows; setup (generating data, building what the
+# case reads) is not timed. Results go to results/latest.json and are
+# checked against baseline.json: a case fails when it is more than
+# --threshold times its baseline and slower by more than MIN_DELTA.
+#   python benchmarks/suite.py                     (all cases and sizes)
+#   python benchmarks/suite.py --sizes 3080 --cases clean,filter.query
+#   python benchmarks/suite.py --save-baseline     (after an intended change)
+# Baselines are only comparable on the machine that recorded them.
+
+SIZES = [3_080, 100_000, 1_000_000]
+REPEAT = 3
+THRESHOLD = 1.5
+MIN_DELTA = 0.02  # seconds; below this a slowdown is timer noise
+BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS = os.path.join(BENCH_DIR, "results", "latest.json")
+PARSE_CHUNK = 1_000  # pages rendered (untimed) per timed parse batch
+SEARCHES = [
+    ("maruti suzuki", (2015, 2022), ""),
+    ("hyundai", (2010, 2025), "creta"),
+    ("toyota", (2000, 2025), "innova"),
+    ("mahindra", (2018, 2024), "xuv"),
+    ("honda", (2012, 2020), "cit"),
+    (None, None, "swift"),
+]
+PICKER_TERMS = ["", "creta", "swift dzire", "fortuner", "city", "xuv 700"]
+
+
+class Fixtures:
+    """The inputs every case needs at one size, built on first use."""
+
+    def __init__(self, n, tmp):
+        self.n = n
+        self.tmp = tmp
+        self._cache = {}
+
+    def get(self, name, build):
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    @property
+    def raw(self):
+        return self.get("raw", lambda: generate_raw(self.n, seed=1))
+
+    @property
+    def df(self):
+        return self.get("df", lambda: normalise(typed(generate_clean(self.n, seed=1))))
+
+    @property
+    def dataset(self):
+        return self.get("dataset", lambda: Dataset(df=self.df, version=f"suite-{self.n}", fingerprint=(0, 0)))
+
+    @property
+    def index(self):
+        return self.get("index", lambda: SearchIndex(self.df))
+
+    @property
+    def picker(self):
+        return self.get("picker", lambda: CarPicker(self.df, self.index))
+
+    @property
+    def dataset_path(self):
+        def build():
+            path = os.path.join(self.tmp, f"dataset_{self.n}.feather")
+            write_dataset(typed(generate_clean(self.n, seed=1)), path)
+            return path
+        return self.get("dataset_path", build)
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# ------------------------------
+# Cases: fixtures, repeat -> seconds
+# ------------------------------
+def parse_case(fx, repeat):
+    # Pages are rendered a chunk at a time so 1M rows never sit in memory as
+    # HTML; only the parser calls are timed
+    records = fx.raw.to_dict("records")
+    total = 0.0
+    step = PARSE_CHUNK * PAGE_SIZE
+    for start in range(0, len(records), step):
+        pages = [render_page(records[i:i + PAGE_SIZE]) for i in range(start, min(start + step, len(records)), PAGE_SIZE)]
+        total += timed(lambda: [parse_listings(page, "hyundai") for page in pages], repeat)
+    return total
+
+
+def clean_case(fx, repeat):
+    raw = fx.raw
+    return timed(lambda: clean(raw), repeat)
+
+
+def load_case(fx, repeat):
+    path = fx.dataset_path
+    return timed(lambda: normalise(load_dataset(path=path)), repeat)
+
+
+def filter_build_case(fx, repeat):
+    df = fx.df
+    return timed(lambda: SearchIndex(df), repeat)
+
+
+def filter_query_case(fx, repeat):
+    index = fx.index
+    return timed(lambda: [index.query(brand=b, years=y, title=t) for b, y, t in SEARCHES], repeat)
+
+
+def compare_build_case(fx, repeat):
+    df, index = fx.df, fx.index
+    return timed(lambda: CarPicker(df, index), repeat)
+
+
+def compare_lookup_case(fx, repeat):
+    picker = fx.picker
+    picker.row(picker.ids[0])  # the id hash table is built on first lookup, once per dataset
+
+    def lookup():
+        for term in PICKER_TERMS:
+            for listing_id in picker.matches(term)[:5]:
+                picker.label(listing_id)
+                picker.row(listing_id)
+    return timed(lookup, repeat)
+
+
+def insights_aggregate_case(fx, repeat):
+    df = fx.df
+
+    def aggregate():
+        cube = build_cube(df)
+        brands = by_brand(cube)
+        return quantiles(brands, [0.25, 0.75]), top_models(cube), by_year(cube), by_year_price(cube), by_brand_year(cube)
+    return timed(aggregate, repeat)
+
+
+def insights_render_case(fx, repeat):
+    dataset = fx.dataset
+    get_cube(dataset)  # built at ingest in the app
+    charts = [brand_counts_chart, average_price_chart, top_models_chart, year_counts_chart, price_year_chart]
+    return timed(lambda: [render(chart(dataset)) for chart in charts], repeat)
+
+
+CASES = {
+    "parse": parse_case,
+    "clean": clean_case,
+    "load": load_case,
+    "filter.build": filter_build_case,
+    "filter.query": filter_query_case,
+    "compare.build": compare_build_case,
+    "compare.lookup": compare_lookup_case,
+    "insights.aggregate": insights_aggregate_case,
+    "insights.render": insights_render_case,
+}
+
+
+def run(cases, sizes):
+    results = {case: {} for case in cases}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            fx = Fixtures(n, tmp)
+            repeat = 1 if n >= 1_000_000 else REPEAT
+            for case in cases:
+                seconds = CASES[case](fx, repeat)
+                results[case][str(n)] = round(seconds, 6)
+                print(f"{case:>20} {n:>10,} {seconds * 1000:>10.1f}ms", flush=True)
+            del fx
+            gc.collect()
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPU",
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=THRESHOLD, min_delta=MIN_DELTA):
+    """Rows of (case, size, seconds, baseline seconds, ratio, regressed)."""
+    rows = []
+    for case, by_size in report["results"].items():
+        for size, seconds in by_size.items():
+            base = baseline["results"].get(case, {}).get(size)
+            if base is None:
+                continue
+            ratio = seconds / base if base else float("inf")
+            rows.append((case, size, seconds, base, ratio, ratio > threshold and seconds - base > min_delta))
+    return rows
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every page's data path at several dataset sizes.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--out", default=RESULTS)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true", help="merge these results into the baseline")
+    args = parser.parse_args()
+
+    cases = args.cases.split(",")
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    report = run(cases, [int(size) for size in args.sizes.split(",")])
+    write_json(args.out, report)
+    print(f"results written to {args.out}")
+
+    if args.save_baseline:
+        baseline = {"results": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        for case, by_size in report["results"].items():
+            baseline["results"].setdefault(case, {}).update(by_size)
+        baseline.update({key: report[key] for key in ("created", "python", "machine")})
+        write_json(args.baseline, baseline)
+        print(f"baseline updated: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("no baseline to compare with; record one with --save-baseline")
+        return
+    with open(args.baseline) as f:
+        rows = compare(report, json.load(f), args.threshold)
+    print(f"\n{'case':>20} {'rows':>10} {'now':>10} {'baseline':>10} {'ratio':>6}")
+    for case, size, seconds, base, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{case:>20} {int(size):>10,} {seconds * 1000:>8.1f}ms {base * 1000:>8.1f}ms {ratio:>5.2f}x{flag}")
+    regressions = [row for row in rows if row[-1]]
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.threshold}x their baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
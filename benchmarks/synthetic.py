@@ -0,0 +1,143 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Synthetic listing generators for the benchmarks
+# ------------------------------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAW_FILES = [
+    os.path.join(ROOT, "Data", "olx_car_listings_expanded.csv"),
+    os.path.join(ROOT, "Data", "olx_car_listings_expanded1.csv"),
+]
+
+
+def resample_raw(n, seed=0):
+    """n raw scraper rows (pre-cleaning schema) drawn from the real raw files."""
+    raw = pd.concat([pd.read_csv(path) for path in RAW_FILES], ignore_index=True)
+    idx = np.random.default_rng(seed).integers(0, len(raw), n)
+    return raw.iloc[idx].reset_index(drop=True)
+
+
+def resample_clean(n, seed=0):
+    """n cleaned rows (olx_cars_data.csv schema) drawn from the real dataset."""
+    clean = pd.read_csv(os.path.join(ROOT, "Data", "olx_cars_data.csv"), index_col=0)
+    idx = np.random.default_rng(seed).integers(0, len(clean), n)
+    return clean.iloc[idx].reset_index(drop=True)
+
+
+# ------------------------------
+# Fresh listings with the real data's distributions
+# ------------------------------
+# resample_* repeat real rows verbatim, which is fine for parsing and
+# cleaning but not for anything keyed on the listing (ids, dedup, search
+# density). generate_clean draws new listings instead:
+#   Title/Brand/Model  - the real title frequencies
+#   Year               - a real year for that title, +-1
+#   Price              - per-title log price with the fitted depreciation
+#                        slope and residual spread, rounded like sellers do
+#   Distance Covered   - age x that real listing's km per year, +-10%
+#   Location           - the real localities by frequency; past the real
+#                        data's size, numbered sectors keep each locality's
+#                        share of listings about constant
+# Every row gets its own iid, link and image URL.
+
+SCRAPE_YEAR = 2026
+FIRST_IID = 1_700_000_000
+
+
+def _slug(values):
+    return values.str.lower().str.replace(r"[^a-z0-9]+", "-", regex=True).str.strip("-")
+
+
+def _profile():
+    clean = pd.read_csv(os.path.join(ROOT, "Data", "olx_cars_data.csv"), index_col=0)
+    log_price = np.log(clean["Price"])
+    title_year = clean.groupby("Title")["Year"].transform("mean")
+    offset = clean["Year"] - title_year
+    resid = log_price - log_price.groupby(clean["Title"]).transform("mean")
+    slope = (offset * resid).sum() / (offset * offset).sum()
+    return {
+        "rows": clean.reset_index(drop=True),
+        "title_log_price": log_price.groupby(clean["Title"]).mean(),
+        "title_year": clean.groupby("Title")["Year"].mean(),
+        "slope": slope,
+        "price_sd": (resid - slope * offset).std(),
+        "locations": clean["Location"].value_counts(normalize=True),
+    }
+
+
+def generate_clean(n, seed=0):
+    """n new listings in the cleaned (olx_cars_data.csv) schema."""
+    profile = _profile()
+    rng = np.random.default_rng(seed)
+    real = profile["rows"]
+    base = real.iloc[rng.integers(0, len(real), n)].reset_index(drop=True)
+
+    year = (base["Year"] + rng.integers(-1, 2, n)).clip(real["Year"].min(), SCRAPE_YEAR - 1)
+    log_price = (
+        base["Title"].map(profile["title_log_price"])
+        + profile["slope"] * (year - base["Title"].map(profile["title_year"]))
+        + rng.normal(0, profile["price_sd"], n)
+    )
+    step = np.where(rng.random(n) < 0.8, 5000, 1000)
+    price = np.maximum(np.round(np.exp(log_price) / step) * step, 10_000).astype(np.int64)
+    per_year = base["Distance Covered"] / np.maximum(SCRAPE_YEAR - base["Year"], 1)
+    distance = np.round(np.maximum(SCRAPE_YEAR - year, 1) * per_year * rng.uniform(0.9, 1.1, n) / 100) * 100
+
+    locations = profile["locations"]
+    location = pd.Series(locations.index[rng.choice(len(locations), n, p=locations.to_numpy())])
+    sectors = max(1, n // len(real))
+    if sectors > 1:
+        sector = rng.integers(0, sectors, n)
+        location = location.where(sector == 0, location + " Sector " + pd.Series(sector).astype(str))
+
+    iid = pd.Series(FIRST_IID + np.arange(n)).astype(str)
+    token = pd.Series(rng.integers(0, 36 ** 12, n)).map(lambda v: np.base_repr(v, 36).lower())
+    return pd.DataFrame({
+        "Title": base["Title"],
+        "Link": "https://www.olx.in/item/cars-c84-used-" + _slug(base["Title"]) + "-in-" + _slug(location) + "-iid-" + iid,
+        "Location": location,
+        "Price": price,
+        "Image": "https://apollo.olx.in:443/v1/files/" + token + "-IN/image;s=150x0;q=50;f=webp;",
+        "Brand": base["Brand"],
+        "Year": year.astype(np.int64),
+        "Distance Covered": distance,
+        "Model": base["Model"],
+    })
+
+
+def _rupees(values):
+    # Indian digit grouping: 1350000 -> "₹ 13,50,000"; each distinct price once
+    codes, uniques = pd.factorize(values)
+    text = []
+    for value in uniques:
+        head, tail = divmod(int(value), 1000)
+        groups = []
+        while head >= 100:
+            head, rest = divmod(head, 100)
+            groups.insert(0, f"{rest:02d}")
+        groups.insert(0, str(head))
+        text.append("₹ " + (",".join(groups) + f",{tail:03d}" if int(value) >= 1000 else str(tail)))
+    return np.array(text, dtype=object)[codes]
+
+
+POSTED = ["Today", "Yesterday", "2 days ago", "5 days ago", "12 Aug", "30 Jul", "11 Jul"]
+
+
+def generate_raw(n, seed=0):
+    """n new listings in the raw scraper schema, as the parser emits them."""
+    clean = generate_clean(n, seed)
+    rng = np.random.default_rng(seed + 1)
+    km = clean["Distance Covered"].astype(np.int64).map("{:,}".format)
+    return pd.DataFrame({
+        "Title": clean["Title"],
+        "Link": clean["Link"],
+        "Location": clean["Location"] + np.array(POSTED, dtype=object)[rng.integers(0, len(POSTED), n)],
+        "Price": _rupees(clean["Price"]),
+        "Information": clean["Year"].astype(str) + " - " + km + " km",
+        "Image": clean["Image"],
+        "Brand": clean["Brand"],
+    })
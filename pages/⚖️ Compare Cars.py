@@ -1,17 +1,23 @@
 import streamlit as st
-import pandas as pd
-import os
-from langchain_groq import ChatGroq
+from utils.comparables import get_comparables_index, show_comparables
+from utils.data_loader import get_dataset
+from utils.instrumentation import debug_panel, page_run, span
+from utils.car_picker import get_car_picker
+from utils.recommender import get_cache, get_llm, recommend_stream
+from utils.valuation import describe_delta, get_fair_prices
+from utils.value_score import describe_ranking, get_value_scorer
 
 # ------------------------------
 # Setup
 # ------------------------------
 
 API_KEY = st.secrets["GROQ_API_KEY"]
+MAX_CARS = 4
 
+page_run("Compare Cars")
 st.set_page_config(page_title="AUTO VALUER", layout="wide")
-st.markdown("### ⚖️ Compare Two Cars")
-st.write("Select two cars to compare their specifications and get a smart recommendation.")
+st.markdown("### ⚖️ Compare Cars")
+st.write("Select two or more cars to compare their specifications and get a smart recommendation.")
 with st.sidebar:
     st.markdown("### 🛠️ AUTO VALUER")
     st.markdown("**Your trusted car pricing companion.**")
@@ -20,29 +26,29 @@ with st.sidebar:
 # ------------------------------
 # Load and format data
 # ------------------------------
-mydata = pd.read_csv("Data/olx_cars_data.csv")  # Adjust path if needed
-
-def format_label(row):
-    return f"{row['Title']} | ₹{round(row['Price']/100000,2)}L | {row['Distance Covered']} KM | {row['Location']}"
-
-mydata["Label"] = mydata.apply(format_label, axis=1)
+with span("load"):
+    dataset = get_dataset()
+    picker = get_car_picker(dataset)
+    scorer = get_value_scorer(dataset)
+    fair_prices = get_fair_prices(dataset)
+    comps = get_comparables_index(dataset)
 
 # ------------------------------
 # Car Selection
 # ------------------------------
-col1, col2 = st.columns(2)
-with col1:
-    car1_label = st.selectbox("Select Car 1", mydata["Label"], key="car1")
-with col2:
-    car2_label = st.selectbox("Select Car 2", mydata["Label"], key="car2")
+n_cars = st.slider("Number of cars", min_value=2, max_value=MAX_CARS, value=2)
+car_ids = []
+for i, col in enumerate(st.columns(n_cars)):
+    with col:
+        car_ids.append(picker.select(f"Car {i + 1}", key=f"car{i + 1}"))
 
 # ------------------------------
 # Comparison Logic (on Submit)
 # ------------------------------
-if car1_label and car2_label and car1_label != car2_label:
+if all(car_ids) and len(set(car_ids)) == n_cars:
     if st.button("Compare Cars 🚀"):
-        car1 = mydata[mydata["Label"] == car1_label].iloc[0]
-        car2 = mydata[mydata["Label"] == car2_label].iloc[0]
+        cars = [picker.row(car_id) for car_id in car_ids]
+        positions = [picker.position(car_id) for car_id in car_ids]
 
         st.markdown("#### 🔍 Side-by-Side Comparison")
 
@@ -61,85 +67,74 @@ if car1_label and car2_label and car1_label != car2_label:
         </style>
         """, unsafe_allow_html=True)
 
-        def display_comparison(c1, c2):
+        def display_comparison(cars):
+            def cells(values):
+                return "".join(f"<td>{value}</td>" for value in values)
+
+            headers = "".join(f'<th style="text-align:left; padding:8px;">{c["Title"]}</th>' for c in cars)
+            fair_rows = ""
+            if fair_prices is not None:
+                fair_rows = (
+                    f"<tr><td>Fair Price (₹)</td>{cells(f'{round(fair_prices.price[p]/100000,2)}L' for p in positions)}</tr>"
+                    f"<tr><td>Deal</td>{cells(describe_delta(fair_prices.delta[p]) for p in positions)}</tr>"
+                )
+            links = cells(f'<a class="custom-link" href="{c["Link"]}" target="_blank">Visit Listing 🔗</a>' for c in cars)
             st.markdown(f"""
             <table style="width:100%; font-size:16px; border-collapse:collapse;">
                 <thead>
                     <tr style="background-color:#1A1A1A;">
                         <th style="text-align:left; padding:8px;">Attribute</th>
-                        <th style="text-align:left; padding:8px;">{c1['Title']}</th>
-                        <th style="text-align:left; padding:8px;">{c2['Title']}</th>
+                        {headers}
                     </tr>
                 </thead>
                 <tbody>
-                    <tr><td>Brand</td><td>{c1['Brand']}</td><td>{c2['Brand']}</td></tr>
-                    <tr><td>Year</td><td>{c1['Year']}</td><td>{c2['Year']}</td></tr>
-                    <tr><td>Price (₹)</td><td>{round(c1['Price']/100000,2)}L</td><td>{round(c2['Price']/100000,2)}L</td></tr>
-                    <tr><td>Distance Covered (KM)</td><td>{c1['Distance Covered']}</td><td>{c2['Distance Covered']}</td></tr>
-                    <tr><td>Location</td><td>{c1['Location']}</td><td>{c2['Location']}</td></tr>
-                    <tr><td>Link</td>
-                        <td><a class="custom-link" href="{c1['Link']}" target="_blank">Visit Listing 🔗</a></td>
-                        <td><a class="custom-link" href="{c2['Link']}" target="_blank">Visit Listing 🔗</a></td>
-                    </tr>
+                    <tr><td>Brand</td>{cells(c['Brand'] for c in cars)}</tr>
+                    <tr><td>Year</td>{cells(c['Year'] for c in cars)}</tr>
+                    <tr><td>Price (₹)</td>{cells(f"{round(c['Price']/100000,2)}L" for c in cars)}</tr>
+                    {fair_rows}
+                    <tr><td>Distance Covered (KM)</td>{cells(c['Distance Covered'] for c in cars)}</tr>
+                    <tr><td>Location</td>{cells(c['Location'] for c in cars)}</tr>
+                    <tr><td>Link</td>{links}</tr>
                 </tbody>
             </table>
             """, unsafe_allow_html=True)
 
-        display_comparison(car1, car2)
+        with span("render.table"):
+            display_comparison(cars)
 
         # ------------------------------
-        # Smart Suggestion
+        # Value Ranking
         # ------------------------------
-        st.markdown("#### 🤖 Smart Recommendation")
-
-        def query_groq_model(c1, c2):
-            llm = ChatGroq(
-                model="meta-llama/llama-4-scout-17b-16e-instruct",
-                temperature=0,
-                max_retries=2,
-                groq_api_key=API_KEY
-            )
-
-            prompt = f"""
-You are an assistant helping users compare two used cars. Be honest, helpful, and concise.
-
-Car 1:
-Title: {c1['Title']}
-Brand: {c1['Brand']}
-Year: {c1['Year']}
-Price: ₹{c1['Price']}
-Distance Covered: {c1['Distance Covered']} KM
-Location: {c1['Location']}
-
-Car 2:
-Title: {c2['Title']}
-Brand: {c2['Brand']}
-Year: {c2['Year']}
-Price: ₹{c2['Price']}
-Distance Covered: {c2['Distance Covered']} KM
-Location: {c2['Location']}
+        st.markdown("#### 🏁 Value Ranking")
+        with span("value_ranking"):
+            ranking = scorer.explain(positions)
+        titles = dataset.df["Title"]
+        st.dataframe(ranking.set_axis(titles.take(ranking.index).astype(str)).rename_axis("Car"), width="stretch")
+        verdict = describe_ranking(ranking, titles)
 
-Which car offers better value and why? 
-You have to give a final decison to choose a car.
-"""
-
-            try:
-                response = llm.invoke(prompt)
-                return response.content.strip()
-            except Exception:
-                return generate_fallback_suggestion(c1, c2)
-
-        def generate_fallback_suggestion(c1, c2):
-            price_diff = c2["Price"] - c1["Price"]
-            year_diff = c2["Year"] - c1["Year"]
-            km_diff = c2["Distance Covered"] - c1["Distance Covered"]
+        # ------------------------------
+        # Comparable Listings
+        # ------------------------------
+        st.markdown("#### 🧭 Comparable Listings")
+        for car, position in zip(cars, positions):
+            with st.expander(f"{car['Title']} ({car['Year']}, {car['Distance Covered']} KM)"):
+                with span("render.comparables"):
+                    show_comparables(dataset.df, comps, position, fair_prices)
 
-            if price_diff > 0 and km_diff > 0:
-                return f"💡 **{c1['Title']}** may offer better value with lower price and mileage."
-            elif year_diff > 0 and price_diff < 0:
-                return f"✅ **{c2['Title']}** is newer and cheaper — a strong pick."
-            else:
-                return f"🤔 Both cars have trade-offs. Prefer lower mileage? Go with **{c1['Title']}**. Want a newer model? Consider **{c2['Title']}**."
+        # ------------------------------
+        # Smart Suggestion
+        # ------------------------------
+        st.markdown("#### 🤖 Smart Recommendation")
 
-        suggestion = query_groq_model(car1, car2)
-        st.markdown(suggestion)
\ No newline at end of file
+        if n_cars == 2:
+            cache = get_cache()
+            timing = recommend_stream(list(zip(car_ids, cars)), get_llm(API_KEY), cache, st.empty().markdown, verdict)
+            source = {"cache": "Cached answer", "llm": "Live answer", "fallback": "Value score verdict"}[timing["source"]]
+            ttft = f"first text {timing['ttft']:.2f}s · " if timing["ttft"] is not None else ""
+            stats = cache.stats()
+            st.caption(f"{source} · {ttft}total {timing['total']:.2f}s · cache hits {stats['hits']}, misses {stats['misses']}")
+        else:
+            # The LLM prompt covers a pair; larger line-ups get the value score verdict
+            st.markdown(verdict)
+
+debug_panel()
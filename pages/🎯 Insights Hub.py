@@ -1,7 +1,12 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from Data_Cleaning.cube import top_models
+from utils.charts import (
+    average_price_chart, brand_counts_chart, price_year_chart, show_chart, top_models_chart, year_counts_chart,
+)
+from utils.data_loader import get_cube, get_dataset
+from utils.instrumentation import debug_panel, page_run, span
+
+page_run("Insights Hub")
 
 # ------------------------------
 # Streamlit Page Config
@@ -86,91 +91,44 @@ st.markdown(
 )
 
 # ------------------------------
-# Global Plot Styling Helper
-# ------------------------------
-def apply_dark_style(ax, fig, title="", xlabel="", ylabel=""):
-    ax.set_title(title, fontsize=18, color="#d3d0d0ff", pad=20)
-    ax.set_xlabel(xlabel, fontsize=14, color="#d3d0d0ff")
-    ax.set_ylabel(ylabel, fontsize=14, color="#d3d0d0ff")
-    ax.set_facecolor("#1A1A1A")
-    fig.patch.set_facecolor("#1A1A1A")
-    ax.tick_params(colors="#d3d0d0ff", labelsize=12)
-    ax.spines['bottom'].set_color('#d3d0d0ff')
-    ax.spines['left'].set_color('#d3d0d0ff')
-    ax.grid(axis='y', linestyle='--', alpha=0.2)
-
+# Load Aggregates
 # ------------------------------
-# Load Dataset
-# ------------------------------
-@st.cache_data
-def load_data():
-    df = pd.read_csv(".//Data/olx_cars_data.csv")
-    df.columns = df.columns.str.strip().str.replace(" ", "_")
-    df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
-    df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
-    df["Distance_Covered"] = pd.to_numeric(df["Distance_Covered"], errors="coerce")
-    df["Brand"] = df["Brand"].str.strip().str.title()
-    return df.dropna(subset=["Price", "Year", "Brand"])
-
-df = load_data()
+# Every chart reads the brand x model x year cube written at ingest and is
+# rendered once per dataset version (utils.charts); a page view only sends
+# the cached image bytes
+with span("load"):
+    dataset = get_dataset()
+    cube = get_cube(dataset)
 
 # ------------------------------
 # 1. Cars Count per Brand
 # ------------------------------
 st.markdown('<div class="chart-header">🚗 Cars Count per Brand</div>', unsafe_allow_html=True)
-brand_counts = df["Brand"].value_counts()
-colors = sns.color_palette("Set2", n_colors=len(brand_counts))
-fig, ax = plt.subplots(figsize=(20, 8))
-brand_counts.plot(kind="bar", ax=ax, color=colors, edgecolor="#d3d0d0ff")
-apply_dark_style(ax, fig, title="Number of Listings by Brand")
-st.pyplot(fig)
+show_chart(dataset, brand_counts_chart)
 
 # ------------------------------
 # 2. Average Price per Brand
 # ------------------------------
 st.markdown('<div class="chart-header">💰 Average Price per Brand</div>', unsafe_allow_html=True)
-avg_price = df.groupby("Brand")["Price"].mean() / 100000
-colors = sns.color_palette("muted", n_colors=len(avg_price))
-fig, ax = plt.subplots(figsize=(20, 8))
-avg_price.plot(kind="bar", ax=ax, color=colors, edgecolor="#d3d0d0ff")
-apply_dark_style(ax, fig, title="Average Price by Brand", ylabel="Average Price (₹ Lakhs)")
-st.pyplot(fig)
+show_chart(dataset, average_price_chart)
 
 # ------------------------------
 # 3. Top 2 Models per Brand
 # ------------------------------
 st.markdown('<div class="chart-header">🏆 Top 2 Models per Brand (Colored by Brand)</div>', unsafe_allow_html=True)
-top_models = df.groupby(["Brand", "Title"]).size().reset_index(name="Count")
-top2_per_brand = top_models.groupby("Brand").apply(lambda x: x.nlargest(2, "Count")).reset_index(drop=True)
-palette = sns.color_palette("husl", len(top2_per_brand["Brand"].unique()))
-brand_color_map = dict(zip(top2_per_brand["Brand"].unique(), palette))
-colors = top2_per_brand["Brand"].map(brand_color_map)
-fig, ax = plt.subplots(figsize=(12, max(4, len(top2_per_brand) * 0.5)))
-ax.barh(top2_per_brand["Title"], top2_per_brand["Count"], color=colors)
-
-apply_dark_style(ax, fig, title="Top 2 Models per Brand", xlabel="Count", ylabel="Model")
-st.pyplot(fig)
-st.dataframe(top2_per_brand)
+show_chart(dataset, top_models_chart, n=2)
+st.dataframe(top_models(cube, n=2))
 
 # ------------------------------
 # 4. Number of Cars Listed per Year
 # ------------------------------
 st.markdown('<div class="chart-header">📆 Number of Cars Listed per Year</div>', unsafe_allow_html=True)
-year_counts = df["Year"].value_counts().sort_index()
-colors = sns.color_palette("muted", n_colors=len(year_counts))
-fig, ax = plt.subplots(figsize=(16, 6))
-year_counts.plot(kind="bar", ax=ax, color=colors, edgecolor="#d3d0d0ff")
-apply_dark_style(ax, fig, title="Number of Listings by Year", xlabel="Year", ylabel="Number of Cars")
-st.pyplot(fig)
+show_chart(dataset, year_counts_chart)
 
 # ------------------------------
 # 5. Price vs. Year by Brand
 # ------------------------------
 st.markdown('<div class="chart-header">📍 Price vs. Year (Colored by Brand)</div>', unsafe_allow_html=True)
-fig, ax = plt.subplots(figsize=(12, 6))
-for brand in df["Brand"].unique():
-    subset = df[df["Brand"] == brand]
-    ax.scatter(subset["Year"], subset["Price"], label=brand, alpha=0.6, s=60)
-apply_dark_style(ax, fig, title="Price vs. Year by Brand", xlabel="Year", ylabel="Price (₹)")
-ax.legend(loc="upper right", fontsize="small", frameon=False)
-st.pyplot(fig)
\ No newline at end of file
+show_chart(dataset, price_year_chart)
+
+debug_panel()
@@ -1,8 +1,13 @@
 import streamlit as st
-import pandas as pd
+from utils.comparables import get_comparables_index, show_comparables
+from utils.data_loader import get_dataset
+from utils.instrumentation import debug_panel, page_run, span
+from utils.listing_view import render_results
+from utils.search_index import get_search_index
+from utils.valuation import get_fair_prices
+from utils.value_score import get_value_scorer
 
-# Load your data
-df = pd.read_csv('./Data/olx_cars_data.csv')
+page_run("Explore Cars")
 
 # Page config
 st.set_page_config(page_title="Car Listings Explorer", layout="wide")
@@ -12,11 +17,20 @@ with st.sidebar:
     st.markdown("**Your trusted car pricing companion.**")
     st.markdown("Compare, evaluate, and explore listings with clarity.\
     Built with transparency, tuned for real-world impact.")
+
+# Load your data (shared across sessions, reloaded when a new scrape lands).
+# The filters only need the dataset and its search index; the scorer, fair
+# price model and comparables load once there is a query to show.
+with span("load"):
+    dataset = get_dataset()
+    df = dataset.df
+    index = get_search_index(dataset)
+
 # --- Filters ---
 col1, col2 = st.columns(2)
 
 # Capitalize brand names for display only
-unique_brands = sorted(df['Brand'].dropna().unique())
+unique_brands = sorted(index.brands)
 display_brands = [b.capitalize() for b in unique_brands]
 
 with col1:
@@ -37,65 +51,33 @@ search_term = st.text_input("🔍 Search by Model Name", value="", help="Type pa
 submit = st.button("🚀 Show Listings")
 
 # --- Display Section ---
+# The last submitted query is kept in session state so paging and sorting
+# (which rerun the script) keep showing its results.
 if submit:
-    # Title filter: optional
-    title_filter = df["Title"].str.lower().str.contains(search_term.lower()) if search_term.strip() else pd.Series([True] * len(df))
-
-    # Apply all filters
-    filtered_df = df[
-        (df["Brand"].str.lower() == selected_brand) &
-        (df["Year"] >= selected_year[0]) &
-        (df["Year"] <= selected_year[1]) &
-        title_filter
-    ]
-
-    st.markdown(f"### 🔍 Showing {len(filtered_df)} listings for **{selected_brand_display}** ({selected_year[0]}–{selected_year[1]})")
+    st.session_state["explore_query"] = (selected_brand, selected_brand_display, selected_year, search_term)
+    st.session_state["explore_page"] = 0
 
-    for _, row in filtered_df.iterrows():
-        has_image = pd.notna(row["Image"]) and str(row["Image"]).strip() != ""
+if "explore_query" in st.session_state:
+    brand, brand_display, years, term = st.session_state["explore_query"]
+    with span("load.results"):
+        scorer = get_value_scorer(dataset)
+        fair_prices = get_fair_prices(dataset)
+        comps = get_comparables_index(dataset)
+    # Brand + year range + optional literal title search, answered from the index
+    with span("filter"):
+        rows = index.query(brand=brand, years=years, title=term)
 
-        # --- Content Block ---
-        content_block = f"""
-        <h3 style='color:#d3d0d0ff; margin-bottom:8px; font-family:Georgia, serif;'>{row['Title']}</h3>
-        <p style='color:#aba6a6ff; font-size:15px; margin:0; font-family:Georgia, serif;'>
-            📍 <strong>Location:</strong> {row['Location']} &nbsp; 📅 <strong>Year:</strong> {row['Year']}<br>
-            🚗 <strong>Distance Covered:</strong> {row['Distance Covered']} <br>💰 <strong>Price:</strong> ₹{round(row['Price']/100000,2)}L
-        </p>
-        <a href="{row['Link']}" target="_blank">
-            <button style="
-                margin-top:12px;
-                background-color:#767474ff;
-                color:#000000;
-                padding:8px 14px;
-                border:none;
-                border-radius:6px;
-                font-weight:bold;
-                cursor:pointer;
-                font-family:Georgia, serif;
-            ">
-                🔗 Visit Site
-            </button>
-        </a>
-        """
+    st.markdown(f"### 🔍 Showing {len(rows)} listings for **{brand_display}** ({years[0]}–{years[1]})")
+    page_rows = render_results(df, rows, key="explore", scores=scorer.scores, fair_prices=fair_prices)
 
-        # --- Layout with optional image ---
-        if has_image:
-            img_tag = f"<img src='{row['Image']}' style='width:180px; height:auto; border-radius:8px; border:1px solid #444;' />"
-            inner_layout = f"<div style='display:flex; gap:20px; align-items:center;'>{img_tag}<div style='flex:1;'>{content_block}</div></div>"
-        else:
-            inner_layout = f"<div>{content_block}</div>"
+    if len(page_rows):
+        with st.expander("🧭 Comparable listings"):
+            titles = comps.titles
+            position = st.selectbox(
+                "Listing on this page", page_rows,
+                format_func=lambda row: f"{titles[row]} | {df['Year'].iloc[row]} | ₹{round(df['Price'].iloc[row]/100000,2)}L",
+            )
+            with span("render.comparables"):
+                show_comparables(df, comps, position, fair_prices)
 
-        # --- Card Container ---
-        st.markdown(f"""
-        <div style='
-            background-color:#1A1A1A;
-            padding:20px;
-            margin-bottom:20px;
-            border-radius:12px;
-            box-shadow:0 0 12px rgba(255,255,255,0.05);
-            border:1px solid #2A2A2A;
-            font-family:Georgia, serif;
-        '>
-            {inner_layout}
-        </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+debug_panel()
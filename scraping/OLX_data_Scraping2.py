@@ -1,56 +1,50 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import re
-import time
+import os
+import sys
+from crawl_planner import CrawlPlanner, crawl_planned
+from incremental import SeenIndex, run_incremental
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-}
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from Data_Cleaning.pipeline import ingest, run as clean_dataset
+from Data_Cleaning.raw_store import ListingSink
+from Data_Cleaning.store import load_dataset
+from Data_Cleaning.thumbnails import ThumbnailCache, listing_images, prefetch
 
 # Expanded brand list
 brands = ['maruti suzuki', 'hyundai', 'honda', 'toyota', 'tata', 'mahindra', 'mercedes benz','ford','volkswagen','audi','nissan' ,'bmw', 'kia']
 BASE_URL = "https://www.olx.in/cars_c84?filter=make_eq_{}&page={}"
-car_data = []
-
-def extract_car_info(card):
-    title = card.find('div',{'class':'_2Gr10'}).text.strip()
-    link = "https://www.olx.in" + card.find('a')['href']
-    image = card.find('img')['src']
-    location = card.find('div', {'class': '_3VRSm'}).text.strip()
-    price = card.find('span', {"class":"_1zgtX"}).text.strip()
-    info = card.find('div',{'class':'_21gnE'}).text.strip()
-    print(info)
-    
-    return {
-        'Title': title,
-        'Link': link,
-        'Location': location,
-        'Price': price,
-        'Information': info,
-        'Image':image
-    }
-
-for brand in brands:
-    for i in range(2,7):
-        print(f"Scraping: {brand}")
-        url = BASE_URL.format(brand,i)
-        response = requests.get(url, headers=HEADERS)
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        listings = soup.find_all('li', {'class': '_3V_Ww'})
-        
-        for card in listings:
-            
-            info = extract_car_info(card)
-            info['Brand'] = brand
-            if info:
-                car_data.append(info)
-
-    time.sleep(2)
-
-df = pd.DataFrame(car_data)
-print(df.head())
-
-# Optional: Save to CSV
-df.to_csv('olx_car_listings_expanded1.csv', index=False)
\ No newline at end of file
+OUT_CSV = os.path.join(ROOT, 'Data', 'olx_car_listings_expanded1.csv')
+REQUEST_BUDGET = 120
+
+def url_for(brand, page):
+    return BASE_URL.format(brand, page)
+
+# Each brand is paged until its first empty/short page; brands with the most
+# new listings last run go first and share one global request budget.
+planner = CrawlPlanner(brands, budget=REQUEST_BUDGET, history_path=OUT_CSV + '.plan.json')
+
+# Incremental mode: append only unseen listing ids, checkpoint every page and
+# stop paging a brand once a page holds nothing new.
+if '--incremental' in sys.argv:
+    stats = run_incremental(brands, None, url_for, OUT_CSV, planner=planner)
+    print(stats)
+    print(planner.report())
+
+    # Rebuild Data/olx_cars_data.csv for the app straight away
+    clean_dataset()
+else:
+    # Rows stream to the raw listing store (Data/raw_listings) in fixed-size
+    # batches; each brand's partition is committed as the brand finishes
+    # Ids go into the incremental mode's seen index, so the planner's yield
+    # history counts only listings not scraped before
+    with ListingSink() as sink:
+        crawl_planned(brands, url_for, planner, sink=sink, seen=SeenIndex(OUT_CSV + '.seen', bootstrap_csv=OUT_CSV))
+    print(planner.report())
+    print(sink.stats)
+
+    # Clean just the partitions this crawl committed into the app's dataset
+    print(f"Added {len(ingest())} cleaned rows")
+
+# Download thumbnails for the app's local image cache; listings already
+# cached (or whose image OLX no longer has) are skipped
+print(prefetch(ThumbnailCache(), listing_images(load_dataset(columns=['Link', 'Image']))))
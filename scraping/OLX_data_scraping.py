@@ -1,55 +1,44 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import re
-import time
+import os
+import sys
+from fetch_engine import fetch_pages
+from incremental import run_incremental
+from olx_parser import parse_listings
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-}
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from Data_Cleaning.pipeline import ingest, run as clean_dataset
+from Data_Cleaning.raw_store import ListingSink
+from Data_Cleaning.store import load_dataset
+from Data_Cleaning.thumbnails import ThumbnailCache, listing_images, prefetch
 
 # Expanded brand list
 brands = ['maruti suzuki', 'hyundai', 'honda', 'toyota', 'tata', 'mahindra', 'mercedes benz','ford','volkswagen','audi','nissan' ,'bmw', 'kia']
 BASE_URL = "https://www.olx.in/cars_c84?filter=make_eq_{}"
-car_data = []
+OUT_CSV = os.path.join(ROOT, 'Data', 'olx_car_listings_expanded.csv')
 
-def extract_car_info(card):
-    title = card.find('div',{'class':'_2Gr10'}).text.strip()
-    link = "https://www.olx.in" + card.find('a')['href']
-    image = card.find('img')['src']
-    location = card.find('div', {'class': '_3VRSm'}).text.strip()
-    price = card.find('span', {"class":"_1zgtX"}).text.strip()
-    info = card.find('div',{'class':'_21gnE'}).text.strip()
-    print(info)
-    
-    return {
-        'Title': title,
-        'Link': link,
-        'Location': location,
-        'Price': price,
-        'Information': info,
-        'Image':image
-    }
+# Incremental mode: append only unseen listing ids, checkpointed per brand
+if '--incremental' in sys.argv:
+    stats = run_incremental(brands, [1], lambda brand, i: BASE_URL.format(brand), OUT_CSV)
+    print(stats)
 
-for brand in brands:
-    print(f"Scraping: {brand}")
-    url = BASE_URL.format(brand)
-    response = requests.get(url, headers=HEADERS)
-    
-    soup = BeautifulSoup(response.text, 'html.parser')
-    listings = soup.find_all('li', {'class': '_3V_Ww'})
-    
-    for card in listings:
-        
-        info = extract_car_info(card)
-        info['Brand'] = brand
-        if info:
-            car_data.append(info)
+    # Rebuild Data/olx_cars_data.csv for the app straight away
+    clean_dataset()
+else:
+    pages = fetch_pages([BASE_URL.format(brand) for brand in brands])
 
-    time.sleep(2)
+    # Each brand's rows go to the raw listing store as one committed partition
+    with ListingSink() as sink:
+        for brand, html in zip(brands, pages):
+            print(f"Scraping: {brand}")
+            if html is None:
+                continue
+            sink.write(brand, parse_listings(html, brand))
+            sink.commit(brand)
+    print(sink.stats)
 
-df = pd.DataFrame(car_data)
-print(df.head())
+    # Clean just the partitions this run committed into the app's dataset
+    print(f"Added {len(ingest())} cleaned rows")
 
-# Optional: Save to CSV
-df.to_csv('../Data/olx_car_listings_expanded.csv', index=False)
\ No newline at end of file
+# Download thumbnails for the app's local image cache; listings already
+# cached (or whose image OLX no longer has) are skipped
+print(prefetch(ThumbnailCache(), listing_images(load_dataset(columns=['Link', 'Image']))))
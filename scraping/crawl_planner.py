@@ -0,0 +1,195 @@
+import asyncio
+import json
+import os
+
+from fetch_engine import FetchEngine
+from incremental import listing_id
+from olx_parser import parse_listings
+
+# ------------------------------
+# Adaptive pagination planner
+# ------------------------------
+# Replaces the fixed range(2,7) page loop: every brand is paged until its
+# first empty or short page, brands that produced the most new listings last
+# run go first, and one global request budget is spread across brands (quota
+# a brand does not use flows back to a shared pool the others can draw on).
+
+PAGE_SIZE = 40
+
+
+class CrawlPlanner:
+    def __init__(self, brands, budget, history_path=None, first_page=2, max_pages=50, page_size=PAGE_SIZE):
+        self.brands = list(brands)
+        self.budget = budget
+        self.history_path = history_path
+        self.first_page = first_page
+        self.max_pages = max_pages
+        self.page_size = page_size
+        self.history = {}
+        if history_path and os.path.exists(history_path):
+            with open(history_path) as f:
+                self.history = json.load(f)
+        self.used = {brand: 0 for brand in self.brands}
+        self.found = {brand: 0 for brand in self.brands}
+        self.depth = {brand: 0 for brand in self.brands}
+        self.quota = self.allocate()
+        self.pool = budget - sum(self.quota.values())
+        self.active = set(self.brands)
+        self.released = None
+
+    def weight(self, brand):
+        return self.history.get(brand, {}).get("new", 0) + 1
+
+    def priorities(self):
+        return sorted(self.brands, key=self.weight, reverse=True)
+
+    def allocate(self):
+        order = self.priorities()
+        quota = {brand: 0 for brand in order}
+        if self.budget < len(order):
+            for brand in order[:self.budget]:
+                quota[brand] = 1
+            return quota
+
+        total = sum(self.weight(brand) for brand in order)
+        spare = self.budget - len(order)
+        for brand in order:
+            cap = self.max_pages
+            known_depth = self.history.get(brand, {}).get("depth")
+            if known_depth:
+                # Allow the brand to grow by one page since last run
+                cap = min(cap, known_depth + 1)
+            quota[brand] = min(cap, 1 + spare * self.weight(brand) // total)
+        return quota
+
+    def pages(self, brand):
+        return range(self.first_page, self.first_page + self.max_pages)
+
+    def unspent(self, exclude):
+        return sum(self.quota[b] - self.used[b] for b in self.active if b != exclude)
+
+    async def take(self, brand):
+        if self.released is None:
+            self.released = asyncio.Condition()
+        async with self.released:
+            while True:
+                if self.used[brand] < self.quota[brand]:
+                    self.used[brand] += 1
+                    return True
+                if self.pool > 0:
+                    self.pool -= 1
+                    self.quota[brand] += 1
+                    self.used[brand] += 1
+                    return True
+                # Brands still crawling may hand back quota they do not need
+                if not self.unspent(brand):
+                    return False
+                await self.released.wait()
+
+    def is_last_page(self, n_cards):
+        return n_cards < self.page_size
+
+    def record(self, brand, page, n_cards, n_new):
+        self.found[brand] += n_new
+        if n_cards:
+            self.depth[brand] = page - self.first_page + 1
+
+    async def finish(self, brand):
+        if self.released is None:
+            self.released = asyncio.Condition()
+        async with self.released:
+            self.active.discard(brand)
+            self.pool += self.quota[brand] - self.used[brand]
+            self.quota[brand] = self.used[brand]
+            self.released.notify_all()
+
+    def report(self):
+        requests = sum(self.used.values())
+        found = sum(self.found.values())
+        return {
+            "requests": requests,
+            "new_listings": found,
+            "requests_per_new_listing": round(requests / found, 3) if found else None,
+            "brands": {
+                brand: {"requests": self.used[brand], "new": self.found[brand], "depth": self.depth[brand]}
+                for brand in self.priorities()
+            },
+        }
+
+    def save_history(self):
+        if not self.history_path:
+            return
+        history = {
+            brand: {"new": self.found[brand], "depth": self.depth[brand] or self.history.get(brand, {}).get("depth")}
+            for brand in self.brands
+        }
+        tmp = self.history_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(history, f, indent=1)
+        os.replace(tmp, self.history_path)
+
+
+def new_ids(rows, seen, counted):
+    """Rows whose listing id is neither in `seen` (a SeenIndex, or None) nor
+    already counted this crawl; rows without an id count as new."""
+    fresh, n = [], 0
+    for row in rows:
+        iid = listing_id(row["Link"])
+        if iid is None:
+            n += 1
+        elif iid not in counted and (seen is None or iid not in seen):
+            counted.add(iid)
+            fresh.append(iid)
+    return fresh, n + len(fresh)
+
+
+async def crawl_brand(engine, planner, brand, url_for, rows_out, sink=None, seen=None, counted=None):
+    counted = set() if counted is None else counted
+    try:
+        for page in planner.pages(brand):
+            if not await planner.take(brand):
+                break
+            print(f"Scraping: {brand} page {page}")
+            html = await engine.fetch(url_for(brand, page))
+            if html is None:
+                break
+            rows = parse_listings(html, brand)
+            if sink is not None:
+                sink.write(brand, rows)
+            else:
+                rows_out.extend(rows)
+            fresh, n_new = new_ids(rows, seen, counted)
+            if seen is not None:
+                seen.add_many(fresh)
+            planner.record(brand, page, len(rows), n_new)
+            if planner.is_last_page(len(rows)):
+                break
+        if sink is not None:
+            sink.commit(brand)
+    finally:
+        # Hand unused budget back even if the brand failed, or brands
+        # waiting in take() would wait forever
+        await planner.finish(brand)
+
+
+async def _crawl_planned(brands, url_for, planner, sink=None, seen=None, **engine_kwargs):
+    results = {brand: [] for brand in brands}
+    counted = set()
+    async with FetchEngine(**engine_kwargs) as engine:
+        await asyncio.gather(*(
+            crawl_brand(engine, planner, brand, url_for, results[brand], sink, seen, counted)
+            for brand in planner.priorities()
+        ))
+    planner.save_history()
+    return [row for brand in brands for row in results[brand]]
+
+
+def crawl_planned(brands, url_for, planner, sink=None, seen=None, **engine_kwargs):
+    """Full (non-incremental) crawl with adaptive depth. Returns every parsed
+    row, or with a ListingSink streams them into it (committing each brand's
+    partition as the brand finishes) and returns an empty list.
+
+    Listings count as new for the planner's yield unless their id is in
+    `seen` (a SeenIndex, which the crawl's ids are then added to) or came up
+    earlier in the crawl."""
+    return asyncio.run(_crawl_planned(brands, url_for, planner, sink, seen, **engine_kwargs))
@@ -0,0 +1,109 @@
+import asyncio
+import random
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+
+# ------------------------------
+# Shared async fetch engine for the OLX scrapers
+# ------------------------------
+# One pooled keep-alive session, a global concurrency limit, a token-bucket
+# rate limit per host and retry with exponential backoff.
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class FetchEngine:
+    def __init__(self, concurrency=8, rate=2.0, burst=4, retries=3, backoff=1.0,
+                 timeout=20, headers=None):
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = headers or HEADERS
+        self.buckets = {}
+        self.session = None
+        self.semaphore = None
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    def bucket_for(self, url):
+        host = urlsplit(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    async def fetch(self, url):
+        bucket = self.bucket_for(url)
+        for attempt in range(self.retries + 1):
+            await bucket.acquire()
+            try:
+                async with self.semaphore:
+                    self.stats['requests'] += 1
+                    async with self.session.get(url) as response:
+                        if response.status < 400:
+                            return await response.text()
+                        error = f"HTTP {response.status}"
+                        if response.status not in RETRY_STATUSES:
+                            break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = repr(e)
+            if attempt < self.retries:
+                self.stats['retries'] += 1
+                await asyncio.sleep(self.backoff * 2 ** attempt * (0.5 + random.random()))
+
+        self.stats['failures'] += 1
+        print(f"Failed: {url} ({error})")
+        return None
+
+    async def fetch_all(self, urls):
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+
+async def _fetch_pages(urls, **kwargs):
+    async with FetchEngine(**kwargs) as engine:
+        return await engine.fetch_all(urls)
+
+
+def fetch_pages(urls, **kwargs):
+    """Fetch every url concurrently; returns page HTML in url order (None on failure)."""
+    return asyncio.run(_fetch_pages(list(urls), **kwargs))
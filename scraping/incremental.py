@@ -0,0 +1,164 @@
+import asyncio
+import json
+import os
+import re
+
+import pandas as pd
+
+from fetch_engine import FetchEngine
+from olx_parser import parse_listings
+
+# ------------------------------
+# Incremental, resumable scrape runs keyed on the OLX listing id
+# ------------------------------
+# Rows are appended to the output CSV page by page, the ids already scraped
+# live in an append-only "<out>.seen" file and finished (brand, page) pairs
+# in "<out>.checkpoint.json", so an interrupted run resumes where it stopped.
+# A brand cut short by the planner's request budget counts as finished: only
+# a failed fetch leaves a page to resume from.
+
+IID_PATTERN = re.compile(r"iid-(\d+)")
+
+
+def listing_id(link):
+    match = IID_PATTERN.search(str(link))
+    return match.group(1) if match else None
+
+
+class SeenIndex:
+    def __init__(self, path, bootstrap_csv=None):
+        self.path = path
+        self.ids = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                self.ids.update(line.strip() for line in f if line.strip())
+        elif bootstrap_csv and os.path.exists(bootstrap_csv):
+            links = pd.read_csv(bootstrap_csv, usecols=["Link"])["Link"]
+            self.add_many(filter(None, map(listing_id, links)))
+
+    def __contains__(self, iid):
+        return iid in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add_many(self, ids):
+        fresh = [iid for iid in ids if iid not in self.ids]
+        if fresh:
+            with open(self.path, "a") as f:
+                f.write("".join(f"{iid}\n" for iid in fresh))
+            self.ids.update(fresh)
+
+
+class Checkpoint:
+    def __init__(self, path):
+        self.path = path
+        self.state = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.state = json.load(f)
+
+    def last_page(self, brand):
+        return self.state.get(brand, {}).get("page")
+
+    def finished(self, brand):
+        return self.state.get(brand, {}).get("finished", False)
+
+    def mark(self, brand, page, finished=False):
+        self.state[brand] = {"page": page, "finished": finished}
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        self.state = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def append_rows(path, rows):
+    if rows:
+        pd.DataFrame(rows).to_csv(path, mode="a", header=not os.path.exists(path), index=False)
+
+
+async def crawl_brand(engine, brand, pages, url_for, out_csv, seen, checkpoint, stats, planner=None):
+    try:
+        await _crawl_brand(engine, brand, pages, url_for, out_csv, seen, checkpoint, stats, planner)
+    finally:
+        # Hand unused budget back even if the brand failed, or brands
+        # waiting in take() would wait forever
+        if planner is not None:
+            await planner.finish(brand)
+
+
+async def _crawl_brand(engine, brand, pages, url_for, out_csv, seen, checkpoint, stats, planner):
+    done = checkpoint.last_page(brand)
+    for page in pages:
+        if checkpoint.finished(brand):
+            break
+        if done is not None and page <= done:
+            stats["resumed_pages"] += 1
+            continue
+        if planner is not None and not await planner.take(brand):
+            # Out of budget is not an interruption: the brand is done for this
+            # run, and the next run pages it again from the top
+            checkpoint.mark(brand, checkpoint.last_page(brand), finished=True)
+            break
+        print(f"Scraping: {brand} page {page}")
+        html = await engine.fetch(url_for(brand, page))
+        if html is None:
+            # Leave the checkpoint where it is so the next run retries this page
+            break
+        rows = parse_listings(html, brand)
+        new_rows = []
+        for row in rows:
+            iid = listing_id(row["Link"])
+            if iid is None or iid not in seen:
+                new_rows.append(row)
+        append_rows(out_csv, new_rows)
+        seen.add_many(listing_id(row["Link"]) for row in new_rows)
+        stats["new_rows"] += len(new_rows)
+
+        # A page of nothing but known ids means the rest of the brand is old news
+        exhausted = not new_rows
+        last_page = page == pages[-1]
+        if planner is not None:
+            planner.record(brand, page, len(rows), len(new_rows))
+            last_page = last_page or planner.is_last_page(len(rows))
+        checkpoint.mark(brand, page, finished=exhausted or last_page)
+        if exhausted:
+            stats["stopped_early"].append(brand)
+        if exhausted or last_page:
+            break
+
+
+async def _run_incremental(brands, pages, url_for, out_csv, planner=None, **engine_kwargs):
+    seen = SeenIndex(out_csv + ".seen", bootstrap_csv=out_csv)
+    checkpoint = Checkpoint(out_csv + ".checkpoint.json")
+    stats = {"new_rows": 0, "resumed_pages": 0, "stopped_early": []}
+    order = planner.priorities() if planner is not None else brands
+    async with FetchEngine(**engine_kwargs) as engine:
+        await asyncio.gather(*(
+            crawl_brand(engine, brand, planner.pages(brand) if planner is not None else pages,
+                        url_for, out_csv, seen, checkpoint, stats, planner)
+            for brand in order
+        ))
+        stats["requests"] = engine.stats["requests"]
+
+    if planner is not None:
+        planner.save_history()
+    if all(checkpoint.finished(brand) for brand in brands):
+        checkpoint.clear()
+    stats["seen_ids"] = len(seen)
+    return stats
+
+
+def run_incremental(brands, pages, url_for, out_csv, planner=None, **engine_kwargs):
+    """Scrape only listings not seen before, appending them to out_csv as each page lands.
+
+    With a CrawlPlanner, page depth and request budget come from the planner
+    and `pages` is ignored.
+    """
+    pages = list(pages) if pages is not None else None
+    return asyncio.run(_run_incremental(brands, pages, url_for, out_csv, planner, **engine_kwargs))
@@ -0,0 +1,103 @@
+from collections import Counter
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # lxml is optional; fall back to the BeautifulSoup path
+    lxml_html = None
+
+# ------------------------------
+# OLX result-page parsing shared by both scrapers
+# ------------------------------
+# Two swappable backends:
+#   "bs4"  - the original BeautifulSoup/html.parser path (extract_car_info)
+#   "lxml" - one C-level parse per page and precompiled XPath selectors;
+#            a card missing a field yields None for it and bumps
+#            FIELD_ERRORS[field] instead of crashing the run.
+
+FIELD_ERRORS = Counter()
+
+def extract_car_info(card):
+    title = card.find('div',{'class':'_2Gr10'}).text.strip()
+    link = "https://www.olx.in" + card.find('a')['href']
+    image = card.find('img')['src']
+    location = card.find('div', {'class': '_3VRSm'}).text.strip()
+    price = card.find('span', {"class":"_1zgtX"}).text.strip()
+    info = card.find('div',{'class':'_21gnE'}).text.strip()
+
+    return {
+        'Title': title,
+        'Link': link,
+        'Location': location,
+        'Price': price,
+        'Information': info,
+        'Image':image
+    }
+
+def _parse_bs4(html, brand, errors):
+    soup = BeautifulSoup(html, 'html.parser')
+    listings = soup.find_all('li', {'class': '_3V_Ww'})
+
+    rows = []
+    for card in listings:
+        info = extract_car_info(card)
+        info['Brand'] = brand
+        rows.append(info)
+    return rows
+
+# ------------------------------
+# lxml fast path
+# ------------------------------
+def _has_class(tag, cls):
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+if lxml_html is not None:
+    CARDS = etree.XPath('//' + _has_class('li', '_3V_Ww'))
+    TEXT_FIELDS = [
+        ('Title', etree.XPath('.//' + _has_class('div', '_2Gr10'))),
+        ('Location', etree.XPath('.//' + _has_class('div', '_3VRSm'))),
+        ('Price', etree.XPath('.//' + _has_class('span', '_1zgtX'))),
+        ('Information', etree.XPath('.//' + _has_class('div', '_21gnE'))),
+    ]
+    LINK = etree.XPath('(.//a/@href)[1]')
+    IMAGE = etree.XPath('(.//img/@src)[1]')
+
+def _first_text(card, selector):
+    found = selector(card)
+    return found[0].text_content().strip() if found else None
+
+def _parse_lxml(html, brand, errors):
+    if not html.strip():
+        return []
+    tree = lxml_html.fromstring(html)
+
+    rows = []
+    for card in CARDS(tree):
+        texts = {field: _first_text(card, selector) for field, selector in TEXT_FIELDS}
+        href = LINK(card)
+        src = IMAGE(card)
+        row = {
+            'Title': texts['Title'],
+            'Link': "https://www.olx.in" + href[0] if href else None,
+            'Location': texts['Location'],
+            'Price': texts['Price'],
+            'Information': texts['Information'],
+            'Image': str(src[0]) if src else None,
+            'Brand': brand,
+        }
+        for field, value in row.items():
+            if value is None:
+                errors[field] += 1
+        rows.append(row)
+    return rows
+
+BACKENDS = {'bs4': _parse_bs4}
+if lxml_html is not None:
+    BACKENDS['lxml'] = _parse_lxml
+DEFAULT_BACKEND = 'lxml' if 'lxml' in BACKENDS else 'bs4'
+
+def parse_listings(html, brand, backend=None, errors=None):
+    parse = BACKENDS[backend or DEFAULT_BACKEND]
+    return parse(html, brand, FIELD_ERRORS if errors is None else errors)
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import streamlit as st
+
+from utils.search_index import get_search_index
+
+# ------------------------------
+# Id-based car picker with type-ahead (Compare Cars)
+# ------------------------------
+# Every listing gets a stable id (the OLX iid from its Link) and a display
+# label, both built once per dataset version. The picker sends only the top
+# matches for the typed text to the selectbox, returns the listing id and
+# looks the row up by id through a hash index.
+
+TOP_N = 50
+
+
+def _as_text(values):
+    # Titles, locations, prices and odometer readings repeat heavily: format
+    # each distinct value once, then gather with pyarrow
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    text = pa.array(pd.Index(uniques).astype(str), type=pa.string())
+    return text.take(pa.array(codes))
+
+
+def build_labels(df):
+    """Arrow string array of picker labels, one per row."""
+    # Rounded in whole thousands so halves go up, as round() does on the page
+    price = ((df["Price"].astype("int64") + 500) // 1000 / 100).to_numpy()
+    parts = [
+        _as_text(df["Title"]), " | ₹", _as_text(price), "L | ",
+        _as_text(df["Distance Covered"].to_numpy()), " KM | ", _as_text(df["Location"]),
+    ]
+    return pc.binary_join_element_wise(*parts, "")
+
+
+def build_ids(df):
+    # pyarrow's regex kernel runs several times faster than str.extract here
+    links = pa.array(df["Link"].astype(str), type=pa.string())
+    iid = pc.struct_field(pc.extract_regex(links, r"iid-(?P<iid>\d+)"), [0])
+    ids = iid.to_numpy(zero_copy_only=False).astype(object)
+    missing = pd.isna(ids)
+    ids[missing] = "row-" + pd.Index(np.flatnonzero(missing)).astype(str)
+    return ids
+
+
+class CarPicker:
+    def __init__(self, df, index):
+        self.df = df
+        self.index = index
+        self.ids = build_ids(df)
+        self.labels = build_labels(df)
+        self.years = df["Year"].to_numpy()
+        # Duplicate scrapes of one listing share an id; the first row stands for it
+        self.first = ~pd.Index(self.ids).duplicated()
+        self.positions = pd.Index(self.ids[self.first])
+        self.rows = np.flatnonzero(self.first)
+
+    def position(self, listing_id):
+        return self.rows[self.positions.get_loc(listing_id)]
+
+    def row(self, listing_id):
+        return self.df.iloc[self.position(listing_id)]
+
+    def label(self, listing_id):
+        return self.labels[self.position(listing_id)].as_py()
+
+    def matches(self, term, limit=TOP_N):
+        """Ids of up to `limit` listings whose title contains `term`, newest first."""
+        if term and term.strip():
+            rows = self.index.query(title=term)
+            rows = rows[self.first[rows]]
+            if len(rows) > limit:
+                rows = rows[np.argpartition(-self.years[rows], limit)[:limit]]
+            rows = rows[np.argsort(-self.years[rows], kind="stable")]
+        else:
+            rows = self.rows[:limit]
+        return list(self.ids[rows])
+
+    def select(self, label, key, limit=TOP_N):
+        term = st.text_input(f"Search {label}", key=f"{key}_search", placeholder="Type a model, e.g. Creta or Swift")
+        options = self.matches(term, limit)
+        if not options:
+            st.caption("No listings match that search.")
+            return None
+        return st.selectbox(label, options, format_func=self.label, key=key)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _build(version, _df, _index):
+    return CarPicker(_df, _index)
+
+
+def get_car_picker(dataset):
+    """CarPicker for the shared Dataset, rebuilt only when its version changes."""
+    return _build(dataset.version, dataset.df, get_search_index(dataset))
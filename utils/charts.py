@@ -0,0 +1,186 @@
+import io
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from Data_Cleaning.cube import (
+    PRICE_EDGES, by_brand, by_brand_year, by_year, by_year_price, quantiles, top_models,
+)
+from utils.data_loader import get_cube
+from utils.instrumentation import span
+
+# ------------------------------
+# Rendered chart cache for the Insights Hub
+# ------------------------------
+# Each chart is drawn once per (dataset version, chart, parameters, format)
+# and kept as PNG/SVG bytes in a process-wide LRU (st.cache_resource), so a
+# page view only sends bytes. Figures are plain matplotlib.figure.Figure
+# objects rather than pyplot ones: pyplot's figure manager keeps every figure
+# alive until plt.close(), the page never closed them and memory grew with
+# every visit. A Figure is freed as soon as it has been rendered.
+# matplotlib and seaborn (which pulls in scipy.stats) take about 2s to
+# import, so they are imported on the first draw rather than with the page:
+# the Insights header paints first and a cached chart never needs them.
+
+MAX_CHARTS = 64
+# st.pyplot renders at 200 dpi; st.image then scales anything wider than
+# MAX_WIDTH pixels back down, decoding and re-encoding it on every call.
+# Rendering at most MAX_WIDTH wide gives the same picture with no rework.
+DPI = 200
+MAX_WIDTH = 1460
+# Price vs. Year switches from points to a density grid above this many listings
+POINT_BUDGET = 10_000
+TOP_BRANDS = 8
+MIN_POINTS = 5  # listings a brand needs in a year for its median to be drawn
+TEXT = "#d3d0d0ff"
+BACKGROUND = "#1A1A1A"
+
+
+def render(fig, fmt="png"):
+    # Width of the tightly cropped image in inches (labels can stick out of
+    # the figure), plus savefig's default 0.1in padding on both sides
+    width = fig.get_tightbbox().width + 0.2
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, bbox_inches="tight", dpi=min(DPI, int(MAX_WIDTH / width)))
+    return buffer.getvalue()
+
+
+@st.cache_resource(max_entries=MAX_CHARTS, show_spinner=False)
+def _rendered(version, name, params, fmt, _draw, _dataset):
+    return render(_draw(_dataset, **dict(params)), fmt)
+
+
+def chart_image(dataset, draw, fmt="png", **params):
+    """Image bytes for draw(dataset, **params), keyed on the dataset version,
+    draw's name and the parameters."""
+    return _rendered(dataset.version, draw.__name__, tuple(sorted(params.items())), fmt, draw, dataset)
+
+
+def show_chart(dataset, draw, fmt="png", **params):
+    with span(f"render.{draw.__name__}"):
+        image = chart_image(dataset, draw, fmt, **params)
+        st.image(image.decode() if fmt == "svg" else image, width="stretch")
+
+
+# ------------------------------
+# Insights charts (drawn from the dataset's aggregate cube)
+# ------------------------------
+def _figure(figsize):
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize)
+
+
+def _palette(name, n):
+    import seaborn as sns
+    return sns.color_palette(name, n_colors=n)
+
+
+def apply_dark_style(ax, fig, title="", xlabel="", ylabel=""):
+    ax.set_title(title, fontsize=18, color=TEXT, pad=20)
+    ax.set_xlabel(xlabel, fontsize=14, color=TEXT)
+    ax.set_ylabel(ylabel, fontsize=14, color=TEXT)
+    ax.set_facecolor(BACKGROUND)
+    fig.patch.set_facecolor(BACKGROUND)
+    ax.tick_params(colors=TEXT, labelsize=12)
+    ax.spines['bottom'].set_color(TEXT)
+    ax.spines['left'].set_color(TEXT)
+    ax.grid(axis='y', linestyle='--', alpha=0.2)
+
+
+def brand_counts_chart(dataset):
+    brand_counts = by_brand(get_cube(dataset))["count"]
+    colors = _palette("Set2", len(brand_counts))
+    fig = _figure((20, 8))
+    ax = fig.subplots()
+    brand_counts.plot(kind="bar", ax=ax, color=colors, edgecolor=TEXT)
+    apply_dark_style(ax, fig, title="Number of Listings by Brand")
+    return fig
+
+
+def average_price_chart(dataset):
+    by_name = by_brand(get_cube(dataset)).sort_index()
+    avg_price = by_name["mean_price"] / 100000
+    colors = _palette("muted", len(avg_price))
+    fig = _figure((20, 8))
+    ax = fig.subplots()
+    avg_price.plot(kind="bar", ax=ax, color=colors, edgecolor=TEXT)
+    apply_dark_style(ax, fig, title="Average Price by Brand", ylabel="Average Price (₹ Lakhs)")
+    return fig
+
+
+def top_models_chart(dataset, n=2):
+    top = top_models(get_cube(dataset), n=n)
+    palette = _palette("husl", len(top["Brand"].unique()))
+    brand_color_map = dict(zip(top["Brand"].unique(), palette))
+    fig = _figure((12, max(4, len(top) * 0.5)))
+    ax = fig.subplots()
+    ax.barh(top["Title"], top["Count"], color=top["Brand"].map(brand_color_map))
+    apply_dark_style(ax, fig, title=f"Top {n} Models per Brand", xlabel="Count", ylabel="Model")
+    return fig
+
+
+def year_counts_chart(dataset):
+    year_counts = by_year(get_cube(dataset))
+    colors = _palette("muted", len(year_counts))
+    fig = _figure((16, 6))
+    ax = fig.subplots()
+    year_counts.plot(kind="bar", ax=ax, color=colors, edgecolor=TEXT)
+    apply_dark_style(ax, fig, title="Number of Listings by Year", xlabel="Year", ylabel="Number of Cars")
+    return fig
+
+
+def price_year_chart(dataset, budget=POINT_BUDGET):
+    """Every listing as a point while there are at most `budget` of them.
+    Above that, a density grid of the cube's year x price-bin counts with the
+    median price per year of the TOP_BRANDS biggest brands drawn over it, so
+    drawing costs the same at any size."""
+    fig = _figure((12, 6))
+    ax = fig.subplots()
+    if len(dataset) <= budget:
+        _price_year_points(ax, dataset.df)
+        ylabel = "Price (₹)"
+    else:
+        _price_year_density(fig, ax, get_cube(dataset))
+        ylabel = "Price (₹, log scale)"
+    apply_dark_style(ax, fig, title="Price vs. Year by Brand", xlabel="Year", ylabel=ylabel)
+    ax.legend(loc="upper right", fontsize="small", frameon=False, labelcolor=TEXT)
+    return fig
+
+
+def _price_year_points(ax, df):
+    # One scatter call for all brands; colours follow the default cycle in
+    # order of first appearance, as the per-brand loop used to
+    from matplotlib import rcParams
+
+    codes, brands = pd.factorize(df["Brand Name"])
+    cycle = [style["color"] for style in rcParams["axes.prop_cycle"]]
+    palette = np.array([cycle[i % len(cycle)] for i in range(len(brands))])
+    ax.scatter(df["Year"], df["Price"], c=palette[codes], alpha=0.6, s=60)
+    for color, brand in zip(palette, brands):
+        ax.scatter([], [], color=color, alpha=0.6, s=60, label=brand)
+
+
+def _price_year_density(fig, ax, cube):
+    from matplotlib.colors import LogNorm
+
+    grid = by_year_price(cube)
+    years = np.arange(grid.index.min(), grid.index.max() + 1)
+    counts = grid.reindex(years, fill_value=0).to_numpy()
+    occupied = np.flatnonzero(counts.sum(axis=0))
+    lo, hi = occupied[0], occupied[-1] + 1
+    mesh = ax.pcolormesh(
+        np.append(years, years[-1] + 1) - 0.5, PRICE_EDGES[lo:hi + 1], np.ma.masked_equal(counts[:, lo:hi].T, 0),
+        norm=LogNorm(), cmap="magma", alpha=0.85,
+    )
+    colorbar = fig.colorbar(mesh, ax=ax, pad=0.01)
+    colorbar.set_label("Listings", color=TEXT)
+    colorbar.ax.tick_params(colors=TEXT)
+    ax.set_yscale("log")
+
+    cells = by_brand_year(cube)
+    for brand in by_brand(cube).index[:TOP_BRANDS]:
+        rows = cells.loc[brand]
+        rows = rows[rows["count"] >= MIN_POINTS]
+        median = quantiles(rows, [0.5])[0.5]
+        ax.plot(median.index, median.to_numpy(), marker="o", markersize=4, linewidth=2, label=brand)
@@ -0,0 +1,180 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_loader import extends, row_checkpoints
+from utils.value_score import KM_PER_YEAR, LEVELS, MIN_COMPS, YEAR_BAND
+
+# ------------------------------
+# Comparable listings (k nearest neighbours within a model)
+# ------------------------------
+# One KD-tree per model and YEAR_BAND-year band over (Year, Distance Covered
+# / KM_PER_YEAR), so a year of age weighs the same as a typical year's
+# driving. The bands are the ones utils.value_score prices against: a
+# low-mileage car ten years older is not a comparable however close its
+# distance. When a model has fewer than MIN_COMPS listings in the band, the
+# brand's tree for the band is used, then the band's own. Price is returned
+# with the neighbours rather than used to find them: comps shouldn't lean
+# towards the asking price being judged. Trees are built on the first query
+# of their group, and new listings only drop the trees of the groups they
+# join.
+
+K = 10
+
+
+def _points(df):
+    return np.column_stack([
+        df["Year"].to_numpy(dtype=np.float64),
+        np.nan_to_num(df["Distance Covered"].to_numpy(dtype=np.float64)) / KM_PER_YEAR,
+    ])
+
+
+class ComparablesIndex:
+    def __init__(self, df):
+        self.points = np.empty((0, 2))
+        self.titles = np.empty(0, dtype=object)
+        self.labels = [np.empty(0, dtype=object) for _ in LEVELS]
+        self.groups = {}  # (LEVELS index, value, year band) -> row positions
+        self.trees = {}  # same keys -> tree over their points, built on first query
+        self._add(df, 0)
+        self.checkpoints = row_checkpoints(df)
+
+    def __len__(self):
+        return len(self.points)
+
+    def _add(self, df, start):
+        # Builds new arrays and dicts; never mutates the ones a reader of the
+        # previous index may hold. Trees of groups that gained rows are
+        # dropped and rebuilt on their next query.
+        new = df.iloc[start:]
+        self.points = np.concatenate([self.points, _points(new)])
+        self.titles = np.concatenate([self.titles, new["Title"].astype(str).to_numpy(dtype=object)])
+        self.groups = dict(self.groups)
+        self.trees = dict(self.trees)
+        self.labels = list(self.labels)
+        band = new["Year"].to_numpy(dtype=np.int64) // YEAR_BAND
+        positions = pd.Series(np.arange(len(new), dtype=np.int64))
+        for i, level in enumerate(LEVELS):
+            values = new[level].to_numpy(dtype=object) if level else np.full(len(new), "", dtype=object)
+            self.labels[i] = np.concatenate([self.labels[i], values])
+            for (value, key_band), rows in positions.groupby([values, band], sort=False).indices.items():
+                key = (i, value, key_band)
+                rows = rows.astype(np.int64) + start
+                self.groups[key] = np.concatenate([self.groups[key], rows]) if key in self.groups else rows
+                self.trees.pop(key, None)
+
+    def extend(self, df):
+        """Index for `df`, whose first len(self) rows are the ones already indexed."""
+        index = copy.copy(self)
+        index._add(df, len(self))
+        index.checkpoints = row_checkpoints(df)
+        return index
+
+    def _key(self, level, value, year):
+        return level, value if LEVELS[level] else "", int(year) // YEAR_BAND
+
+    def _tree(self, key):
+        from scipy.spatial import cKDTree
+
+        tree = self.trees.get(key)
+        if tree is None:
+            tree = self.trees[key] = cKDTree(self.points[self.groups[key]])
+        return tree
+
+    def _nearest(self, key, point, k, exclude):
+        rows = self.groups.get(key)
+        if rows is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        dist, idx = self._tree(key).query(point, k=min(k + (exclude is not None), len(rows)))
+        dist, found = np.atleast_1d(dist), rows[np.atleast_1d(idx)]
+        keep = found != exclude
+        return found[keep][:k], dist[keep][:k]
+
+    def query(self, values, year, distance, k=K, exclude=None):
+        """(row positions, distances, LEVELS index) of the k listings nearest to
+        (year, distance) in its YEAR_BAND-year band, closest first. `values` are
+        the listing's Model and Brand; `exclude` drops one position."""
+        point = (float(year), float(np.nan_to_num(distance)) / KM_PER_YEAR)
+        for i in range(len(LEVELS)):
+            rows, dist = self._nearest(self._key(i, values[i], year), point, k, exclude)
+            if len(rows) >= MIN_COMPS or i == len(LEVELS) - 1:
+                return rows, dist, i
+
+    def band_rows(self, position, level):
+        """Every listing in the group and YEAR_BAND-year band of `position` at
+        LEVELS[level], excluding itself: the comparables it is scored against."""
+        rows = self.groups[self._key(level, self.labels[level][position], self.points[position, 0])]
+        return rows[rows != position]
+
+    def similar_to(self, position, k=K):
+        """Comparables for the indexed listing at `position`, excluding itself."""
+        year, scaled = self.points[position]
+        values = [labels[position] for labels in self.labels]
+        return self.query(values, year, scaled * KM_PER_YEAR, k=k, exclude=position)
+
+
+def comparables_frame(df, rows, fair_prices=None):
+    """Display table for comparable listings."""
+    comps = df.take(rows)
+    table = pd.DataFrame({
+        "Title": comps["Title"].astype(str).to_numpy(),
+        "Year": comps["Year"].to_numpy(),
+        "Distance Covered (KM)": comps["Distance Covered"].to_numpy(),
+        "Price (₹ L)": (comps["Price"].to_numpy(dtype=np.float64) / 100000).round(2),
+        "Location": comps["Location"].astype(str).to_numpy(),
+        "Link": comps["Link"].astype(str).to_numpy(),
+    })
+    if fair_prices is not None:
+        table.insert(4, "vs Fair Price (%)", (fair_prices.delta[rows] * 100).round(0))
+    return table
+
+
+def show_comparables(df, index, position, fair_prices=None, k=K):
+    """Median comp price and the k nearest listings for the car at `position`."""
+    rows, _, level = index.similar_to(position, k=k)
+    if len(rows) == 0:
+        st.caption("No other listings from these years yet.")
+        return
+    prices = df["Price"].to_numpy(dtype=np.float64)
+    price = prices[position]
+    median = float(np.median(prices[rows]))
+    group = f"{df[LEVELS[level]].iloc[position]} " if LEVELS[level] else ""
+    first = int(df["Year"].iloc[position]) // YEAR_BAND * YEAR_BAND
+    caption = (f"{len(rows)} closest {group}listings from {first}–{first + YEAR_BAND - 1} by year and distance "
+               f"· median ₹{median / 100000:.2f}L")
+    # Above/below is measured as the value score measures it, against the
+    # geometric mean of the whole group, so the two never disagree
+    peers = index.band_rows(position, level)
+    if len(peers) >= MIN_COMPS:
+        reference = float(np.exp(np.mean(np.log(np.maximum(prices[peers], 1)))))
+        caption += (f" · this car is {abs(price / reference - 1) * 100:.0f}% "
+                    f"{'below' if price < reference else 'above'} the average of all {len(peers)}")
+    st.caption(caption)
+    st.dataframe(
+        comparables_frame(df, rows, fair_prices),
+        hide_index=True,
+        width="stretch",
+        column_config={"Link": st.column_config.LinkColumn("Link", display_text="Visit Listing 🔗")},
+    )
+
+
+_latest = {}
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _build(version, _df):
+    # Appended rows only drop their groups' trees (see utils.value_score)
+    previous = _latest.get("index")
+    if previous is not None and extends(_df, previous.checkpoints):
+        index = previous.extend(_df)
+    else:
+        index = ComparablesIndex(_df)
+    _latest["index"] = index
+    return index
+
+
+def get_comparables_index(dataset):
+    """ComparablesIndex for the shared Dataset, updated when its version changes."""
+    return _build(dataset.version, dataset.df)
@@ -0,0 +1,111 @@
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from Data_Cleaning.cube import CUBE_PATH, build_cube, merge_cubes, read_cube
+from Data_Cleaning.store import DATASET_PATH, load_dataset, read_meta
+
+# ------------------------------
+# Shared dataset access for every page
+# ------------------------------
+# One normalised DataFrame per process, held in st.cache_resource so all
+# sessions share the same object (cache_data would hand each caller a copy).
+# The cache key is the file fingerprint, so a fresh scrape is picked up on
+# the next rerun without restarting the server. Pages must treat the frame
+# as read-only: filter/select into new objects, never assign into it.
+
+if int(pd.__version__.split(".")[0]) < 3:
+    # Default from pandas 3; makes an accidental write in a page copy instead
+    # of mutating the shared frame
+    pd.set_option("mode.copy_on_write", True)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    df: pd.DataFrame
+    version: str
+    fingerprint: tuple
+
+    def __len__(self):
+        return len(self.df)
+
+
+def fingerprint(path=DATASET_PATH):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def row_checkpoints(df):
+    """Link and price at a spread of positions: enough to tell a dataset that
+    had rows appended from a rebuilt one without hashing every row."""
+    at = np.unique(np.linspace(0, len(df) - 1, min(len(df), 256)).astype(np.int64))
+    return len(df), at, df["Link"].take(at).tolist(), df["Price"].take(at).tolist()
+
+
+def extends(df, checkpoints):
+    """Whether df starts with the rows row_checkpoints() was taken from."""
+    n, at, links, prices = checkpoints
+    if not 0 < n <= len(df):
+        return False
+    return df["Link"].take(at).tolist() == links and df["Price"].take(at).tolist() == prices
+
+
+def normalise(df):
+    df = df.dropna(subset=["Price", "Year", "Brand"]).reset_index(drop=True)
+    for col in df.select_dtypes("category"):
+        df[col] = df[col].cat.remove_unused_categories()
+    # Display name for charts and selectors ("maruti suzuki" -> "Maruti Suzuki")
+    df["Brand Name"] = df["Brand"].map(lambda b: b.strip().title())
+    return df
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load(path, key):
+    df = normalise(load_dataset(path=path))
+    try:
+        version = read_meta(path)["version"]
+    except (FileNotFoundError, KeyError):
+        version = f"{key[0]}-{key[1]}"
+    return Dataset(df=df, version=version, fingerprint=fingerprint(path))
+
+
+def get_dataset(path=DATASET_PATH):
+    """The process-wide Dataset for the current file version."""
+    return _load(path, fingerprint(path))
+
+
+# ------------------------------
+# Insights cube
+# ------------------------------
+# Written at ingest next to the dataset (Data_Cleaning.cube). If the file on
+# disk is for another dataset version the cube is rebuilt from the frame,
+# folding in just the appended rows when the previous frame is a prefix.
+
+_latest = {}
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cube(version, _df):
+    try:
+        cube, meta = read_cube(CUBE_PATH)
+    except (FileNotFoundError, ValueError):
+        cube, meta = None, {}
+    if meta.get("dataset_version") != version:
+        previous = _latest.get("cube")
+        if previous is not None and extends(_df, previous[1]):
+            cube = merge_cubes(previous[0], build_cube(_df.iloc[previous[1][0]:]))
+        else:
+            cube = build_cube(_df)
+    _latest["cube"] = (cube, row_checkpoints(_df))
+    return cube
+
+
+def get_cube(dataset):
+    """Brand x model x year aggregate cube for the shared Dataset."""
+    return _cube(dataset.version, dataset.df)
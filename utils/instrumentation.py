@@ -0,0 +1,225 @@
+import json
+import os
+import resource
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timezone
+
+import streamlit as st
+
+# ------------------------------
+# Opt-in timing spans, rerun counts and memory snapshots for the pages
+# ------------------------------
+# A page calls page_run("Explore Cars") before its work and debug_panel()
+# at the end, and wraps its steps in `with span("filter"):`. Recording is on
+# only when the server was started with AUTO_VALUER_DEBUG=1; visitors can't
+# turn it on, since the panel shows process memory, timings and paths.
+# Then the sidebar shows the run's spans (with resident memory after each),
+# the session's rerun count and rolling percentiles over the latest WINDOW
+# runs of every span in the process. Those percentiles are
+# exported to METRICS_PATH at most every EXPORT_INTERVAL seconds. The file is
+# JSON, or Prometheus text for a .prom path.
+# When it is off, span() returns one shared no-op context manager, and
+# numpy/pandas are only imported once a panel is drawn so the landing page
+# can start without them.
+
+ENV_FLAG = "AUTO_VALUER_DEBUG"
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Data")
+METRICS_PATH = os.environ.get("AUTO_VALUER_METRICS", os.path.join(DATA_DIR, "metrics.json"))
+WINDOW = 1000  # latest durations kept per span
+PERCENTILES = [50, 90, 99]
+EXPORT_INTERVAL = 10
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NO_SPAN = _NoSpan()
+
+
+class Rolling:
+    """The latest `window` durations per span name, shared by all sessions."""
+
+    def __init__(self, window=WINDOW):
+        self.samples = defaultdict(lambda: deque(maxlen=window))
+        self.counts = Counter()
+        self.sums = Counter()
+        self.lock = threading.Lock()
+
+    def add(self, name, seconds):
+        with self.lock:
+            self.samples[name].append(seconds)
+            self.counts[name] += 1
+            self.sums[name] += seconds
+
+    def summary(self):
+        """One row per span: total count and sum, percentiles in ms over the window."""
+        import numpy as np
+        import pandas as pd
+
+        with self.lock:
+            samples = {name: np.fromiter(values, dtype=np.float64) for name, values in self.samples.items()}
+            counts, sums = dict(self.counts), dict(self.sums)
+        rows = []
+        for name in sorted(samples):
+            values = np.percentile(samples[name], PERCENTILES) * 1000
+            rows.append({"span": name, "count": counts[name], "sum_s": round(sums[name], 6),
+                         **{f"p{p}_ms": round(v, 3) for p, v in zip(PERCENTILES, values)}})
+        return pd.DataFrame(rows, columns=["span", "count", "sum_s"] + [f"p{p}_ms" for p in PERCENTILES])
+
+
+ROLLING = Rolling()
+RERUNS = Counter()  # recorded runs per page since the server started
+_local = threading.local()
+_exported = {"at": 0.0}
+
+
+class PageRun:
+    def __init__(self, page, rerun):
+        self.page = page
+        self.rerun = rerun
+        self.spans = []  # (name, depth, start offset, seconds, rss_mb after)
+        self.depth = 0
+        self.rss = rss_mb()
+        self.start = time.perf_counter()
+
+
+class Span:
+    __slots__ = ("run", "name", "depth", "start")
+
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        self.depth = self.run.depth
+        self.run.depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        self.run.depth -= 1
+        self.run.spans.append((self.name, self.depth, self.start - self.run.start, seconds, rss_mb()))
+        ROLLING.add(self.name, seconds)
+        return False
+
+
+def _requested():
+    return os.environ.get(ENV_FLAG) == "1"
+
+
+def page_run(page):
+    """Start recording this script run of `page` if instrumentation is on."""
+    if not _requested():
+        _local.run = None
+        return None
+    reruns = st.session_state.setdefault("_debug_reruns", {})
+    reruns[page] = reruns.get(page, 0) + 1
+    RERUNS[page] += 1
+    _local.run = PageRun(page, reruns[page])
+    return _local.run
+
+
+def span(name):
+    """Context manager timing one step of the current run."""
+    run = getattr(_local, "run", None)
+    return NO_SPAN if run is None else Span(run, name)
+
+
+def add_timing(name, seconds):
+    """Add a duration measured elsewhere (e.g. time to first LLM token)."""
+    run = getattr(_local, "run", None)
+    if run is not None:
+        run.spans.append((name, run.depth, time.perf_counter() - run.start - seconds, seconds, rss_mb()))
+        ROLLING.add(name, seconds)
+
+
+# ------------------------------
+# Export
+# ------------------------------
+def prometheus_text(summary, reruns, rss):
+    lines = [
+        "# HELP auto_valuer_span_seconds Rolling latency percentiles per span.",
+        "# TYPE auto_valuer_span_seconds summary",
+    ]
+    for row in summary.itertuples(index=False):
+        for p in PERCENTILES:
+            lines.append(f'auto_valuer_span_seconds{{span="{row.span}",quantile="{p / 100}"}} '
+                         f'{getattr(row, f"p{p}_ms") / 1000:.6f}')
+        lines.append(f'auto_valuer_span_seconds_count{{span="{row.span}"}} {row.count}')
+        lines.append(f'auto_valuer_span_seconds_sum{{span="{row.span}"}} {row.sum_s:.6f}')
+    lines += ["# HELP auto_valuer_reruns_total Recorded script runs per page.", "# TYPE auto_valuer_reruns_total counter"]
+    lines += [f'auto_valuer_reruns_total{{page="{page}"}} {n}' for page, n in sorted(reruns.items())]
+    lines += ["# HELP auto_valuer_resident_bytes Resident memory of the server process.",
+              "# TYPE auto_valuer_resident_bytes gauge", f"auto_valuer_resident_bytes {int(rss * 2**20)}"]
+    return "\n".join(lines) + "\n"
+
+
+def export(path=METRICS_PATH):
+    summary = ROLLING.summary()
+    rss = rss_mb()
+    if path.endswith(".prom"):
+        text = prometheus_text(summary, RERUNS, rss)
+    else:
+        text = json.dumps({
+            "updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "window": WINDOW,
+            "rss_mb": round(rss, 1),
+            "reruns": dict(RERUNS),
+            "spans": {row.pop("span"): row for row in summary.to_dict("records")},
+        }, indent=1)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+    _exported["at"] = time.monotonic()
+
+
+# ------------------------------
+# Sidebar panel
+# ------------------------------
+def debug_panel():
+    """Close the current run and show its timings in the sidebar."""
+    run = getattr(_local, "run", None)
+    if run is None:
+        return
+    _local.run = None
+    total = time.perf_counter() - run.start
+    ROLLING.add(f"page.{run.page}", total)
+    if time.monotonic() - _exported["at"] >= EXPORT_INTERVAL:
+        export()
+
+    import pandas as pd
+
+    rss = rss_mb()
+    spans = pd.DataFrame(
+        [("· " * depth + name, seconds * 1000, after)
+         for name, depth, _, seconds, after in sorted(run.spans, key=lambda s: s[2])],
+        columns=["span", "ms", "RSS MB"],
+    )
+    with st.sidebar.expander("⏱️ Debug timings", expanded=True):
+        st.caption(f"{run.page} · run {run.rerun} this session · {total * 1000:.0f} ms · "
+                   f"RSS {rss:.0f} MB ({rss - run.rss:+.1f})")
+        st.dataframe(spans.round(1), hide_index=True)
+        st.markdown("**Rolling percentiles (all sessions)**")
+        st.dataframe(ROLLING.summary().drop(columns="sum_s"), hide_index=True)
+        st.caption(f"Exported to {METRICS_PATH}")
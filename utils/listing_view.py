@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from Data_Cleaning.thumbnails import ThumbnailCache, listing_key
+from utils.instrumentation import span
+
+# ------------------------------
+# Paginated, batch-rendered listing cards (Explore Cars)
+# ------------------------------
+# A page of results is turned into HTML with column-wise string operations
+# and sent as a single st.markdown block; images load lazily in the browser,
+# from the local thumbnail cache (Data_Cleaning.thumbnails) when it has them.
+# The query, sort and page position live in st.session_state so paging
+# survives reruns.
+
+PAGE_SIZES = [12, 24, 48]
+SORTS = {
+    "Listing order": None,
+    "Price: low to high": ("Price", True),
+    "Price: high to low": ("Price", False),
+    "Year: newest first": ("Year", False),
+    "Year: oldest first": ("Year", True),
+    "Distance: lowest first": ("Distance Covered", True),
+    # Not columns: the value scores and fair prices handed to render_results
+    "Best value first": ("Value Score", False),
+    "Biggest discount first": ("Fair Price Delta", True),
+}
+
+FONT = "font-family:Georgia, serif;"
+CARD_OPEN = (
+    "<div style='background-color:#1A1A1A; padding:20px; margin-bottom:20px; border-radius:12px; "
+    "box-shadow:0 0 12px rgba(255,255,255,0.05); border:1px solid #2A2A2A; " + FONT + "'>"
+)
+THUMB_URL = "app/static/thumbs/"
+BUTTON = (
+    "<button style='margin-top:12px; background-color:#767474ff; color:#000000; padding:8px 14px; "
+    "border:none; border-radius:6px; font-weight:bold; cursor:pointer; " + FONT + "'>🔗 Visit Site</button>"
+)
+
+
+def escape(col):
+    text = col.astype(str)
+    for raw, safe in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;")):
+        text = text.str.replace(raw, safe, regex=False)
+    return text
+
+
+def fair_price_html(fair, delta, index):
+    fair = pd.Series(fair, index=index)
+    delta = pd.Series(delta, index=index)
+    direction = pd.Series(np.where(delta < 0, "below", "above"), index=index)
+    return (
+        "<br>🏷️ <strong>Fair Price:</strong> ₹" + (fair / 100000).round(2).astype(str) + "L ("
+        + (delta.abs() * 100).round().astype(int).astype(str) + "% " + direction + ")"
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_thumbnails():
+    return ThumbnailCache()
+
+
+def image_sources(page, cache):
+    """Image URL per card: the local copy if cached, nothing once the listing's
+    image is gone from OLX, else the OLX URL."""
+    image = page["Image"].astype("string").str.strip()
+    keys = [listing_key(link, url) for link, url in zip(page["Link"].astype(str), image.fillna(""))]
+    files, statuses = cache.lookup(keys)
+    local = pd.Series([files.get(k) for k in keys], index=page.index, dtype="string")
+    gone = np.array([statuses[k] == "missing" for k in keys], dtype=bool)
+    return (THUMB_URL + local).fillna(image).mask(gone, "")
+
+
+def cards_html(page, scores=None, fair=None, delta=None, images=None):
+    """One HTML string for every card on the page, built column-wise;
+    images, if given, replaces the page's Image URLs."""
+    if page.empty:
+        return ""
+    price = (page["Price"].astype("float64") / 100000).round(2).astype(str)
+    value = ""
+    if scores is not None:
+        value = " &nbsp; ⭐ <strong>Value Score:</strong> " + pd.Series(scores, index=page.index).round().astype(int).astype(str) + "/100"
+    if fair is not None:
+        value = value + fair_price_html(fair, delta, page.index)
+    content = (
+        "<h3 style='color:#d3d0d0ff; margin-bottom:8px; " + FONT + "'>" + escape(page["Title"]) + "</h3>"
+        "<p style='color:#aba6a6ff; font-size:15px; margin:0; " + FONT + "'>"
+        "📍 <strong>Location:</strong> " + escape(page["Location"])
+        + " &nbsp; 📅 <strong>Year:</strong> " + page["Year"].astype(str)
+        + "<br>🚗 <strong>Distance Covered:</strong> " + page["Distance Covered"].astype(str)
+        + " <br>💰 <strong>Price:</strong> ₹" + price + "L" + value + "</p>"
+        "<a href='" + escape(page["Link"]) + "' target='_blank'>" + BUTTON + "</a>"
+    )
+    image = page["Image"].astype("string").str.strip() if images is None else images
+    has_image = (image.notna() & (image != "")).to_numpy(dtype=bool)
+    img_tag = (
+        "<img src='" + escape(image.fillna("")) + "' loading='lazy' decoding='async' "
+        "style='width:180px; height:auto; border-radius:8px; border:1px solid #444;' />"
+    )
+    with_image = (
+        "<div style='display:flex; gap:20px; align-items:center;'>" + img_tag
+        + "<div style='flex:1;'>" + content + "</div></div>"
+    )
+    without_image = "<div>" + content + "</div>"
+    inner = np.where(has_image, with_image.to_numpy(dtype=object), without_image.to_numpy(dtype=object))
+    return "".join(CARD_OPEN + inner.astype(object) + "</div>")
+
+
+def sort_rows(df, rows, sort, extra=None):
+    """rows ordered by `sort`; extra maps non-column sort keys to per-row arrays."""
+    key = SORTS.get(sort)
+    if key is None or len(rows) == 0:
+        return np.sort(rows)
+    column, ascending = key
+    values = extra[column][rows] if extra and column in extra else df[column].to_numpy()[rows]
+    order = np.argsort(values if ascending else -values.astype(np.float64), kind="stable")
+    return rows[order]
+
+
+def render_results(df, rows, key="results", scores=None, fair_prices=None):
+    """Sort/page controls plus the current page of cards for the given row
+    ids; returns the row ids shown on this page.
+
+    scores (value scores) and fair_prices (utils.valuation.FairPrices), if
+    given, are aligned with df; each adds its sort and a line on every card.
+    """
+    state = st.session_state
+    extra = {}
+    if scores is not None:
+        extra["Value Score"] = scores
+    if fair_prices is not None:
+        extra["Fair Price Delta"] = fair_prices.delta
+    sorts = [sort for sort, by in SORTS.items() if by is None or by[0] in df or by[0] in extra]
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        sort = st.selectbox("Sort by", sorts, key=f"{key}_sort")
+    with col2:
+        page_size = st.selectbox("Per page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+
+    # A new sort or page size starts again from page one
+    view = (sort, page_size)
+    if state.get(f"{key}_view") != view:
+        state[f"{key}_view"] = view
+        state[f"{key}_page"] = 0
+
+    ordered = sort_rows(df, rows, sort, extra)
+    n_pages = max(1, -(-len(ordered) // page_size))
+    page_no = min(state.get(f"{key}_page", 0), n_pages - 1)
+
+    start = page_no * page_size
+    page_rows = ordered[start:start + page_size]
+    page = df.take(page_rows)
+    with span("render.cards"):
+        st.markdown(cards_html(
+            page,
+            scores=None if scores is None else scores[page_rows],
+            fair=None if fair_prices is None else fair_prices.price[page_rows],
+            delta=None if fair_prices is None else fair_prices.delta[page_rows],
+            images=image_sources(page, get_thumbnails()),
+        ), unsafe_allow_html=True)
+
+    prev_col, info_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        if st.button("⬅️ Previous", key=f"{key}_prev", disabled=page_no == 0):
+            state[f"{key}_page"] = page_no - 1
+            st.rerun()
+    with info_col:
+        st.markdown(f"Page **{page_no + 1}** of **{n_pages}** ({len(ordered)} listings)")
+    with next_col:
+        if st.button("Next ➡️", key=f"{key}_next", disabled=page_no >= n_pages - 1):
+            state[f"{key}_page"] = page_no + 1
+            st.rerun()
+    return page_rows
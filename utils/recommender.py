@@ -0,0 +1,157 @@
+import queue
+import threading
+import time
+from collections import deque
+
+import streamlit as st
+
+from utils.instrumentation import add_timing, span
+from utils.response_cache import ResponseCache, pair_key
+
+# ------------------------------
+# Smart Recommendation for Compare Cars
+# ------------------------------
+# One LLM client per process (st.cache_resource) and a disk-backed cache of
+# answers keyed on the unordered pair of listing ids plus a hash of the
+# prompt and model. Only real LLM answers are cached; the fallback (the
+# value-score verdict from utils.value_score) is passed in by the caller.
+#
+# recommend_stream() shows tokens as they arrive. If the first token takes
+# longer than FIRST_TOKEN_BUDGET the local fallback is shown meanwhile and
+# replaced once the LLM answer streams in.
+
+MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
+FIRST_TOKEN_BUDGET = 1.5
+TOTAL_BUDGET = 30.0
+
+# Per-request timings for this process: ttft/total in seconds, source is
+# "cache", "llm" or "fallback"
+LATENCIES = deque(maxlen=1000)
+
+
+def build_prompt(c1, c2):
+    return f"""
+You are an assistant helping users compare two used cars. Be honest, helpful, and concise.
+
+Car 1:
+Title: {c1['Title']}
+Brand: {c1['Brand']}
+Year: {c1['Year']}
+Price: ₹{c1['Price']}
+Distance Covered: {c1['Distance Covered']} KM
+Location: {c1['Location']}
+
+Car 2:
+Title: {c2['Title']}
+Brand: {c2['Brand']}
+Year: {c2['Year']}
+Price: ₹{c2['Price']}
+Distance Covered: {c2['Distance Covered']} KM
+Location: {c2['Location']}
+
+Which car offers better value and why? 
+You have to give a final decison to choose a car.
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm(api_key, model=MODEL):
+    from langchain_groq import ChatGroq
+
+    return ChatGroq(model=model, temperature=0, max_retries=2, groq_api_key=api_key)
+
+
+@st.cache_resource(show_spinner=False)
+def get_cache():
+    return ResponseCache()
+
+
+_DONE = object()
+
+
+def _produce(llm, prompt, out):
+    try:
+        for chunk in llm.stream(prompt):
+            if chunk.content:
+                out.put(chunk.content)
+    except Exception as exc:
+        out.put(exc)
+    out.put(_DONE)
+
+
+def stream_events(llm, prompt, first_token_budget=FIRST_TOKEN_BUDGET, total_budget=TOTAL_BUDGET):
+    """Yield ("token", text) as the LLM streams, ("late", None) once if the
+    first token misses its budget, then ("done", None) or ("error", exc).
+
+    The LLM runs on a daemon thread so the page thread can keep time; a
+    stream that overruns total_budget is abandoned, not cancelled.
+    """
+    out = queue.Queue()
+    threading.Thread(target=_produce, args=(llm, prompt, out), daemon=True).start()
+    start = time.perf_counter()
+    waiting_first = True
+    while True:
+        budget = first_token_budget if waiting_first else total_budget
+        try:
+            item = out.get(timeout=max(budget - (time.perf_counter() - start), 0))
+        except queue.Empty:
+            if waiting_first:
+                waiting_first = False
+                yield "late", None
+                continue
+            yield "error", TimeoutError(f"no complete answer within {total_budget}s")
+            return
+        if item is _DONE:
+            yield "done", None
+            return
+        if isinstance(item, Exception):
+            yield "error", item
+            return
+        waiting_first = False
+        yield "token", item
+
+
+def recommend_stream(cars, llm, cache, show, fallback, first_token_budget=FIRST_TOKEN_BUDGET,
+                     total_budget=TOTAL_BUDGET, model=MODEL):
+    """Render the recommendation for two (listing_id, row) pairs through
+    show(markdown), streaming it when it isn't cached; `fallback` stands in
+    while the LLM is late and replaces an answer that fails. Returns the
+    timing record also appended to LATENCIES.
+    """
+    start = time.perf_counter()
+    (id1, c1), (id2, c2) = sorted(cars, key=lambda car: str(car[0]))
+    prompt = build_prompt(c1, c2)
+    key = pair_key(id1, id2, prompt, model)
+    record = {"source": "cache", "ttft": None, "total": None, "fallback_shown": False}
+
+    text = cache.get(key)
+    if text is not None:
+        show(text)
+        record["ttft"] = time.perf_counter() - start
+    else:
+        parts = []
+        with span("llm"):
+            for kind, value in stream_events(llm, prompt, first_token_budget, total_budget):
+                if kind == "late":
+                    show(fallback)
+                    record["fallback_shown"] = True
+                elif kind == "token":
+                    if record["ttft"] is None:
+                        record["ttft"] = time.perf_counter() - start
+                        add_timing("llm.ttft", record["ttft"])
+                    parts.append(value)
+                    show("".join(parts) + " ▌")
+                elif kind == "done" and parts:
+                    text = "".join(parts).strip()
+                    cache.put(key, text)
+                    show(text)
+                    record["source"] = "llm"
+        if text is None:
+            # Failed or overran: a half-streamed answer isn't worth keeping
+            show(fallback)
+            record["source"] = "fallback"
+            record["fallback_shown"] = True
+
+    record["total"] = time.perf_counter() - start
+    LATENCIES.append(record)
+    return record
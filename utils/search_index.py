@@ -0,0 +1,154 @@
+import bisect
+import re
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# ------------------------------
+# Prebuilt search index for the Explore Cars filters
+# ------------------------------
+# Built once per dataset version:
+#   * posting lists of row ids per brand and per (brand, title), each sorted
+#     by (Year, row) with per-year offsets, so a year range is one slice
+#   * a 1-3 character n-gram inverted index over the distinct titles, plus a
+#     sorted token list for word-prefix search (titles have few distinct values)
+# A title filter resolves to title codes first; the brand/year/title
+# intersection is then the union of the matching (brand, title) slices, so no
+# per-row work happens at query time.
+# Title search is a literal, case-insensitive substring match; the user's
+# text is never treated as a regex.
+
+NGRAM = 3
+TOKEN_SPLIT = re.compile(r"[\s\-]+")
+
+
+def _grams(text, n):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class Posting:
+    """Row ids sorted by (year, row) plus the offset at which each year starts."""
+
+    def __init__(self, rows, years):
+        self.rows = rows
+        self.first_year = int(years[0]) if len(years) else 0
+        last_year = int(years[-1]) if len(years) else -1
+        self.offsets = np.searchsorted(years, np.arange(self.first_year, last_year + 2)).tolist()
+
+    def between(self, lo, hi):
+        n = len(self.offsets) - 1
+        start = self.offsets[min(max(int(lo) - self.first_year, 0), n)]
+        stop = self.offsets[min(max(int(hi) - self.first_year + 1, 0), n)]
+        return self.rows[start:stop]
+
+
+def _group_postings(keys, rows, years):
+    # Split arrays already sorted by (key, year, row) into one Posting per key
+    if not len(keys):
+        return {}
+    cuts = np.flatnonzero(np.diff(keys)) + 1
+    starts = np.concatenate(([0], cuts))
+    stops = np.concatenate((cuts, [len(keys)]))
+    return {int(keys[a]): Posting(rows[a:b], years[a:b]) for a, b in zip(starts, stops)}
+
+
+class SearchIndex:
+    def __init__(self, df):
+        row_ids = np.arange(len(df), dtype=np.int32)
+        years = df["Year"].to_numpy(dtype=np.int32)
+        brand_codes, brands = pd.factorize(df["Brand"].astype(str).str.lower())
+        title_codes, titles = pd.factorize(df["Title"].astype(str))
+        self.brands = {brand: code for code, brand in enumerate(brands)}
+        self.titles = [t.lower() for t in titles]
+
+        order = np.lexsort((row_ids, years))
+        self.everything = Posting(row_ids[order], years[order])
+
+        order = np.lexsort((row_ids, years, brand_codes))
+        self.by_brand = _group_postings(brand_codes[order], row_ids[order], years[order])
+
+        # One int64 key per (brand, title) pair
+        self.n_titles = len(titles)
+        pair = brand_codes.astype(np.int64) * self.n_titles + title_codes
+        order = np.lexsort((row_ids, years, pair))
+        self.by_pair = _group_postings(pair[order], row_ids[order], years[order])
+        self.title_pairs = {}
+        for key in self.by_pair:
+            self.title_pairs.setdefault(key % self.n_titles, []).append(key)
+
+        self.grams = {}
+        for code, title in enumerate(self.titles):
+            for n in range(1, NGRAM + 1):
+                for gram in _grams(title, n):
+                    self.grams.setdefault(gram, set()).add(code)
+        self.tokens = sorted({(token, code) for code, title in enumerate(self.titles)
+                              for token in TOKEN_SPLIT.split(title) if token})
+
+    def __len__(self):
+        return len(self.everything.rows)
+
+    # ------------------------------
+    # Title lookups (over distinct titles)
+    # ------------------------------
+    def titles_containing(self, term):
+        term = term.lower()
+        if len(term) <= NGRAM:
+            return set(self.grams.get(term, ()))
+        candidates = None
+        for gram in _grams(term, NGRAM):
+            posting = self.grams.get(gram, set())
+            candidates = posting if candidates is None else candidates & posting
+            if not candidates:
+                return set()
+        return {code for code in candidates if term in self.titles[code]}
+
+    def titles_with_prefix(self, term):
+        term = term.lower()
+        start = bisect.bisect_left(self.tokens, (term,))
+        codes = set()
+        for token, code in self.tokens[start:]:
+            if not token.startswith(term):
+                break
+            codes.add(code)
+        return codes
+
+    # ------------------------------
+    # Queries
+    # ------------------------------
+    def query(self, brand=None, years=None, title=None, prefix=False):
+        """Row ids (positions in the indexed frame) matching every given filter.
+
+        Ids are ordered by (Year, row) within each matching title.
+        """
+        lo, hi = years if years is not None else (-10**9, 10**9)
+        brand_code = None
+        if brand is not None:
+            brand_code = self.brands.get(brand.lower())
+            if brand_code is None:
+                return np.empty(0, dtype=np.int32)
+
+        if not title or not title.strip():
+            posting = self.everything if brand_code is None else self.by_brand[brand_code]
+            return posting.between(lo, hi)
+
+        term = title.strip()
+        codes = self.titles_with_prefix(term) if prefix else self.titles_containing(term)
+        if brand_code is None:
+            keys = [key for code in codes for key in self.title_pairs.get(code, ())]
+        else:
+            keys = [brand_code * self.n_titles + code for code in codes]
+        parts = [self.by_pair[key].between(lo, hi) for key in keys if key in self.by_pair]
+        if not parts:
+            return np.empty(0, dtype=np.int32)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _build(version, _df):
+    return SearchIndex(_df)
+
+
+def get_search_index(dataset):
+    """SearchIndex for the shared Dataset, rebuilt only when its version changes."""
+    return _build(dataset.version, dataset.df)
@@ -0,0 +1,60 @@
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import streamlit as st
+
+from Valuation.fair_price import MODEL_PATH, deal_delta, load_current, load_meta, predict_dataset, saved_predictions
+from utils.data_loader import fingerprint
+
+# ------------------------------
+# Fair prices for the shared dataset
+# ------------------------------
+# The trained model (python -m Valuation.fair_price) is loaded once per
+# artifact version and every listing is priced in one batch per dataset
+# version, saved to disk for the other server processes. The model itself
+# is only loaded when those saved prices are missing or stale. Pages get
+# None when no model has been trained yet, or when it was trained with
+# another scikit-learn version than the one installed.
+
+
+@dataclass(frozen=True)
+class FairPrices:
+    price: np.ndarray  # predicted fair price per row, rupees
+    delta: np.ndarray  # asking / fair - 1; negative is a deal
+    version: str
+
+
+def describe_delta(delta):
+    return f"{abs(delta) * 100:.0f}% {'below' if delta < 0 else 'above'} fair price"
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_model(path, key):
+    return load_current(path)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_meta(path, key):
+    return load_meta(path)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _predict(version, model_version, _df, path):
+    fair = saved_predictions(version, model_version, len(_df))
+    if fair is None:
+        loaded = _load_model(path, fingerprint(path))
+        if loaded is None:
+            # Trained with another scikit-learn version (logged by load_current)
+            return None
+        model, _ = loaded
+        fair = predict_dataset(model, model_version, _df, version)
+    return FairPrices(price=fair, delta=deal_delta(_df["Price"], fair), version=model_version)
+
+
+def get_fair_prices(dataset, path=MODEL_PATH):
+    """FairPrices aligned with dataset.df, or None without a usable model."""
+    if not os.path.exists(path):
+        return None
+    meta = _load_meta(path, fingerprint(path))
+    return _predict(dataset.version, meta["version"], dataset.df, path)
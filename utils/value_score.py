@@ -0,0 +1,237 @@
+import copy
+import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data_loader import extends, row_checkpoints
+
+# ------------------------------
+# Value score for every listing
+# ------------------------------
+# Three parts, each roughly in [-1, 1] with higher meaning better value:
+#   price   - log(comparable price / price). Comparables are the other
+#             listings of the same model in the same YEAR_BAND-year band;
+#             when there are fewer than MIN_COMPS of those, the same brand in
+#             the band, then the whole band.
+#   mileage - how far km driven per year of age is below KM_PER_YEAR
+#   age     - years since manufacture, MAX_AGE years scoring -1
+# The weighted sum is turned into a percentile across the dataset (0-100).
+#
+# Comparable prices come from per-group sums and counts of log price, so new
+# listings are folded in by adding their group totals, and only they and the
+# listings in the groups they joined are rescored.
+
+YEAR_BAND = 3
+MIN_COMPS = 3
+KM_PER_YEAR = 10000
+MAX_AGE = 20
+WEIGHTS = {"price": 0.6, "mileage": 0.25, "age": 0.15}
+# Past this share of rows rescored, ranks are rebuilt with one sort
+FULL_RANK_SHARE = 0.25
+# Comparable groups, most specific first; None is the year band on its own
+LEVELS = ["Model", "Brand", None]
+
+
+def _empty_stats():
+    return pd.DataFrame({"sum": pd.Series(dtype="float64"), "count": pd.Series(dtype="float64")})
+
+
+class ValueScorer:
+    def __init__(self, df, current_year=None):
+        self.current_year = current_year or datetime.date.today().year
+        self.vocab = {level: pd.Index([], dtype=object) for level in LEVELS if level}
+        self.stats = [_empty_stats() for _ in LEVELS]
+        self.keys = [np.empty(0, dtype=np.int64) for _ in LEVELS]
+        self.log_price = np.empty(0)
+        self.age = np.empty(0)
+        self.km_per_year = np.empty(0)
+        self.comps = np.empty(0)  # log comparable price per row
+        self.level = np.empty(0, dtype=np.int8)  # LEVELS index it came from (len(LEVELS): none)
+        self.raw = np.empty(0)  # weighted sum of the parts per row
+        self.sorted_raw = np.empty(0)
+        self.rank = np.empty(0, dtype=np.int64)  # rows scoring at or below each row
+        self._fold(df)
+        self.checkpoints = row_checkpoints(df)
+
+    def __len__(self):
+        return len(self.log_price)
+
+    def _codes(self, level, values):
+        # Codes stay stable as new models/brands turn up: unseen values are
+        # appended to the vocabulary. Missing values get -1.
+        values = values.astype("category")
+        categories = values.cat.categories.astype(object)
+        unseen = categories[self.vocab[level].get_indexer(categories) < 0]
+        if len(unseen):
+            self.vocab[level] = self.vocab[level].append(pd.Index(unseen, dtype=object))
+        lookup = np.append(self.vocab[level].get_indexer(categories), -1)
+        return lookup[values.cat.codes.to_numpy()]
+
+    def _fold(self, new):
+        """Add rows to the group totals, then rescore the new rows and the
+        old rows whose comparable groups they joined.
+
+        Always builds new arrays/frames rather than writing into the current
+        ones, so a scorer another session is still reading stays intact.
+        """
+        n_old = len(self)
+        log_price = np.log(np.maximum(new["Price"].to_numpy(dtype=np.float64), 1))
+        age = np.clip(self.current_year - new["Year"].to_numpy(dtype=np.float64), 0, None)
+        band = (new["Year"].to_numpy(dtype=np.int64) // YEAR_BAND).astype(np.int64)
+
+        stats, keys = [], []
+        affected = np.zeros(n_old, dtype=bool)
+        for i, level in enumerate(LEVELS):
+            if level is None:
+                key = band
+            else:
+                codes = self._codes(level, new[level])
+                key = np.where(codes >= 0, codes.astype(np.int64) * 1000 + band, -1)
+            totals = pd.DataFrame({"sum": log_price, "count": 1.0}).groupby(key).sum()
+            totals = totals.drop(index=-1, errors="ignore")
+            stats.append(self.stats[i].add(totals, fill_value=0))
+            keys.append(np.concatenate([self.keys[i], key]))
+            # Counts only grow, so a row's comparables change only if a group
+            # that gained listings is the one it uses or a more specific one
+            affected |= (self.level >= i) & np.isin(self.keys[i], totals.index.to_numpy())
+        self.stats, self.keys = stats, keys
+
+        self.log_price = np.concatenate([self.log_price, log_price])
+        self.age = np.concatenate([self.age, age])
+        distance = new["Distance Covered"].to_numpy(dtype=np.float64)
+        self.km_per_year = np.concatenate([self.km_per_year, distance / (age + 1)])
+        self._score(np.concatenate([np.flatnonzero(affected), np.arange(n_old, len(self))]))
+
+    def _raw(self, rows):
+        # Leave-one-out mean log price of the comparable group
+        comps = np.full(len(rows), np.nan)
+        level = np.full(len(rows), len(LEVELS), dtype=np.int8)
+        log_price = self.log_price[rows]
+        for i, (stats, key) in enumerate(zip(self.stats, self.keys)):
+            group = stats.reindex(key[rows])
+            count = group["count"].to_numpy() - 1
+            total = group["sum"].to_numpy() - log_price
+            take = np.isnan(comps) & (count >= MIN_COMPS)
+            comps[take] = total[take] / count[take]
+            level[take] = i
+        comps = np.where(np.isnan(comps), log_price, comps)
+
+        parts = {
+            "price": np.clip(comps - log_price, -1, 1),
+            "mileage": np.clip(1 - np.nan_to_num(self.km_per_year[rows], nan=KM_PER_YEAR) / KM_PER_YEAR, -1, 1),
+            "age": -np.minimum(self.age[rows], MAX_AGE) / MAX_AGE,
+        }
+        raw = sum(parts[part] * weight for part, weight in WEIGHTS.items())
+        # Equal listings must tie whatever order their group sums were added in
+        return comps, level, np.round(raw, 9)
+
+    def _score(self, rows):
+        """Rescore `rows` (every row past the old length must be in it).
+
+        A score is the share of listings scoring at or below this one, so
+        every score moves when rows are added. Unless more than
+        FULL_RANK_SHARE of the rows changed, the counts behind them are
+        updated from the changed values alone instead of re-sorting the
+        whole dataset.
+        """
+        n_old = len(self.rank)
+        comps, level, raw = self._raw(rows)
+        self.comps = np.append(self.comps, np.zeros(len(self) - n_old))
+        self.comps[rows] = comps
+        self.level = np.append(self.level, np.zeros(len(self) - n_old, dtype=np.int8))
+        self.level[rows] = level
+        old_raw = self.raw
+        self.raw = np.append(self.raw, np.zeros(len(self) - n_old))
+        self.raw[rows] = raw
+
+        if len(rows) > len(self) * FULL_RANK_SHARE:
+            # Most rows changed: one sort beats a binary search per row
+            order = np.argsort(self.raw, kind="stable")
+            self.sorted_raw = self.raw[order]
+            self.rank = np.empty(len(self), dtype=np.int64)
+            self.rank[order] = np.searchsorted(self.sorted_raw, self.sorted_raw, side="right")
+            self.scores = (self.rank / len(self) * 100).astype(np.float32)
+            return
+
+        old = rows[rows < n_old]
+        removed = np.sort(old_raw[old])
+        inserted = np.sort(raw)
+
+        # A row that was not rescored kept its value x and its old rank r
+        # (sorted_raw[r - 1] == x), so it moves by the changed values at or
+        # below x, counted once along the sorted values
+        shift = (np.searchsorted(inserted, self.sorted_raw, side="right")
+                 - np.searchsorted(removed, self.sorted_raw, side="right"))
+        rank = np.append(self.rank + shift[self.rank - 1], np.zeros(len(self) - n_old, dtype=np.int64))
+
+        # Sorted raw scores of every row: drop the rescored rows' old values
+        # (the j-th copy of a repeated value sits j places after the first)
+        # and merge in their new ones
+        repeat = np.arange(len(removed)) - np.searchsorted(removed, removed, side="left")
+        kept = np.delete(self.sorted_raw, np.searchsorted(self.sorted_raw, removed, side="left") + repeat)
+        self.sorted_raw = np.insert(kept, np.searchsorted(kept, inserted, side="right"), inserted)
+        rank[rows] = np.searchsorted(self.sorted_raw, raw, side="right")
+        self.rank = rank
+        self.scores = (self.rank / len(self) * 100).astype(np.float32)
+
+    def extend(self, df):
+        """Scorer for `df`, whose first len(self) rows are the ones already scored."""
+        scorer = copy.copy(self)
+        scorer.vocab = dict(self.vocab)
+        scorer._fold(df.iloc[len(self):])
+        scorer.checkpoints = row_checkpoints(df)
+        return scorer
+
+    def is_prefix_of(self, df):
+        return extends(df, self.checkpoints)
+
+    def explain(self, rows):
+        """Score breakdown for the given row positions, best value first."""
+        rows = np.asarray(rows)
+        table = pd.DataFrame({
+            "Value Score": self.scores[rows].astype(np.float64).round(1),
+            "Price vs Similar (%)": ((np.exp(self.log_price[rows] - self.comps[rows]) - 1) * 100).round(1),
+            "Km per Year": self.km_per_year[rows].round(0),
+            "Age (years)": self.age[rows].astype(int),
+        }, index=rows)
+        return table.sort_values("Value Score", ascending=False, kind="stable")
+
+
+def describe_ranking(ranking, titles):
+    """Plain-language verdict for an explain() table; titles maps row -> title."""
+    best = ranking.index[0]
+    row = ranking.loc[best]
+    delta = row["Price vs Similar (%)"]
+    price_note = f"{abs(delta):.0f}% {'below' if delta < 0 else 'above'} similar listings"
+    age = int(row["Age (years)"])
+    text = (
+        f"💡 **{titles[best]}** offers the best value (score {row['Value Score']:.0f}/100): "
+        f"priced {price_note}, {row['Km per Year']:,.0f} km per year, {age} year{'' if age == 1 else 's'} old."
+    )
+    if len(ranking) > 1:
+        runner_up = ranking.index[1]
+        text += f" Next best is **{titles[runner_up]}** ({ranking.loc[runner_up, 'Value Score']:.0f}/100)."
+    return text
+
+
+_latest = {}
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _build(version, _df):
+    # A fresh scrape appends rows to the cleaned dataset; when the new frame
+    # starts with the rows already scored only the new ones are folded in
+    previous = _latest.get("scorer")
+    if previous is not None and previous.is_prefix_of(_df):
+        scorer = previous.extend(_df)
+    else:
+        scorer = ValueScorer(_df)
+    _latest["scorer"] = scorer
+    return scorer
+
+
+def get_value_scorer(dataset):
+    """ValueScorer for the shared Dataset, updated when its version changes."""
+    return _build(dataset.version, dataset.df)
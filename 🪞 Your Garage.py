@@ -1,6 +1,9 @@
 import streamlit as st
-import pandas as pd
 import urllib
+from Data_Cleaning.summary import read_summary
+from utils.instrumentation import debug_panel, page_run, span
+
+page_run("Your Garage")
 # ------------------------------
 # App Config
 # ------------------------------
@@ -161,19 +164,22 @@ with st.sidebar:
 # ------------------------------
 # Hero Image Section (Below Title)
 # ------------------------------
-st.image(".//assets/hero_image.png")
+# Served by Streamlit's static file handler (1460px WebP):
+# the browser caches it instead of the script re-sending the image every run
+st.markdown('<img src="app/static/hero_image.webp" alt="" style="width:100%">', unsafe_allow_html=True)
 
 # ------------------------------
-# Quick Stats (dummy placeholders)
+# Quick Stats (from the dataset's summary sidecar, written at ingest)
 # ------------------------------
-data = pd.read_csv("./Data/olx_cars_data.csv")
-min_price = min(data['Price'])/100000
-max_price = max(data['Price'])/100000
+with span("load"):
+    summary = read_summary()
+min_price = summary['price_min']/100000
+max_price = summary['price_max']/100000
 col1, col2, col3 = st.columns(3)
 with col1:
-    st.metric("Cars Scraped", "3000+")
+    st.metric("Cars Scraped", f"{summary['rows']:,}")
 with col2:
-    st.metric("Brands Covered", "15+")
+    st.metric("Brands Covered", summary["brands"])
 with col3:
     st.metric("Avg Price Range", f"₹{round(min_price,2)}L – ₹{round(max_price,2)}L")
 
@@ -259,3 +265,5 @@ st.markdown(
     """,
     unsafe_allow_html=True
 )
+
+debug_panel()